@@ -0,0 +1,285 @@
+from asyncio import gather, sleep
+from collections.abc import AsyncIterator, Iterable
+from heapq import heappop, heappush
+from time import monotonic
+from typing import Any, Final
+
+from httpx import Response
+from typing_extensions import Self
+
+from ._types import (
+    ErrorMessage,
+    GitHubEvent,
+    GitHubEventJSON,
+    GitHubPortal,
+    ReturnMode,
+    needs_authentication,
+)
+from .base import LOGGER
+from .scheduling import Priority
+
+EVENT_SOURCES: Final[tuple[str, ...]] = ("repos/", "orgs/", "users/")
+"""
+The feed paths `watch` accepts, e.g. "repos/LEGO/lego", "orgs/LEGO" or "users/octocat".
+"""
+
+DEFAULT_POLL_INTERVAL: Final[float] = 60.0
+"""
+Seconds between polls of a feed until GitHub sends `X-Poll-Interval`.
+"""
+
+FEED_PAGES: Final[int] = 3
+"""
+GitHub serves at most 300 events per feed, three pages of 100.
+"""
+
+
+class _Feed:
+    """
+    Polling state for one feed.
+    """
+
+    __slots__ = ("path", "etag", "interval", "seen", "primed")
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.etag: str | None = None
+        self.interval = DEFAULT_POLL_INTERVAL
+        self.seen: dict[str, None] = {}
+        self.primed = False
+
+    def remember(self, event_id: str) -> bool:
+        """
+        Record an event id, returning False if it was already seen.
+        Only the most recent ids are kept, as many as a feed can hold.
+        """
+        if event_id in self.seen:
+            return False
+        self.seen[event_id] = None
+        if len(self.seen) > FEED_PAGES * 100:
+            del self.seen[next(iter(self.seen))]
+        return True
+
+
+class GitHubEventsPortal(GitHubPortal):
+    """
+    A class to read the public activity feeds of repositories, organizations and users.
+    """
+
+    @classmethod
+    async def _events(
+        cls: type["GitHubEventsPortal"],
+        endpoint: str,
+        per_page: int,
+        page: int,
+        mode: ReturnMode,
+    ) -> tuple[int, list[GitHubEvent] | list[GitHubEventJSON] | bytes | ErrorMessage]:
+        try:
+            res = await cls.req(
+                "GET",
+                endpoint,
+                params={"per_page": per_page, "page": page},
+                headers={"accept": "application/vnd.github+json"},
+            )
+
+            if res.status_code != 200:
+                return (
+                    res.status_code,
+                    ErrorMessage(
+                        code=res.status_code,
+                        message=res.json().get("message", "Unknown error"),
+                        endpoint=endpoint,
+                    ),
+                )
+
+            return (res.status_code, await cls.parse(res, list[GitHubEvent], mode))
+        except Exception as e:
+            return (500, ErrorMessage(code=500, message=str(e), endpoint=endpoint))
+
+    @needs_authentication
+    async def repository_events(
+        cls: Self,
+        owner: str,
+        repo: str,
+        per_page: int = 30,
+        page: int = 1,
+        mode: ReturnMode = "model",
+    ) -> tuple[int, list[GitHubEvent] | list[GitHubEventJSON] | bytes | ErrorMessage]:
+        """
+        Lists the public events of a repository, newest first.
+        Available: [https://docs.github.com/en/rest/activity/events?apiVersion=2022-11-28#list-repository-events](https://docs.github.com/en/rest/activity/events?apiVersion=2022-11-28#list-repository-events)
+
+        Args:
+            owner (str): The owner of the repository.
+            repo (str): The name of the repository.
+            per_page (int, optional): The page size, at most 100. Defaults to 30.
+            page (int, optional): The page to fetch. Defaults to 1.
+            mode (ReturnMode, optional): Return models, the decoded JSON or the raw body. Defaults to "model".
+
+        Returns:
+            tuple[int, list[GitHubEvent] | bytes | ErrorMessage]: A tuple containing the status code and the events, or an error message.
+        """
+        return await cls._events(f"repos/{owner}/{repo}/events", per_page, page, mode)
+
+    @needs_authentication
+    async def organization_events(
+        cls: Self,
+        org: str,
+        per_page: int = 30,
+        page: int = 1,
+        mode: ReturnMode = "model",
+    ) -> tuple[int, list[GitHubEvent] | list[GitHubEventJSON] | bytes | ErrorMessage]:
+        """
+        Lists the public events of an organization, newest first.
+        Available: [https://docs.github.com/en/rest/activity/events?apiVersion=2022-11-28#list-public-organization-events](https://docs.github.com/en/rest/activity/events?apiVersion=2022-11-28#list-public-organization-events)
+
+        Args:
+            org (str): The organization name.
+            per_page (int, optional): The page size, at most 100. Defaults to 30.
+            page (int, optional): The page to fetch. Defaults to 1.
+            mode (ReturnMode, optional): Return models, the decoded JSON or the raw body. Defaults to "model".
+
+        Returns:
+            tuple[int, list[GitHubEvent] | bytes | ErrorMessage]: A tuple containing the status code and the events, or an error message.
+        """
+        return await cls._events(f"orgs/{org}/events", per_page, page, mode)
+
+    @needs_authentication
+    async def user_events(
+        cls: Self,
+        username: str,
+        per_page: int = 30,
+        page: int = 1,
+        mode: ReturnMode = "model",
+    ) -> tuple[int, list[GitHubEvent] | list[GitHubEventJSON] | bytes | ErrorMessage]:
+        """
+        Lists the public events a user performed, newest first.
+        Available: [https://docs.github.com/en/rest/activity/events?apiVersion=2022-11-28#list-public-events-for-a-user](https://docs.github.com/en/rest/activity/events?apiVersion=2022-11-28#list-public-events-for-a-user)
+
+        Args:
+            username (str): The handle for the GitHub user account.
+            per_page (int, optional): The page size, at most 100. Defaults to 30.
+            page (int, optional): The page to fetch. Defaults to 1.
+            mode (ReturnMode, optional): Return models, the decoded JSON or the raw body. Defaults to "model".
+
+        Returns:
+            tuple[int, list[GitHubEvent] | bytes | ErrorMessage]: A tuple containing the status code and the events, or an error message.
+        """
+        return await cls._events(
+            f"users/{username}/events/public", per_page, page, mode
+        )
+
+    @classmethod
+    async def _poll(
+        cls: type["GitHubEventsPortal"],
+        feed: _Feed,
+        backlog: bool,
+        priority: Priority | None,
+    ) -> list[dict[str, Any]]:
+        """
+        Poll one feed, returning its unseen events oldest first.
+        Further pages are only read while every event on a page is new.
+        """
+        fresh: list[dict[str, Any]] = []
+        answered = False
+        for page in range(1, FEED_PAGES + 1):
+            headers = {"accept": "application/vnd.github+json"}
+            if page == 1 and feed.etag is not None:
+                headers["if-none-match"] = feed.etag
+            try:
+                res: Response = await cls.req(
+                    "GET",
+                    feed.path,
+                    priority=priority,
+                    # The feed keeps its own ETag; a cached copy would hide new events.
+                    cached=False,
+                    params={"per_page": 100, "page": page},
+                    headers=headers,  # type: ignore[arg-type]
+                )
+            except Exception as e:
+                LOGGER.warning(f"watch:::Polling {feed.path} failed: {e}")
+                break
+
+            if page == 1:
+                if "x-poll-interval" in res.headers:
+                    feed.interval = float(res.headers["x-poll-interval"])
+                if res.status_code == 304:
+                    answered = True
+                    break
+            if res.status_code != 200:
+                LOGGER.warning(f"watch:::Polling {feed.path} got {res.status_code}")
+                break
+            if page == 1:
+                answered, feed.etag = True, res.headers.get("etag")
+
+            events: list[dict[str, Any]] = res.json()
+            new = [event for event in events if feed.remember(event["id"])]
+            fresh += new
+            if len(new) < len(events) or len(events) < 100:
+                break
+            if not feed.primed and not backlog:
+                # The first page is enough to know what is already there.
+                break
+
+        primed = feed.primed
+        # A feed whose first page failed has seen nothing, so it is not primed yet.
+        feed.primed = primed or answered
+        if not primed and not backlog:
+            return []
+        return fresh[::-1]
+
+    @needs_authentication
+    async def watch(
+        cls: Self,
+        feeds: Iterable[str],
+        backlog: bool = False,
+        priority: Priority | None = "bulk",
+        mode: ReturnMode = "model",
+    ) -> AsyncIterator[GitHubEvent | GitHubEventJSON]:
+        """
+        Stream new events from many feeds, polled from one loop.
+        Each feed is polled as often as its `X-Poll-Interval` allows, with `If-None-Match`,
+        so a feed with nothing new costs no rate limit. Events are yielded oldest first per feed,
+        and events seen before, e.g. on overlapping pages, are skipped.
+
+        Args:
+            feeds (Iterable[str]): The feeds to watch, as API paths: "repos/{owner}/{repo}", "orgs/{org}" or "users/{username}".
+            backlog (bool, optional): Also yield the events already in each feed when watching starts. Defaults to False.
+            priority (Priority | None, optional): The lane to poll in. Defaults to "bulk".
+            mode (ReturnMode, optional): Yield models or the decoded JSON. Defaults to "model".
+
+        Yields:
+            GitHubEvent | GitHubEventJSON: Each new event, once.
+        """
+        if mode == "bytes":
+            raise ValueError("watch yields single events, not mode='bytes'")
+
+        due: list[tuple[float, int, _Feed]] = []
+        for order, path in enumerate(dict.fromkeys(feeds)):
+            if not path.startswith(EVENT_SOURCES):
+                raise ValueError(
+                    f"watch:::{path} is not a repos/, orgs/ or users/ path"
+                )
+            endpoint = path.strip("/")
+            endpoint += "/events/public" if path.startswith("users/") else "/events"
+            heappush(due, (0.0, order, _Feed(endpoint)))
+
+        while due:
+            await sleep(max(0.0, due[0][0] - monotonic()))
+            now = monotonic()
+            ready: list[tuple[int, _Feed]] = []
+            while due and due[0][0] <= now:
+                _, order, feed = heappop(due)
+                ready.append((order, feed))
+
+            polls = await gather(
+                *(cls._poll(feed, backlog, priority) for _, feed in ready)
+            )
+            for (order, feed), events in zip(ready, polls):
+                heappush(due, (monotonic() + feed.interval, order, feed))
+                for event in events:
+                    yield (
+                        GitHubEvent.model_validate(event)
+                        if mode == "model"
+                        else event  # type: ignore[misc]
+                    )
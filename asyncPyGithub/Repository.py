@@ -1,22 +1,61 @@
-from typing import Literal, Optional
+from asyncio import gather
+from base64 import b64encode
+from collections.abc import Collection, Sequence
+from hashlib import sha1
+from pathlib import Path
+from typing import Any, Literal, Optional
 
+from httpx import TransportError
 from typing_extensions import Self
 
 from ._types import (
     ContentNode,
+    ContentNodeJSON,
     ContentTree,
+    ContentTreeJSON,
     Contributor,
+    ContributorJSON,
     ErrorMessage,
+    FileChanges,
     FullRepository,
+    FullRepositoryJSON,
+    GitHubModel,
+    GitBlob,
+    GitBlobJSON,
+    GitCommit,
+    GitCommitJSON,
     GitHubPortal,
+    GitTree,
+    GitTreeJSON,
     MinimalRepository,
+    MinimalRepositoryJSON,
     RepositoryType,
     RepoSortCriterion,
     RepoSortDirection,
+    ReturnMode,
     Tag,
+    TagJSON,
     Topics,
+    TopicsJSON,
     needs_authentication,
+    project,
 )
+from .archive import (
+    BUFFERED_CHUNKS,
+    CHUNK_SIZE,
+    ArchiveFormat,
+    extract_to,
+    pump,
+    write_to,
+)
+from .base import LOGGER
+
+
+def _blob_sha(data: bytes) -> str:
+    """
+    The object id git gives a blob, so identical contents can be uploaded once.
+    """
+    return sha1(b"blob %d\0" % len(data) + data).hexdigest()
 
 
 class GitHubRepositoryPortal(GitHubPortal):
@@ -34,7 +73,16 @@ class GitHubRepositoryPortal(GitHubPortal):
         direction: RepoSortDirection = "asc",
         per_page: int = 30,
         page: int = 1,
-    ) -> tuple[int, list[MinimalRepository] | ErrorMessage]:
+        mode: ReturnMode = "model",
+        fields: Sequence[str] | None = None,
+    ) -> tuple[
+        int,
+        list[MinimalRepository]
+        | list[GitHubModel]
+        | list[MinimalRepositoryJSON]
+        | bytes
+        | ErrorMessage,
+    ]:
         """
         Lists repositories for the specified organization.
         This endpoint can be used without authentication, or
@@ -48,6 +96,15 @@ class GitHubRepositoryPortal(GitHubPortal):
             "page": page,
         }
 
+        try:
+            model = project(MinimalRepository, fields) if fields else MinimalRepository
+        except ValueError as e:
+            return (
+                400,
+                ErrorMessage(
+                    code=400, message=str(e), endpoint=f"/orgs/{organization}/repos"
+                ),
+            )
         try:
             res = await cls.req(
                 "GET",
@@ -66,6 +123,10 @@ class GitHubRepositoryPortal(GitHubPortal):
                     ),
                 )
 
+            return (
+                res.status_code,
+                await cls.parse(res, list[model], mode),  # type: ignore[valid-type]
+            )
         except Exception as e:
             return (
                 500,
@@ -75,7 +136,6 @@ class GitHubRepositoryPortal(GitHubPortal):
                     endpoint=f"/orgs/{organization}/repos",
                 ),
             )
-        return (res.status_code, [MinimalRepository(**repo) for repo in res.json()])
 
     @needs_authentication
     async def create_organization_repo(
@@ -110,7 +170,8 @@ class GitHubRepositoryPortal(GitHubPortal):
         merge_commit_title: Literal["PR_TITLE", "MERGE_MESSAGE"] = "PR_TITLE",
         merge_commit_message: Literal["PR_BODY", "PR_TITLE", "BLANK"] = "PR_TITLE",
         custom_properties: dict[str, str | bool | int] | None = None,
-    ) -> tuple[int, FullRepository | ErrorMessage]:
+        mode: ReturnMode = "model",
+    ) -> tuple[int, FullRepository | FullRepositoryJSON | bytes | ErrorMessage]:
         params = {
             "name": name,
             "description": description,
@@ -158,6 +219,8 @@ class GitHubRepositoryPortal(GitHubPortal):
                         endpoint=f"/orgs/{organization}/repos",
                     ),
                 )
+
+            return (res.status_code, await cls.parse(res, FullRepository, mode))
         except Exception as e:
             return (
                 500,
@@ -168,14 +231,13 @@ class GitHubRepositoryPortal(GitHubPortal):
                 ),
             )
 
-        return (res.status_code, FullRepository(**res.json()))
-
     @needs_authentication
     async def get_user_repo(
         cls: Self,
         owner: str,
         repo: str,
-    ) -> tuple[int, FullRepository | ErrorMessage]:
+        mode: ReturnMode = "model",
+    ) -> tuple[int, FullRepository | FullRepositoryJSON | bytes | ErrorMessage]:
         """
         Lists repositories for the authenticated user.
         This endpoint can be used without authentication, or
@@ -198,6 +260,7 @@ class GitHubRepositoryPortal(GitHubPortal):
                     ),
                 )
 
+            return (res.status_code, await cls.parse(res, FullRepository, mode))
         except Exception as e:
             return (
                 500,
@@ -208,8 +271,6 @@ class GitHubRepositoryPortal(GitHubPortal):
                 ),
             )
 
-        return (res.status_code, FullRepository(**res.json()))
-
     @needs_authentication
     async def update_repository(
         cls: Self,
@@ -242,7 +303,8 @@ class GitHubRepositoryPortal(GitHubPortal):
         archived: Optional[bool] = None,
         allow_forking: Optional[bool] = None,
         web_commit_signoff_required: Optional[bool] = None,
-    ) -> tuple[int, FullRepository | ErrorMessage]:
+        mode: ReturnMode = "model",
+    ) -> tuple[int, FullRepository | FullRepositoryJSON | bytes | ErrorMessage]:
         """
         Updates a repository.
         This endpoint can be used with write access to the repository.
@@ -291,6 +353,8 @@ class GitHubRepositoryPortal(GitHubPortal):
                         endpoint=f"repos/{owner}/{repo}",
                     ),
                 )
+
+            return (res.status_code, await cls.parse(res, FullRepository, mode))
         except Exception as e:
             return (
                 500,
@@ -301,8 +365,6 @@ class GitHubRepositoryPortal(GitHubPortal):
                 ),
             )
 
-        return (res.status_code, FullRepository(**res.json()))
-
     @needs_authentication
     async def delete_repository(
         cls: Self, owner: str, repo: str
@@ -347,13 +409,33 @@ class GitHubRepositoryPortal(GitHubPortal):
         anon: bool = False,
         per_page: int = 30,
         page: int = 1,
-    ) -> tuple[int, list[Contributor] | ErrorMessage]:
+        mode: ReturnMode = "model",
+        fields: Sequence[str] | None = None,
+    ) -> tuple[
+        int,
+        list[Contributor]
+        | list[GitHubModel]
+        | list[ContributorJSON]
+        | bytes
+        | ErrorMessage,
+    ]:
         """
         Lists contributors to the specified repository and sorts them by the number of commits per contributor in descending order. This endpoint may return information that is a few hours old because the GitHub REST API caches contributor data to improve performance.
         """
 
         params = {"anon": anon, "per_page": per_page, "page": page}
 
+        try:
+            model = project(Contributor, fields) if fields else Contributor
+        except ValueError as e:
+            return (
+                400,
+                ErrorMessage(
+                    code=400,
+                    message=str(e),
+                    endpoint=f"repos/{owner}/{repo}/contributors",
+                ),
+            )
         try:
             res = await cls.req(
                 "GET",
@@ -371,6 +453,11 @@ class GitHubRepositoryPortal(GitHubPortal):
                         endpoint=f"repos/{owner}/{repo}/contributors",
                     ),
                 )
+
+            return (
+                res.status_code,
+                await cls.parse(res, list[model], mode),  # type: ignore[valid-type]
+            )
         except Exception as e:
             return (
                 500,
@@ -380,15 +467,11 @@ class GitHubRepositoryPortal(GitHubPortal):
                     endpoint=f"repos/{owner}/{repo}/contributors",
                 ),
             )
-        return (
-            res.status_code,
-            [Contributor(**contributor) for contributor in res.json()],
-        )
 
     @needs_authentication
     async def list_repository_languages(
-        cls: Self, owner: str, repo: str
-    ) -> tuple[int, dict[str, int] | ErrorMessage]:
+        cls: Self, owner: str, repo: str, mode: ReturnMode = "model"
+    ) -> tuple[int, dict[str, int] | bytes | ErrorMessage]:
         """
         Lists languages for the specified repository. The value shown for each language is the number of bytes of code written in that language.
         """
@@ -418,12 +501,17 @@ class GitHubRepositoryPortal(GitHubPortal):
                     endpoint=f"repos/{owner}/{repo}/languages",
                 ),
             )
-        return (res.status_code, res.json())
+        return (res.status_code, res.content if mode == "bytes" else res.json())
 
     @needs_authentication
     async def list_repository_tags(
-        cls: Self, owner: str, repo: str, per_page: int = 30, page: int = 1
-    ) -> tuple[int, list[Tag] | ErrorMessage]:
+        cls: Self,
+        owner: str,
+        repo: str,
+        per_page: int = 30,
+        page: int = 1,
+        mode: ReturnMode = "model",
+    ) -> tuple[int, list[Tag] | list[TagJSON] | bytes | ErrorMessage]:
         """
         Lists tags for the specified repository.
         This endpoint can be used without authentication, or
@@ -449,6 +537,8 @@ class GitHubRepositoryPortal(GitHubPortal):
                         endpoint=f"repos/{owner}/{repo}/tags",
                     ),
                 )
+
+            return (res.status_code, await cls.parse(res, list[Tag], mode))
         except Exception as e:
             return (
                 500,
@@ -459,12 +549,10 @@ class GitHubRepositoryPortal(GitHubPortal):
                 ),
             )
 
-        return (res.status_code, [Tag(**tag) for tag in res.json()])
-
     @needs_authentication
     async def get_repository_topics(
-        cls: Self, owner: str, repo: str
-    ) -> tuple[int, Topics | ErrorMessage]:
+        cls: Self, owner: str, repo: str, mode: ReturnMode = "model"
+    ) -> tuple[int, Topics | TopicsJSON | bytes | ErrorMessage]:
         """
         Lists topics for the specified repository.
         This endpoint can be used without authentication, or
@@ -487,6 +575,8 @@ class GitHubRepositoryPortal(GitHubPortal):
                         endpoint=f"repos/{owner}/{repo}/topics",
                     ),
                 )
+
+            return (res.status_code, await cls.parse(res, Topics, mode))
         except Exception as e:
             return (
                 500,
@@ -497,8 +587,6 @@ class GitHubRepositoryPortal(GitHubPortal):
                 ),
             )
 
-        return (res.status_code, Topics(**res.json()))
-
     @needs_authentication
     async def get_repo_content(
         cls: Self,
@@ -506,7 +594,17 @@ class GitHubRepositoryPortal(GitHubPortal):
         repo: str,
         path: str,
         mediatype: Literal["raw", "html", "object", "default"] = "default",
-    ) -> tuple[int, ContentTree | ContentNode | bytes | ErrorMessage]:
+        mode: ReturnMode = "model",
+        ref: str | None = None,
+    ) -> tuple[
+        int,
+        ContentTree
+        | ContentNode
+        | ContentTreeJSON
+        | ContentNodeJSON
+        | bytes
+        | ErrorMessage,
+    ]:
         """
         Gets the contents of a file or directory in a repository. Specify the file path or directory with the path parameter. If you omit the path parameter, you will receive the contents of the repository's root directory.
 
@@ -526,6 +624,8 @@ class GitHubRepositoryPortal(GitHubPortal):
             repo (str): The name of the repository.
             path (str): The content path.
             mediatype (Literal["raw", "html", "object", "default"]): The media type of the content to return.
+            mode (ReturnMode, optional): For JSON media types, return a model, the decoded JSON or the raw body. Defaults to "model".
+            ref (str | None, optional): The branch, tag or commit to read from. Contents read at a full commit SHA never change, and are cached forever. Defaults to the default branch.
 
         Returns:
             tuple[int, ContentTree | ContentNode | bytes | ErrorMessage]: A tuple containing the status code and the content tree, raw bytes, or an error message.
@@ -545,6 +645,7 @@ class GitHubRepositoryPortal(GitHubPortal):
             res = await cls.req(
                 "GET",
                 f"repos/{owner}/{repo}/contents/{path}",
+                params=None if ref is None else {"ref": ref},  # type: ignore[arg-type]
                 headers={"accept": mediareturntype},
             )
 
@@ -561,12 +662,12 @@ class GitHubRepositoryPortal(GitHubPortal):
                 case "raw" | "html":
                     return (res.status_code, res.content)
                 case _:
-                    data = res.json()
-                    # If the API returned a file, it will not have an 'entries' key.
-                    if "entries" in data:
-                        return (res.status_code, ContentTree(**data))
-
-                    return (res.status_code, ContentNode(**data))
+                    # If the API returned a file, it will not have an 'entries' key,
+                    # so only ContentNode validates.
+                    content = await cls.parse(  # type: ignore[call-overload]
+                        res, ContentTree | ContentNode, mode
+                    )
+                    return (res.status_code, content)
         except Exception as e:
             return (
                 500,
@@ -576,3 +677,470 @@ class GitHubRepositoryPortal(GitHubPortal):
                     endpoint=f"repos/{owner}/{repo}/contents/{path}",
                 ),
             )
+
+    @needs_authentication
+    async def get_blob(
+        cls: Self,
+        owner: str,
+        repo: str,
+        sha: str,
+        mode: ReturnMode = "model",
+    ) -> tuple[int, GitBlob | GitBlobJSON | bytes | ErrorMessage]:
+        """
+        Gets a blob by its SHA. Its content is base64 encoded unless `encoding` says otherwise.
+        Blobs never change, so with a response cache they are fetched once.
+        Available: [https://docs.github.com/en/rest/git/blobs?apiVersion=2022-11-28#get-a-blob](https://docs.github.com/en/rest/git/blobs?apiVersion=2022-11-28#get-a-blob)
+        Args:
+            owner (str): The owner of the repository.
+            repo (str): The name of the repository.
+            sha (str): The SHA of the object.
+            mode (ReturnMode, optional): Return a model, the decoded JSON or the raw body. Defaults to "model".
+        Returns:
+            tuple[int, GitBlob | bytes | ErrorMessage]: A tuple containing the status code and the object, or an error message.
+        """
+
+        try:
+            res = await cls.req(
+                "GET",
+                f"repos/{owner}/{repo}/git/blobs/{sha}",
+                headers={"accept": "application/vnd.github+json"},
+            )
+
+            if res.status_code != 200:
+                return (
+                    res.status_code,
+                    ErrorMessage(
+                        code=res.status_code,
+                        message=res.json().get("message", "Unknown error"),
+                        endpoint=f"repos/{owner}/{repo}/git/blobs/{sha}",
+                    ),
+                )
+
+            return (res.status_code, await cls.parse(res, GitBlob, mode))
+        except Exception as e:
+            return (
+                500,
+                ErrorMessage(
+                    code=500,
+                    message=str(e),
+                    endpoint=f"repos/{owner}/{repo}/git/blobs/{sha}",
+                ),
+            )
+
+    @needs_authentication
+    async def get_tree(
+        cls: Self,
+        owner: str,
+        repo: str,
+        sha: str,
+        recursive: bool = False,
+        mode: ReturnMode = "model",
+    ) -> tuple[int, GitTree | GitTreeJSON | bytes | ErrorMessage]:
+        """
+        Gets a tree by its SHA, or by a branch or tag name.
+        Trees read by their full SHA never change, so with a response cache they are fetched once.
+        Available: [https://docs.github.com/en/rest/git/trees?apiVersion=2022-11-28#get-a-tree](https://docs.github.com/en/rest/git/trees?apiVersion=2022-11-28#get-a-tree)
+        Args:
+            owner (str): The owner of the repository.
+            repo (str): The name of the repository.
+            sha (str): The SHA of the object.
+            recursive (bool, optional): List every entry below the tree, up to GitHub's limit. Defaults to False.
+            mode (ReturnMode, optional): Return a model, the decoded JSON or the raw body. Defaults to "model".
+        Returns:
+            tuple[int, GitTree | bytes | ErrorMessage]: A tuple containing the status code and the object, or an error message.
+        """
+
+        try:
+            res = await cls.req(
+                "GET",
+                f"repos/{owner}/{repo}/git/trees/{sha}",
+                params={"recursive": 1} if recursive else None,  # type: ignore[arg-type]
+                headers={"accept": "application/vnd.github+json"},
+            )
+
+            if res.status_code != 200:
+                return (
+                    res.status_code,
+                    ErrorMessage(
+                        code=res.status_code,
+                        message=res.json().get("message", "Unknown error"),
+                        endpoint=f"repos/{owner}/{repo}/git/trees/{sha}",
+                    ),
+                )
+
+            return (res.status_code, await cls.parse(res, GitTree, mode))
+        except Exception as e:
+            return (
+                500,
+                ErrorMessage(
+                    code=500,
+                    message=str(e),
+                    endpoint=f"repos/{owner}/{repo}/git/trees/{sha}",
+                ),
+            )
+
+    @needs_authentication
+    async def get_git_commit(
+        cls: Self,
+        owner: str,
+        repo: str,
+        sha: str,
+        mode: ReturnMode = "model",
+    ) -> tuple[int, GitCommit | GitCommitJSON | bytes | ErrorMessage]:
+        """
+        Gets a commit object by its SHA: its tree, parents, author and message.
+        Commits never change, so with a response cache they are fetched once.
+        Available: [https://docs.github.com/en/rest/git/commits?apiVersion=2022-11-28#get-a-commit-object](https://docs.github.com/en/rest/git/commits?apiVersion=2022-11-28#get-a-commit-object)
+        Args:
+            owner (str): The owner of the repository.
+            repo (str): The name of the repository.
+            sha (str): The SHA of the object.
+            mode (ReturnMode, optional): Return a model, the decoded JSON or the raw body. Defaults to "model".
+        Returns:
+            tuple[int, GitCommit | bytes | ErrorMessage]: A tuple containing the status code and the object, or an error message.
+        """
+
+        try:
+            res = await cls.req(
+                "GET",
+                f"repos/{owner}/{repo}/git/commits/{sha}",
+                headers={"accept": "application/vnd.github+json"},
+            )
+
+            if res.status_code != 200:
+                return (
+                    res.status_code,
+                    ErrorMessage(
+                        code=res.status_code,
+                        message=res.json().get("message", "Unknown error"),
+                        endpoint=f"repos/{owner}/{repo}/git/commits/{sha}",
+                    ),
+                )
+
+            return (res.status_code, await cls.parse(res, GitCommit, mode))
+        except Exception as e:
+            return (
+                500,
+                ErrorMessage(
+                    code=500,
+                    message=str(e),
+                    endpoint=f"repos/{owner}/{repo}/git/commits/{sha}",
+                ),
+            )
+
+    @needs_authentication
+    async def download_archive(
+        cls: Self,
+        owner: str,
+        repo: str,
+        ref: str,
+        destination: Path | str,
+        format: ArchiveFormat = "tarball",
+        extract: bool = False,
+        attempts: int = 3,
+        chunk_size: int = CHUNK_SIZE,
+        buffer: int = BUFFERED_CHUNKS,
+    ) -> tuple[int, Path | ErrorMessage]:
+        """
+        Downloads a snapshot of a repository at a ref, streaming it to disk without holding it in memory.
+        The API redirects to a short-lived codeload URL, which is followed.
+        Available: [https://docs.github.com/en/rest/repos/contents?apiVersion=2022-11-28#download-a-repository-archive-tar](https://docs.github.com/en/rest/repos/contents?apiVersion=2022-11-28#download-a-repository-archive-tar)
+
+        Downloads to a file are written to `<destination>.part` and renamed once complete.
+        A download interrupted by a network error resumes from the end of that file with a range request, up to `attempts` times,
+        and so does calling this again after a failure. Pass a commit SHA as `ref` when resuming across calls, since a branch may move in between.
+
+        Args:
+            owner (str): The owner of the repository.
+            repo (str): The name of the repository.
+            ref (str): The branch, tag or commit SHA to archive. An empty string archives the default branch.
+            destination (Path | str): The file to write the archive to, or the directory to extract it into.
+            format (ArchiveFormat, optional): "tarball" or "zipball". Defaults to "tarball".
+            extract (bool, optional): Extract a tarball into `destination` as it downloads instead of saving it. Defaults to False.
+            attempts (int, optional): How many times to try a download to a file before giving up. Defaults to 3.
+            chunk_size (int, optional): The number of bytes read from the network at a time. Defaults to 64 KiB.
+            buffer (int, optional): The number of chunks held while the disk catches up. Defaults to 16.
+
+        Returns:
+            tuple[int, Path | ErrorMessage]: A tuple containing the status code and the archive file or extraction directory, or an error message.
+        """
+        if extract and format != "tarball":
+            raise ValueError("only tarballs can be extracted while streaming")
+
+        endpoint = f"repos/{owner}/{repo}/{format}/{ref}".rstrip("/")
+        destination = Path(destination)
+        part = destination.with_name(f"{destination.name}.part")
+        status = 500
+
+        for attempt in range(1, attempts + 1):
+            offset = 0 if extract or not part.exists() else part.stat().st_size
+            headers = {"accept": "application/vnd.github+json"}
+            if offset:
+                headers["range"] = f"bytes={offset}-"
+            try:
+                async with cls.stream(
+                    "GET", endpoint, headers=headers, follow_redirects=True
+                ) as res:
+                    status = res.status_code
+                    if status == 416:
+                        # The part file already holds the whole archive.
+                        part.replace(destination)
+                        return (200, destination)
+
+                    if status not in (200, 206):
+                        await res.aread()
+                        return (
+                            status,
+                            ErrorMessage(
+                                code=status,
+                                message=res.json().get("message", "Unknown error"),
+                                endpoint=endpoint,
+                            ),
+                        )
+
+                    chunks = res.aiter_bytes(chunk_size)
+                    if extract:
+                        await pump(chunks, extract_to, destination, buffer=buffer)
+                        return (200, destination)
+
+                    # A 200 to a range request means the server started over.
+                    await pump(chunks, write_to, part, status == 206, buffer=buffer)
+                    part.replace(destination)
+                    return (200, destination)
+            except TimeoutError:
+                return (
+                    504,
+                    ErrorMessage(
+                        code=504, message="Deadline exceeded", endpoint=endpoint
+                    ),
+                )
+            except TransportError as e:
+                if extract or attempt == attempts:
+                    return (
+                        500,
+                        ErrorMessage(code=500, message=str(e), endpoint=endpoint),
+                    )
+                LOGGER.warning(
+                    f"download_archive:::{endpoint} interrupted ({e}), resuming (attempt {attempt + 1} of {attempts})"
+                )
+            except Exception as e:
+                return (500, ErrorMessage(code=500, message=str(e), endpoint=endpoint))
+
+        return (
+            status,
+            ErrorMessage(code=status, message="No attempts made", endpoint=endpoint),
+        )
+
+    @classmethod
+    async def _git(
+        cls: type["GitHubRepositoryPortal"],
+        method: Literal["GET", "POST", "PATCH"],
+        endpoint: str,
+        expected: int,
+        body: dict[str, Any] | None = None,
+        cached: bool = True,
+    ) -> tuple[int, dict[str, Any] | ErrorMessage]:
+        res = await cls.req(
+            method,
+            endpoint,
+            cached=cached,
+            json=body,  # type: ignore[arg-type]
+            headers={"accept": "application/vnd.github+json"},
+        )
+        if res.status_code != expected:
+            return (
+                res.status_code,
+                ErrorMessage(
+                    code=res.status_code,
+                    message=res.json().get("message", "Unknown error"),
+                    endpoint=endpoint,
+                ),
+            )
+        return (res.status_code, res.json())
+
+    @classmethod
+    async def _blob_modes(
+        cls: type["GitHubRepositoryPortal"],
+        git: str,
+        root: str,
+        paths: Collection[str],
+    ) -> tuple[int, dict[str, str] | ErrorMessage]:
+        # Walks only the directories holding `paths`, one level at a time, so a commit
+        # touching a few files of a large repository reads a few small trees.
+        wanted = set(paths)
+        folders = {
+            path[: i + 1] for path in wanted for i, c in enumerate(path) if c == "/"
+        }
+        modes: dict[str, str] = {}
+        pending = {"": root}
+        while pending:
+            listings = await gather(
+                *(
+                    cls._git("GET", f"{git}/trees/{sha}", 200)
+                    for sha in pending.values()
+                )
+            )
+            following: dict[str, str] = {}
+            for folder, (status, listing) in zip(pending, listings):
+                if isinstance(listing, ErrorMessage):
+                    return (status, listing)
+                for entry in listing["tree"]:
+                    path = f"{folder}{entry['path']}"
+                    if entry["type"] == "blob" and path in wanted:
+                        modes[path] = entry["mode"]
+                    elif entry["type"] == "tree" and f"{path}/" in folders:
+                        following[f"{path}/"] = entry["sha"]
+            pending = following
+        return (200, modes)
+
+    @needs_authentication
+    async def commit_files(
+        cls: Self,
+        owner: str,
+        repo: str,
+        branch: str,
+        files: FileChanges,
+        message: str,
+        force: bool = False,
+        attempts: int = 3,
+        mode: ReturnMode = "model",
+    ) -> tuple[int, GitCommit | GitCommitJSON | ErrorMessage]:
+        """
+        Writes many files to a branch in a single commit through the Git Data API.
+        Blobs are uploaded concurrently, then one tree, one commit and one ref update follow,
+        instead of a Contents API request (and SHA check) per file.
+        Available: [https://docs.github.com/en/rest/git?apiVersion=2022-11-28](https://docs.github.com/en/rest/git?apiVersion=2022-11-28)
+
+        Files that already exist keep their mode, e.g. the executable bit; new files are written as regular files. Identical contents are uploaded once.
+        If the branch moves while the commit is being built, the commit is rebuilt on the new head, up to `attempts` times.
+
+        Args:
+            owner (str): The owner of the repository.
+            repo (str): The name of the repository.
+            branch (str): The branch to commit to. It must already exist.
+            files (FileChanges): The new contents by path, or None for paths to delete.
+            message (str): The commit message.
+            force (bool, optional): Move the branch even if the commit does not descend from its head, discarding newer commits. Defaults to False.
+            attempts (int, optional): How many times to build the commit when the branch keeps moving. Defaults to 3.
+            mode (ReturnMode, optional): Return a model or the decoded JSON. Defaults to "model".
+
+        Returns:
+            tuple[int, GitCommit | GitCommitJSON | ErrorMessage]: A tuple containing the status code and the new commit, or an error message.
+        """
+        git = f"repos/{owner}/{repo}/git"
+        if not files:
+            return (
+                400,
+                ErrorMessage(
+                    code=400,
+                    message="commit_files needs at least one file",
+                    endpoint=git,
+                ),
+            )
+        if mode == "bytes":
+            return (
+                400,
+                ErrorMessage(
+                    code=400,
+                    message="commit_files returns a decoded commit, not mode='bytes'",
+                    endpoint=git,
+                ),
+            )
+
+        try:
+            # Blobs do not depend on the branch head, so they survive a rebuild.
+            shas = {
+                path: None if data is None else _blob_sha(data)
+                for path, data in files.items()
+            }
+            contents = {
+                sha: data
+                for sha, data in zip(shas.values(), files.values())
+                if sha is not None and data is not None
+            }
+            uploads = await gather(
+                *(
+                    cls._git(
+                        "POST",
+                        f"{git}/blobs",
+                        201,
+                        {"content": b64encode(data).decode(), "encoding": "base64"},
+                    )
+                    for data in contents.values()
+                )
+            )
+            for status, blob in uploads:
+                if isinstance(blob, ErrorMessage):
+                    return (status, blob)
+
+            written = [path for path, sha in shas.items() if sha is not None]
+
+            status, error = 500, ErrorMessage(code=500, message="", endpoint=git)
+            for _ in range(attempts):
+                # The head must be current: a cached ref would build on an old commit,
+                # and the ref is updated at git/refs/..., a path that would not invalidate it.
+                status, ref = await cls._git(
+                    "GET", f"{git}/ref/heads/{branch}", 200, cached=False
+                )
+                if isinstance(ref, ErrorMessage):
+                    return (status, ref)
+                head = ref["object"]["sha"]
+
+                status, parent = await cls._git("GET", f"{git}/commits/{head}", 200)
+                if isinstance(parent, ErrorMessage):
+                    return (status, parent)
+
+                status, modes = await cls._blob_modes(
+                    git, parent["tree"]["sha"], written
+                )
+                if isinstance(modes, ErrorMessage):
+                    return (status, modes)
+
+                entries = [
+                    {
+                        "path": path,
+                        "mode": modes.get(path, "100644"),
+                        "type": "blob",
+                        "sha": sha,
+                    }
+                    for path, sha in shas.items()
+                ]
+                status, tree = await cls._git(
+                    "POST",
+                    f"{git}/trees",
+                    201,
+                    {"base_tree": parent["tree"]["sha"], "tree": entries},
+                )
+                if isinstance(tree, ErrorMessage):
+                    return (status, tree)
+
+                status, commit = await cls._git(
+                    "POST",
+                    f"{git}/commits",
+                    201,
+                    {"message": message, "tree": tree["sha"], "parents": [head]},
+                )
+                if isinstance(commit, ErrorMessage):
+                    return (status, commit)
+
+                status, moved = await cls._git(
+                    "PATCH",
+                    f"{git}/refs/heads/{branch}",
+                    200,
+                    {"sha": commit["sha"], "force": force},
+                )
+                if not isinstance(moved, ErrorMessage):
+                    if mode == "dict":
+                        return (201, commit)  # type: ignore[return-value]
+                    return (201, GitCommit.model_validate(commit))
+                if status != 422:
+                    return (status, moved)
+                # 422: the branch moved on since we read it, so this is no fast-forward.
+                error = moved
+                LOGGER.warning(
+                    f"commit_files:::{owner}/{repo}@{branch} moved, rebuilding the commit"
+                )
+
+            return (status, error)
+        except Exception as e:
+            return (500, ErrorMessage(code=500, message=str(e), endpoint=git))
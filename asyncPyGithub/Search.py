@@ -0,0 +1,277 @@
+from collections.abc import AsyncIterator
+from datetime import UTC, date, datetime, timedelta
+from typing import Any, Final
+
+from typing_extensions import Self
+
+from ._types import (
+    CodeSearchResult,
+    CodeSearchResultJSON,
+    CodeSplit,
+    ErrorMessage,
+    GitHubModel,
+    GitHubPortal,
+    MinimalRepository,
+    MinimalRepositoryJSON,
+    RepositorySearchSort,
+    RepositorySplit,
+    ReturnMode,
+    SearchOrder,
+    SearchResults,
+    SimpleUser,
+    SimpleUserJSON,
+    UserSearchSort,
+    UserSplit,
+    needs_authentication,
+)
+from .base import LOGGER
+
+SEARCH_ENDPOINT: Final[str] = "/search"
+SEARCH_CAP: Final[int] = 1000
+"""
+GitHub returns at most this many results for one query, however many match.
+"""
+
+GITHUB_EPOCH: Final[date] = date(2008, 1, 1)
+DATE_QUALIFIERS: Final[frozenset[str]] = frozenset({"created", "pushed"})
+
+Bounds = tuple[date, date] | tuple[int, int | None]
+
+
+def _initial_bounds(qualifier: str) -> Bounds:
+    if qualifier in DATE_QUALIFIERS:
+        return (GITHUB_EPOCH, datetime.now(UTC).date())
+    return (0, None)
+
+
+def _halve(bounds: Bounds) -> tuple[Bounds, Bounds] | None:
+    """
+    Split an inclusive range in two, or None when it cannot be narrowed further.
+    Open numeric ranges (`lo..*`) grow geometrically, since counts are heavy-tailed.
+    """
+    if isinstance(bounds[0], date):
+        first, last = bounds
+        if first >= last:
+            return None
+        middle = first + (last - first) / 2
+        return (first, middle), (middle + timedelta(days=1), last)
+
+    low, high = bounds
+    if high is None:
+        split = low * 2 + 1000
+        return (low, split), (split + 1, None)
+    if low >= high:
+        return None
+    split = (low + high) // 2
+    return (low, split), (split + 1, high)
+
+
+def _qualify(query: str, qualifier: str, bounds: Bounds) -> str:
+    low, high = bounds
+    if isinstance(low, date) and isinstance(high, date):
+        return f"{query} {qualifier}:{low.isoformat()}..{high.isoformat()}"
+    return f"{query} {qualifier}:{low}..{'*' if high is None else high}"
+
+
+class GitHubSearchPortal(GitHubPortal):
+    """
+    A class to search GitHub repositories, users and code.
+    Searches stream their results page by page and count against the separate
+    search rate limit bucket, waiting for its reset rather than failing.
+    """
+
+    @classmethod
+    async def _search_page(
+        cls: type["GitHubSearchPortal"],
+        kind: str,
+        params: dict[str, str | int],
+        item: type[GitHubModel],
+        mode: ReturnMode,
+    ) -> tuple[int, SearchResults[Any] | dict[str, Any] | ErrorMessage]:
+        endpoint = f"{SEARCH_ENDPOINT}/{kind}"
+        try:
+            res = await cls.req(
+                "GET",
+                endpoint,
+                resource="code_search" if kind == "code" else "search",
+                params=params,  # type: ignore[arg-type]
+                headers={"accept": "application/vnd.github+json"},
+            )
+            if res.status_code != 200:
+                return (
+                    res.status_code,
+                    ErrorMessage(
+                        code=res.status_code,
+                        message=res.json().get("message", "Unknown error"),
+                        endpoint=endpoint,
+                    ),
+                )
+
+            return (res.status_code, await cls.parse(res, SearchResults[item], mode))  # type: ignore[valid-type]
+        except Exception as e:
+            return (500, ErrorMessage(code=500, message=str(e), endpoint=endpoint))
+
+    @classmethod
+    async def _search(
+        cls: type["GitHubSearchPortal"],
+        kind: str,
+        query: str,
+        item: type[GitHubModel],
+        split: str | None,
+        params: dict[str, str | int],
+        per_page: int,
+        mode: ReturnMode,
+    ) -> AsyncIterator[Any]:
+        """
+        Stream every result of a query, splitting it on `split` while a range
+        matches more than the result cap.
+        """
+        if mode == "bytes":
+            raise ValueError("search needs decoded pages, not mode='bytes'")
+
+        seen: set[str] = set()
+        ranges: list[Bounds | None] = [
+            None if split is None else _initial_bounds(split)
+        ]
+        while ranges:
+            bounds = ranges.pop()
+            q = (
+                query
+                if split is None or bounds is None
+                else _qualify(query, split, bounds)
+            )
+            page = 1
+            while True:
+                status, results = await cls._search_page(
+                    kind,
+                    {**params, "q": q, "per_page": per_page, "page": page},
+                    item,
+                    mode,
+                )
+                if isinstance(results, ErrorMessage):
+                    LOGGER.error(
+                        f"search:::Stopped at page {page} of '{q}' with {status}: {results.message}"
+                    )
+                    return
+
+                if isinstance(results, SearchResults):
+                    total, items = results.total_count, results.items
+                else:
+                    total, items = results["total_count"], results["items"]
+
+                if page == 1 and total > SEARCH_CAP:
+                    halves = None if bounds is None else _halve(bounds)
+                    if halves is not None:
+                        # Depth first, lower range first.
+                        ranges += [halves[1], halves[0]]
+                        break
+                    LOGGER.warning(
+                        f"search:::'{q}' matches {total} results, only the first {SEARCH_CAP} are reachable"
+                    )
+
+                for result in items:
+                    key = str(
+                        result["html_url"]
+                        if isinstance(result, dict)
+                        else result.html_url
+                    )
+                    if key not in seen:
+                        seen.add(key)
+                        yield result
+
+                if len(items) < per_page or page * per_page >= min(total, SEARCH_CAP):
+                    break
+                page += 1
+
+    @needs_authentication
+    async def search_repositories(
+        cls: Self,
+        query: str,
+        sort: RepositorySearchSort | None = None,
+        order: SearchOrder = "desc",
+        split: RepositorySplit | None = None,
+        per_page: int = 100,
+        mode: ReturnMode = "model",
+    ) -> AsyncIterator[MinimalRepository | MinimalRepositoryJSON]:
+        """
+        Search repositories and stream every match.
+        Available: [https://docs.github.com/en/rest/search/search?apiVersion=2022-11-28#search-repositories](https://docs.github.com/en/rest/search/search?apiVersion=2022-11-28#search-repositories)
+
+        Args:
+            query (str): The search query, e.g. "topic:lego language:python".
+            sort (RepositorySearchSort | None, optional): The sort criterion. Defaults to best match.
+            order (SearchOrder, optional): The sort direction. Defaults to "desc".
+            split (RepositorySplit | None, optional): The qualifier to split the query on when it matches more than 1000 results. Sorting then applies within each range. Defaults to None.
+            per_page (int, optional): The page size, at most 100. Defaults to 100.
+            mode (ReturnMode, optional): Yield models or the decoded JSON. Defaults to "model".
+
+        Yields:
+            MinimalRepository | MinimalRepositoryJSON: Each matching repository, once.
+        """
+        params: dict[str, str | int] = {"order": order}
+        if sort:
+            params["sort"] = sort
+        async for result in cls._search(
+            "repositories", query, MinimalRepository, split, params, per_page, mode
+        ):
+            yield result
+
+    @needs_authentication
+    async def search_users(
+        cls: Self,
+        query: str,
+        sort: UserSearchSort | None = None,
+        order: SearchOrder = "desc",
+        split: UserSplit | None = None,
+        per_page: int = 100,
+        mode: ReturnMode = "model",
+    ) -> AsyncIterator[SimpleUser | SimpleUserJSON]:
+        """
+        Search users and stream every match.
+        Available: [https://docs.github.com/en/rest/search/search?apiVersion=2022-11-28#search-users](https://docs.github.com/en/rest/search/search?apiVersion=2022-11-28#search-users)
+
+        Args:
+            query (str): The search query, e.g. "location:lund type:user".
+            sort (UserSearchSort | None, optional): The sort criterion. Defaults to best match.
+            order (SearchOrder, optional): The sort direction. Defaults to "desc".
+            split (UserSplit | None, optional): The qualifier to split the query on when it matches more than 1000 results. Defaults to None.
+            per_page (int, optional): The page size, at most 100. Defaults to 100.
+            mode (ReturnMode, optional): Yield models or the decoded JSON. Defaults to "model".
+
+        Yields:
+            SimpleUser | SimpleUserJSON: Each matching user, once.
+        """
+        params: dict[str, str | int] = {"order": order}
+        if sort:
+            params["sort"] = sort
+        async for result in cls._search(
+            "users", query, SimpleUser, split, params, per_page, mode
+        ):
+            yield result
+
+    @needs_authentication
+    async def search_code(
+        cls: Self,
+        query: str,
+        split: CodeSplit | None = None,
+        per_page: int = 100,
+        mode: ReturnMode = "model",
+    ) -> AsyncIterator[CodeSearchResult | CodeSearchResultJSON]:
+        """
+        Search code and stream every matching file.
+        Code search has its own, smaller rate limit bucket.
+        Available: [https://docs.github.com/en/rest/search/search?apiVersion=2022-11-28#search-code](https://docs.github.com/en/rest/search/search?apiVersion=2022-11-28#search-code)
+
+        Args:
+            query (str): The search query, e.g. "GitHubPortal in:file language:python".
+            split (CodeSplit | None, optional): Split the query on file size when it matches more than 1000 results. Defaults to None.
+            per_page (int, optional): The page size, at most 100. Defaults to 100.
+            mode (ReturnMode, optional): Yield models or the decoded JSON. Defaults to "model".
+
+        Yields:
+            CodeSearchResult | CodeSearchResultJSON: Each matching file, once.
+        """
+        async for result in cls._search(
+            "code", query, CodeSearchResult, split, {}, per_page, mode
+        ):
+            yield result
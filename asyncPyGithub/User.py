@@ -1,21 +1,24 @@
+from collections.abc import Sequence
 from typing import Final, Literal
 
 from ._types import (
     ErrorMessage,
     FullRepository,
     FullRepositoryJSON,
+    GitHubModel,
     GitHubPortal,
     HoverCard,
-    HoverCardContext,
-    HoverCardContextJSON,
     HoverCardJSON,
     PrivateUser,
+    PrivateUserJSON,
     RepositoryType,
     RepoSortCriterion,
     RepoSortDirection,
+    ReturnMode,
     SimpleUser,
     SimpleUserJSON,
     needs_authentication,
+    project,
 )
 
 UserQueryReturnable = tuple[
@@ -37,7 +40,16 @@ class GitHubUserPortal(GitHubPortal):
         page: int = 1,
         since: str | None = None,
         before: str | None = None,
-    ) -> tuple[int, list[FullRepository] | ErrorMessage]:
+        mode: ReturnMode = "model",
+        fields: Sequence[str] | None = None,
+    ) -> tuple[
+        int,
+        list[FullRepository]
+        | list[GitHubModel]
+        | list[FullRepositoryJSON]
+        | bytes
+        | ErrorMessage,
+    ]:
         """
         Get the authenticated user's repositories.
         This function uses the `/user/repos` endpoint to get the user's repositories.
@@ -51,9 +63,11 @@ class GitHubUserPortal(GitHubPortal):
             page (int, optional): The page number to retrieve. Defaults to 1.
             since (str | None, optional): A timestamp in ISO 8601 format to filter repositories updated after this time. Defaults to None.
             before (str | None, optional): A timestamp in ISO 8601 format to filter repositories updated before this time. Defaults to None.
+            mode (ReturnMode, optional): Return models, the decoded JSON or the raw body. Defaults to "model".
+            fields (Sequence[str] | None, optional): Only parse and keep these fields, as lightweight projection models. Defaults to None.
 
         Returns:
-            tuple[int, list[FullRepository] | ErrorMessage]: A tuple containing the status code and either a list of FullRepository instances or an ErrorMessage.
+            tuple[int, list[FullRepository] | list[FullRepositoryJSON] | bytes | ErrorMessage]: A tuple containing the status code and either the repositories in the requested mode or an ErrorMessage.
         """
         endpoint = f"{USER_ENDPOINT}/repos"
         params = {
@@ -68,6 +82,10 @@ class GitHubUserPortal(GitHubPortal):
         if before:
             params["before"] = before  # type: ignore[assignment]
 
+        try:
+            model = project(FullRepository, fields) if fields else FullRepository
+        except ValueError as e:
+            return (400, ErrorMessage(code=400, message=str(e), endpoint=endpoint))
         try:
             res = await cls.req("GET", endpoint, params=params)  # type: ignore[arg-type]
             if res.status_code != 200:
@@ -80,10 +98,7 @@ class GitHubUserPortal(GitHubPortal):
                     ),
                 )
 
-            repos_json = res.json()
-            repos: list[FullRepository] = [
-                FullRepository(**repo_json) for repo_json in repos_json
-            ]
+            repos = await cls.parse(res, list[model], mode)  # type: ignore[valid-type]
             return (res.status_code, repos)
 
         except Exception as e:
@@ -94,8 +109,8 @@ class GitHubUserPortal(GitHubPortal):
 
     @needs_authentication
     async def update(
-        cls: "GitHubUserPortal", changes: SimpleUserJSON
-    ) -> tuple[int, PrivateUser | ErrorMessage]:
+        cls: "GitHubUserPortal", changes: SimpleUserJSON, mode: ReturnMode = "model"
+    ) -> tuple[int, PrivateUser | PrivateUserJSON | bytes | ErrorMessage]:
         """
         Update the authenticated user's information.
         This function uses the `/user` endpoint to update the user's information.
@@ -119,8 +134,7 @@ class GitHubUserPortal(GitHubPortal):
             but since this is a pydantic model, it uses __slots__,
             so we need to create a new instance with the updated data.
             """
-            updated_json = res.json()
-            updated_self = PrivateUser(**updated_json)
+            updated_self = await cls.parse(res, PrivateUser, mode)
 
         except Exception as e:
             return (500, ErrorMessage(code=500, message=str(e), endpoint=endpoint))
@@ -129,13 +143,14 @@ class GitHubUserPortal(GitHubPortal):
 
     @needs_authentication
     async def get_by_id(
-        cls: "GitHubUserPortal", uid: int
-    ) -> tuple[int, PrivateUser | ErrorMessage]:
+        cls: "GitHubUserPortal", uid: int, mode: ReturnMode = "model"
+    ) -> tuple[int, PrivateUser | PrivateUserJSON | bytes | ErrorMessage]:
         """
         Get a user by their ID.
         This function uses the `/users/{user_id}` endpoint to get the user's information.
         Args:
             uid (int): The ID of the user to retrieve.
+            mode (ReturnMode, optional): Return a model, the decoded JSON or the raw body. Defaults to "model".
         Returns:
             tuple[int, PrivateUser | ErrorMessage]: A tuple containing the status code and either the
         """
@@ -152,18 +167,17 @@ class GitHubUserPortal(GitHubPortal):
                     ),
                 )
 
+            return (res.status_code, await cls.parse(res, PrivateUser, mode))
         except Exception as e:
             return (
                 500,
                 ErrorMessage(code=500, message=str(e), endpoint=endpoint),
             )
 
-        return (res.status_code, PrivateUser(**res.json()))
-
     @needs_authentication
     async def get_by_username(
-        cls: "GitHubUserPortal", username: str
-    ) -> tuple[int, PrivateUser | ErrorMessage]:
+        cls: "GitHubUserPortal", username: str, mode: ReturnMode = "model"
+    ) -> tuple[int, PrivateUser | PrivateUserJSON | bytes | ErrorMessage]:
         endpoint = f"{USERS_ENDPOINT}/{username}"
         try:
             res = await cls.req("GET", endpoint)
@@ -177,7 +191,7 @@ class GitHubUserPortal(GitHubPortal):
                     ),
                 )
 
-            return (res.status_code, PrivateUser(**res.json()))
+            return (res.status_code, await cls.parse(res, PrivateUser, mode))
         except Exception as e:
             return (
                 500,
@@ -186,8 +200,11 @@ class GitHubUserPortal(GitHubPortal):
 
     @needs_authentication
     async def all(
-        cls: "GitHubUserPortal", since: int = 0, per_page: int = 30
-    ) -> tuple[int, list[SimpleUser] | ErrorMessage]:
+        cls: "GitHubUserPortal",
+        since: int = 0,
+        per_page: int = 30,
+        mode: ReturnMode = "model",
+    ) -> tuple[int, list[SimpleUser] | list[SimpleUserJSON] | bytes | ErrorMessage]:
         try:
             res = await cls.req(
                 "GET",
@@ -204,18 +221,17 @@ class GitHubUserPortal(GitHubPortal):
                     ),
                 )
 
+            return (res.status_code, await cls.parse(res, list[SimpleUser], mode))
         except Exception as e:
             return (
                 500,
                 ErrorMessage(code=500, message=str(e), endpoint=USERS_ENDPOINT),
             )
 
-        return (res.status_code, [SimpleUser(**user) for user in res.json()])
-
     @needs_authentication
     async def get_hovercard(
-        cls: "GitHubUserPortal", username: str
-    ) -> tuple[int, HoverCard | ErrorMessage]:
+        cls: "GitHubUserPortal", username: str, mode: ReturnMode = "model"
+    ) -> tuple[int, HoverCard | HoverCardJSON | bytes | ErrorMessage]:
         """
         Get the hovercard information for a user.
         This function uses the `/users/{username}/hovercard` endpoint to get the hovercard information.
@@ -234,12 +250,7 @@ class GitHubUserPortal(GitHubPortal):
                     ),
                 )
 
-            cardjson: HoverCardJSON = res.json()
-            contexts: list[HoverCardContextJSON] = cardjson.get("contexts", [])
-            contexts_checked: list[HoverCardContext] = [
-                HoverCardContext(**context) for context in contexts
-            ]
-            return (res.status_code, HoverCard(contexts=contexts_checked))
+            return (res.status_code, await cls.parse(res, HoverCard, mode))
 
         except Exception as e:
             return (
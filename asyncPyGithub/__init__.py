@@ -1,18 +1,74 @@
-from ._types import (
-    ErrorMessage,
-    GitHubPortal,
-    JSONDict,
-    MinimalRepository,
-    MinimalRepositoryJSON,
-    PrivateUser,
-    PrivateUserJSON,
-    SimpleUser,
-    SimpleUserJSON,
-    UserPlanJSON,
-)
-from .base import CACHE_DIR, read_json, write_json
-from .Repository import GitHubRepositoryPortal
-from .User import GitHubUserPortal, UserQueryReturnable
+"""
+Submodules are imported on first attribute access (PEP 562), so `import asyncPyGithub`
+stays cheap and free of side effects until a portal or model is actually used.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from ._types import (
+        ErrorMessage,
+        GitHubPortal,
+        JSONDict,
+        MinimalRepository,
+        MinimalRepositoryJSON,
+        PrivateUser,
+        PrivateUserJSON,
+        ReturnMode,
+        SimpleUser,
+        SimpleUserJSON,
+        UserPlanJSON,
+    )
+    from .apps import GitHubApp
+    from .archive import ArchiveFormat
+    from .base import CACHE_DIR, load_environment, read_json, write_json
+    from .breaker import CircuitBreaker
+    from .cache import ImmutableStore, ResponseCache, SharedCache
+    from .Events import GitHubEventsPortal
+    from .executor import CrawlExecutor
+    from .hedging import Hedger
+    from .pipeline import Pipeline, StageStats
+    from .planning import CostEstimate, Forecast, QuotaPlanner
+    from .Repository import GitHubRepositoryPortal
+    from .scheduling import AdaptiveLimiter, QuotaBroker
+    from .Search import GitHubSearchPortal
+    from .User import GitHubUserPortal, UserQueryReturnable
+    from .webhooks import WebhookDispatcher, WebhookSignatureError
+
+_EXPORTS: dict[str, tuple[str, ...]] = {
+    "._types": (
+        "ErrorMessage",
+        "GitHubPortal",
+        "JSONDict",
+        "MinimalRepository",
+        "MinimalRepositoryJSON",
+        "PrivateUser",
+        "PrivateUserJSON",
+        "ReturnMode",
+        "SimpleUser",
+        "SimpleUserJSON",
+        "UserPlanJSON",
+    ),
+    ".apps": ("GitHubApp",),
+    ".archive": ("ArchiveFormat",),
+    ".base": ("CACHE_DIR", "load_environment", "read_json", "write_json"),
+    ".breaker": ("CircuitBreaker",),
+    ".cache": ("ImmutableStore", "ResponseCache", "SharedCache"),
+    ".Events": ("GitHubEventsPortal",),
+    ".executor": ("CrawlExecutor",),
+    ".hedging": ("Hedger",),
+    ".pipeline": ("Pipeline", "StageStats"),
+    ".planning": ("CostEstimate", "Forecast", "QuotaPlanner"),
+    ".Repository": ("GitHubRepositoryPortal",),
+    ".scheduling": ("AdaptiveLimiter", "QuotaBroker"),
+    ".Search": ("GitHubSearchPortal",),
+    ".User": ("GitHubUserPortal", "UserQueryReturnable"),
+    ".webhooks": ("WebhookDispatcher", "WebhookSignatureError"),
+}
+_LAZY: dict[str, str] = {
+    name: module for module, names in _EXPORTS.items() for name in names
+}
 
 __all__ = (
     "GitHubPortal",
@@ -24,11 +80,45 @@ __all__ = (
     "PrivateUserJSON",
     "PrivateUser",
     "JSONDict",
+    "ReturnMode",
+    "ArchiveFormat",
     "write_json",
     "read_json",
+    "load_environment",
     "CACHE_DIR",
     "MinimalRepositoryJSON",
     "MinimalRepository",
     "GitHubUserPortal",
     "GitHubRepositoryPortal",
+    "GitHubSearchPortal",
+    "GitHubEventsPortal",
+    "GitHubApp",
+    "Pipeline",
+    "StageStats",
+    "CrawlExecutor",
+    "QuotaBroker",
+    "AdaptiveLimiter",
+    "Hedger",
+    "QuotaPlanner",
+    "CostEstimate",
+    "Forecast",
+    "ImmutableStore",
+    "ResponseCache",
+    "SharedCache",
+    "CircuitBreaker",
+    "WebhookDispatcher",
+    "WebhookSignatureError",
 )
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
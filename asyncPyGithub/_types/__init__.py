@@ -1,48 +1,236 @@
-from .base import (
-    ErrorMessage,
-    GitHubPortal,
-    JSONDict,
-    needs_authentication,
-)
-from .content import (
-    ContentLink,
-    ContentLinkJSON,
-    ContentNode,
-    ContentNodeJSON,
-    ContentTree,
-    ContentTreeJSON,
-)
-from .repos import (
-    Commit,
-    FullRepository,
-    FullRepositoryJSON,
-    MinimalRepository,
-    MinimalRepositoryJSON,
-    RepositoryType,
-    RepoSortCriterion,
-    RepoSortDirection,
-    RepoVisibility,
-    Tag,
-    Topics,
-    TopicsJSON,
-)
-from .users import (
-    Contributor,
-    ContributorJSON,
-    HoverCard,
-    HoverCardContext,
-    HoverCardContextJSON,
-    HoverCardJSON,
-    PrivateUser,
-    PrivateUserJSON,
-    SimpleUser,
-    SimpleUserJSON,
-    UserPlanJSON,
-)
+"""
+Models and the base portal are imported on first access, see the package `__init__`.
+"""
+
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .apps import InstallationToken, InstallationTokenJSON
+    from .base import (
+        ErrorMessage,
+        GitHubPortal,
+        JSONDict,
+        ReturnMode,
+        needs_authentication,
+    )
+    from .content import (
+        ContentLink,
+        ContentNode,
+        ContentTree,
+    )
+    from .events import (
+        EventActor,
+        EventActorJSON,
+        EventRepository,
+        EventRepositoryJSON,
+        GitHubEvent,
+        GitHubEventJSON,
+        CreateEvent,
+        DeleteEvent,
+        PingEvent,
+        PushCommit,
+        PushEvent,
+        Pusher,
+        RefType,
+        RepositoryAction,
+        RepositoryEvent,
+        WebhookEvent,
+        WebhookEventName,
+    )
+    from .generated import (
+        CommitJSON,
+        ContentLinkJSON,
+        ContentNodeJSON,
+        ContentTreeJSON,
+        ContentTreeRecord,
+        ContributorJSON,
+        ContributorRecord,
+        FullRepositoryJSON,
+        FullRepositoryRecord,
+        TagJSON,
+        TagRecord,
+    )
+    from .git import (
+        FileChanges,
+        GitActor,
+        GitActorJSON,
+        GitBlob,
+        GitBlobJSON,
+        GitCommit,
+        GitCommitJSON,
+        GitParent,
+        GitParentJSON,
+        GitReference,
+        GitReferenceJSON,
+        GitTree,
+        GitTreeEntry,
+        GitTreeEntryJSON,
+        GitTreeJSON,
+    )
+    from .model import GitHubModel, IdentityMap, InternScope, interning, project
+    from .ratelimit import (
+        RateLimit,
+        RateLimitJSON,
+        RateLimitOverview,
+        RateLimitOverviewJSON,
+    )
+    from .record import LazyRecord
+    from .repos import (
+        Commit,
+        FullRepository,
+        MinimalRepository,
+        MinimalRepositoryJSON,
+        RepositoryType,
+        RepoSortCriterion,
+        RepoSortDirection,
+        RepoVisibility,
+        Tag,
+        Topics,
+        TopicsJSON,
+    )
+    from .search import (
+        CodeSearchResult,
+        CodeSearchResultJSON,
+        CodeSplit,
+        RepositorySearchSort,
+        RepositorySplit,
+        SearchOrder,
+        SearchResults,
+        SearchResultsJSON,
+        UserSearchSort,
+        UserSplit,
+    )
+    from .users import (
+        Contributor,
+        HoverCard,
+        HoverCardContext,
+        HoverCardContextJSON,
+        HoverCardJSON,
+        PrivateUser,
+        PrivateUserJSON,
+        SimpleUser,
+        SimpleUserJSON,
+        UserPlanJSON,
+    )
+
+_EXPORTS: dict[str, tuple[str, ...]] = {
+    ".apps": ("InstallationToken", "InstallationTokenJSON"),
+    ".base": (
+        "ErrorMessage",
+        "GitHubPortal",
+        "JSONDict",
+        "ReturnMode",
+        "needs_authentication",
+    ),
+    ".content": (
+        "ContentLink",
+        "ContentNode",
+        "ContentTree",
+    ),
+    ".events": (
+        "EventActor",
+        "EventActorJSON",
+        "EventRepository",
+        "EventRepositoryJSON",
+        "GitHubEvent",
+        "GitHubEventJSON",
+        "CreateEvent",
+        "DeleteEvent",
+        "PingEvent",
+        "PushCommit",
+        "PushEvent",
+        "Pusher",
+        "RefType",
+        "RepositoryAction",
+        "RepositoryEvent",
+        "WebhookEvent",
+        "WebhookEventName",
+    ),
+    ".generated": (
+        "CommitJSON",
+        "ContentLinkJSON",
+        "ContentNodeJSON",
+        "ContentTreeJSON",
+        "ContentTreeRecord",
+        "ContributorJSON",
+        "ContributorRecord",
+        "FullRepositoryJSON",
+        "FullRepositoryRecord",
+        "TagJSON",
+        "TagRecord",
+    ),
+    ".git": (
+        "FileChanges",
+        "GitActor",
+        "GitActorJSON",
+        "GitBlob",
+        "GitBlobJSON",
+        "GitCommit",
+        "GitCommitJSON",
+        "GitParent",
+        "GitParentJSON",
+        "GitReference",
+        "GitReferenceJSON",
+        "GitTree",
+        "GitTreeEntry",
+        "GitTreeEntryJSON",
+        "GitTreeJSON",
+    ),
+    ".model": ("GitHubModel", "IdentityMap", "InternScope", "interning", "project"),
+    ".ratelimit": (
+        "RateLimit",
+        "RateLimitJSON",
+        "RateLimitOverview",
+        "RateLimitOverviewJSON",
+    ),
+    ".record": ("LazyRecord",),
+    ".repos": (
+        "Commit",
+        "FullRepository",
+        "MinimalRepository",
+        "MinimalRepositoryJSON",
+        "RepositoryType",
+        "RepoSortCriterion",
+        "RepoSortDirection",
+        "RepoVisibility",
+        "Tag",
+        "Topics",
+        "TopicsJSON",
+    ),
+    ".search": (
+        "CodeSearchResult",
+        "CodeSearchResultJSON",
+        "CodeSplit",
+        "RepositorySearchSort",
+        "RepositorySplit",
+        "SearchOrder",
+        "SearchResults",
+        "SearchResultsJSON",
+        "UserSearchSort",
+        "UserSplit",
+    ),
+    ".users": (
+        "Contributor",
+        "HoverCard",
+        "HoverCardContext",
+        "HoverCardContextJSON",
+        "HoverCardJSON",
+        "PrivateUser",
+        "PrivateUserJSON",
+        "SimpleUser",
+        "SimpleUserJSON",
+        "UserPlanJSON",
+    ),
+}
+_LAZY: dict[str, str] = {
+    name: module for module, names in _EXPORTS.items() for name in names
+}
 
 __all__ = (
     "ErrorMessage",
     "JSONDict",
+    "ReturnMode",
     "UserPlanJSON",
     "PrivateUserJSON",
     "PrivateUser",
@@ -74,4 +262,77 @@ __all__ = (
     "ContentNodeJSON",
     "ContentTree",
     "ContentTreeJSON",
+    "CommitJSON",
+    "TagJSON",
+    "GitHubModel",
+    "project",
+    "IdentityMap",
+    "InternScope",
+    "interning",
+    "SearchOrder",
+    "RepositorySearchSort",
+    "UserSearchSort",
+    "RepositorySplit",
+    "UserSplit",
+    "CodeSplit",
+    "SearchResultsJSON",
+    "SearchResults",
+    "CodeSearchResultJSON",
+    "CodeSearchResult",
+    "LazyRecord",
+    "ContentTreeRecord",
+    "ContributorRecord",
+    "FullRepositoryRecord",
+    "TagRecord",
+    "FileChanges",
+    "GitActor",
+    "GitActorJSON",
+    "GitCommit",
+    "GitCommitJSON",
+    "GitParent",
+    "GitParentJSON",
+    "GitReference",
+    "GitReferenceJSON",
+    "GitBlob",
+    "GitBlobJSON",
+    "GitTree",
+    "GitTreeEntry",
+    "GitTreeEntryJSON",
+    "GitTreeJSON",
+    "CreateEvent",
+    "DeleteEvent",
+    "PingEvent",
+    "PushCommit",
+    "PushEvent",
+    "Pusher",
+    "RefType",
+    "RepositoryAction",
+    "RepositoryEvent",
+    "WebhookEvent",
+    "WebhookEventName",
+    "EventActor",
+    "EventActorJSON",
+    "EventRepository",
+    "EventRepositoryJSON",
+    "GitHubEvent",
+    "GitHubEventJSON",
+    "RateLimit",
+    "RateLimitJSON",
+    "RateLimitOverview",
+    "RateLimitOverviewJSON",
+    "InstallationToken",
+    "InstallationTokenJSON",
 )
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,32 @@
+from datetime import datetime
+from typing import (
+    Dict,
+    Literal,
+    Optional,
+    TypedDict,
+)
+
+from .model import GitHubModel
+
+
+class InstallationTokenJSON(TypedDict):
+    token: str
+    expires_at: str
+    permissions: Dict[str, str]
+    repository_selection: Optional[Literal["all", "selected"]]
+
+
+class InstallationToken(GitHubModel):
+    """
+    An access token for one installation of a GitHub App, valid for an hour.
+    Attributes:
+        token (str): The bearer token.
+        expires_at (datetime): When the token stops working.
+        permissions (dict[str, str]): The permissions granted, e.g. {"contents": "read"}.
+        repository_selection (str | None): Whether the token covers "all" or "selected" repositories.
+    """
+
+    token: str
+    expires_at: datetime
+    permissions: Dict[str, str] = {}
+    repository_selection: Optional[Literal["all", "selected"]] = None
@@ -1,18 +1,121 @@
 from __future__ import annotations
 
-from asyncio import Lock
+from asyncio import (
+    FIRST_COMPLETED,
+    Future,
+    Lock,
+    create_task,
+    gather,
+    get_running_loop,
+    timeout,
+    wait,
+)
+from collections.abc import AsyncIterator
 from collections.abc import Coroutine as CoroutineType
-from contextlib import asynccontextmanager
+from collections.abc import Generator
+from concurrent.futures import Executor, ProcessPoolExecutor
+from contextlib import asynccontextmanager, contextmanager, nullcontext
+from functools import lru_cache, partial
+from hashlib import sha256
+from importlib.util import find_spec
+from inspect import isasyncgenfunction
+from json import loads
+from multiprocessing import get_context
+from time import monotonic, perf_counter
 
-from httpx import AsyncClient, Limits, Response
+from httpx import AsyncClient, Limits, Request, Response, TransportError
 from httpx._types import HeaderTypes
-from pydantic import EmailStr, HttpUrl, PastDatetime
-from typing_extensions import Any, AsyncGenerator, Callable, Final, Literal, Self, cast
+from pydantic import EmailStr, HttpUrl, PastDatetime, TypeAdapter
+from typing_extensions import (
+    TYPE_CHECKING,
+    Any,
+    AsyncGenerator,
+    Callable,
+    Final,
+    Literal,
+    Self,
+    TypeVar,
+    cast,
+    overload,
+)
 
+from ..base import LOGGER
+from ..breaker import CircuitBreaker
+from ..cache import MISSING_STATUSES, ResponseCache, cache_key
+from ..hedging import Hedger
+from ..scheduling import (
+    CURRENT_DEADLINE,
+    CURRENT_PRIORITY,
+    AdaptiveLimiter,
+    Priority,
+    QuotaBroker,
+    RateLimitState,
+    RequestScheduler,
+    overloaded,
+    time_left,
+)
+from .model import IdentityMap, InternScope, ProjectionSpec, interning, portable
+from .ratelimit import RateLimitOverview, RateLimitOverviewJSON
 from .users import PrivateUser
 
+if TYPE_CHECKING:
+    from ..transport import CachingResolver
+
 JSONDict = dict[str, str | int | bool | EmailStr | HttpUrl | PastDatetime | None]
 
+T = TypeVar("T")
+
+ReturnMode = Literal["model", "dict", "bytes"]
+"""
+How portal methods hand back a successful response body.
+`model` validates it into the response models, `dict` returns the decoded JSON
+(shaped like the matching `*JSON` TypedDict) and `bytes` returns the body untouched.
+Error responses are always an `ErrorMessage`.
+"""
+
+
+@lru_cache(maxsize=None)
+def _adapter(target: Any) -> TypeAdapter[Any]:
+    return TypeAdapter(target)
+
+
+def validate_json(
+    target: type[T] | ProjectionSpec, body: bytes, intern: bool = False
+) -> T:
+    """
+    Decode and validate a raw JSON body in one pass.
+    Module level so it can be sent to a worker process.
+    Args:
+        target (type[T] | ProjectionSpec): A model or type form such as `list[MinimalRepository]`, or a projection spec to rebuild.
+        body (bytes): The raw response body.
+        intern (bool, optional): Share repeated nested owners and licenses within the body. Defaults to False.
+    Returns:
+        T: The validated value.
+    """
+    if isinstance(target, ProjectionSpec):
+        target = target.build()
+    with interning() if intern else nullcontext():
+        return cast(T, _adapter(cast(Any, target)).validate_json(body))
+
+
+def _token_principal(token: str) -> str:
+    # Stands in for the account behind a token until, or unless, it is known.
+    return f"token:{sha256(token.encode()).hexdigest()[:32]}"
+
+
+def _deadline_exceeded(request: Request) -> Response:
+    """
+    The 504 returned in place of a request the deadline ran out on.
+    """
+    return Response(
+        504,
+        headers={"x-deadline": "exceeded"},
+        json={
+            "message": f"Deadline exceeded before {request.method} {request.url.path} completed"
+        },
+        request=request,
+    )
+
 
 class ErrorMessage:
     """
@@ -76,6 +179,23 @@ class GitHubPortal:
         "Authorization": None,
     }
     _user: PrivateUser | None = None
+    _principal: str = ""
+    _pool_size: Final[int] = 20
+    _keepalive_size: Final[int] = 10
+    _http2: bool = False
+    _resolver: CachingResolver | None = None
+    _scheduler: RequestScheduler = RequestScheduler(capacity=_pool_size)
+    _quota: QuotaBroker | None = None
+    _offload_threshold: int | None = None
+    _offload_executor: Executor | None = None
+    _owns_offload_executor: bool = False
+    _intern_scope: InternScope | None = "response"
+    _identity_map: IdentityMap = IdentityMap()
+    _cache: ResponseCache | None = None
+    _breaker: CircuitBreaker | None = None
+    _limiter: AdaptiveLimiter | None = None
+    _hedger: Hedger | None = None
+    _timeouts: dict[str, float] = {}
 
     __slots__ = ()
 
@@ -90,23 +210,92 @@ class GitHubPortal:
     @classmethod
     async def start(
         cls: type["GitHubPortal"],
+        http2: bool | None = None,
     ) -> None:
         """
         Initializes the asynchronous HTTP client session.
+        Args:
+            http2 (bool | None, optional): Negotiate HTTP/2 for the session; needs the `h2` package. Defaults to the last setting, initially off.
         """
+        if http2 is not None:
+            if http2 and find_spec("h2") is None:
+                LOGGER.warning("start:::HTTP/2 needs the 'h2' package, using HTTP/1.1")
+                http2 = False
+            GitHubPortal._http2 = http2
+
+        from ..transport import build_transport
+
         async with cls._connection_lock:
             if cls._client is None:
-                cls._client = AsyncClient(
+                limits = Limits(
+                    max_connections=cls._pool_size,
+                    max_keepalive_connections=cls._keepalive_size,
+                )
+                # Set on the base class, so every portal shares the client and token changes reach it.
+                GitHubPortal._client = AsyncClient(
                     base_url=cls._endpoint,
-                    headers=cast(HeaderTypes, cls._headers),
-                    timeout=30,
-                    http2=False,  # Disable HTTP/2
-                    limits=Limits(
-                        max_connections=20,
-                        max_keepalive_connections=10,
+                    headers=cast(
+                        HeaderTypes,
+                        {k: v for k, v in cls._headers.items() if v is not None},
                     ),
+                    timeout=30,
+                    http2=cls._http2,
+                    limits=limits,
+                    transport=build_transport(limits, cls._http2, cls.resolver()),
                 )
 
+    @classmethod
+    def resolver(cls: type["GitHubPortal"]) -> CachingResolver:
+        """
+        The DNS cache shared by every connection the portal opens.
+        Created on first use, so importing the package does not import httpcore.
+        """
+        from ..transport import CachingResolver
+
+        if GitHubPortal._resolver is None:
+            GitHubPortal._resolver = CachingResolver()
+        return GitHubPortal._resolver
+
+    @classmethod
+    async def warm_up(
+        cls: type["GitHubPortal"],
+        connections: int = 10,
+        http2: bool | None = None,
+    ) -> tuple[int, float | ErrorMessage]:
+        """
+        Start the client and open keep-alive connections before the first real request,
+        so a burst of calls does not pay DNS, TCP and TLS setup on the critical path.
+        The connections are opened with concurrent `/rate_limit` requests, which do not count against the rate limit.
+        Args:
+            connections (int, optional): The number of connections to open, capped at the keep-alive pool size. Defaults to 10.
+            http2 (bool | None, optional): Negotiate HTTP/2 for the session. Defaults to the last setting.
+        Returns:
+            tuple[int, float | ErrorMessage]: A tuple containing the status code and either the seconds until the pool was ready or an ErrorMessage.
+        """
+        began = perf_counter()
+        endpoint = "/rate_limit"
+        try:
+            await cls.start(http2=http2)
+            if cls._client is None:
+                raise RuntimeError("HTTP client is not initialized.")
+
+            url = cls._client.base_url
+            await cls.resolver().resolve(url.host, url.port or 443)
+
+            count = max(1, min(connections, cls._keepalive_size))
+            responses = await gather(
+                *(cls._client.request("GET", endpoint) for _ in range(count))
+            )
+        except Exception as e:
+            return (500, ErrorMessage(code=500, message=str(e), endpoint=endpoint))
+
+        for response in responses:
+            cls._scheduler.observe(response.headers)
+
+        elapsed = perf_counter() - began
+        LOGGER.info(f"warm_up:::{count} connections ready in {elapsed:.3f}s")
+        return (200, elapsed)
+
     @classmethod
     async def close(
         cls: type["GitHubPortal"],
@@ -117,7 +306,168 @@ class GitHubPortal:
         async with cls._connection_lock:
             if cls._client is not None:
                 await cls._client.aclose()
-                cls._client = None
+                GitHubPortal._client = None
+
+    @classmethod
+    def offload_validation(
+        cls: type["GitHubPortal"],
+        threshold: int | None = 256 * 1024,
+        executor: Executor | None = None,
+    ) -> None:
+        """
+        Decode and validate response bodies of at least `threshold` bytes in a worker pool
+        instead of on the event loop, so large pages do not stall other in-flight requests.
+        Args:
+            threshold (int | None, optional): The body size in bytes from which to offload. None turns offloading off. Defaults to 256 KiB.
+            executor (Executor | None, optional): The pool to use. Defaults to a process pool fed the raw bytes, owned by the portal.
+        """
+        if cls._owns_offload_executor and cls._offload_executor is not None:
+            cls._offload_executor.shutdown(wait=False, cancel_futures=True)
+
+        GitHubPortal._offload_threshold = threshold
+        GitHubPortal._owns_offload_executor = threshold is not None and executor is None
+        if threshold is None:
+            GitHubPortal._offload_executor = None
+        elif executor is None:
+            GitHubPortal._offload_executor = ProcessPoolExecutor(
+                mp_context=get_context("spawn")
+            )
+        else:
+            GitHubPortal._offload_executor = executor
+
+    @classmethod
+    def intern_nested(
+        cls: type["GitHubPortal"], scope: InternScope | None = "response"
+    ) -> None:
+        """
+        Share one instance between repeated nested owners (`SimpleUser`, by `id`) and
+        licenses (`License`, by `key`) instead of validating and storing each copy.
+        Shared instances are the first one seen, so treat them as read-only.
+        Args:
+            scope (InternScope | None, optional): `response` shares within one body, `session` across
+            every response until the next call, and None turns interning off. Defaults to "response".
+        """
+        GitHubPortal._intern_scope = scope
+        GitHubPortal._identity_map = IdentityMap()
+
+    @classmethod
+    def use_cache(
+        cls: type["GitHubPortal"], cache: ResponseCache | None = None
+    ) -> ResponseCache | None:
+        """
+        Serve GET requests from a response cache, revalidating stale entries with their ETag.
+        Args:
+            cache (ResponseCache | None, optional): The cache to use, or None to stop caching. Defaults to None.
+        Returns:
+            ResponseCache | None: The cache in use.
+        """
+        GitHubPortal._cache = cache
+        return cache
+
+    @classmethod
+    def cache(cls: type["GitHubPortal"]) -> ResponseCache | None:
+        """
+        The response cache in use, if any.
+        """
+        return cls._cache
+
+    @classmethod
+    def use_limiter(
+        cls: type["GitHubPortal"], limiter: AdaptiveLimiter | None
+    ) -> AdaptiveLimiter | None:
+        """
+        Let the number of concurrent requests adapt to how GitHub is responding, or with None, go back to one slot per pooled connection.
+        Args:
+            limiter (AdaptiveLimiter | None): The limiter every portal shares.
+        Returns:
+            AdaptiveLimiter | None: The limiter, whose `concurrency` is the current limit.
+        """
+        GitHubPortal._limiter = limiter
+        GitHubPortal._scheduler.resize(
+            cls._pool_size if limiter is None else limiter.concurrency
+        )
+        return limiter
+
+    @classmethod
+    def use_hedging(cls: type["GitHubPortal"], hedger: Hedger | None) -> Hedger | None:
+        """
+        Send a duplicate of GET requests that are slower than usual and take the first answer, or stop doing so with None.
+        Args:
+            hedger (Hedger | None): The hedging policy and budget every portal shares.
+        Returns:
+            Hedger | None: The hedger, for its counters.
+        """
+        GitHubPortal._hedger = hedger
+        return hedger
+
+    @classmethod
+    def use_breaker(
+        cls: type["GitHubPortal"], breaker: CircuitBreaker | None
+    ) -> CircuitBreaker | None:
+        """
+        Fail requests at once while their endpoint family keeps failing, or stop doing so with None.
+        Args:
+            breaker (CircuitBreaker | None): The breaker every portal shares.
+        Returns:
+            CircuitBreaker | None: The breaker, for inspecting circuit states.
+        """
+        GitHubPortal._breaker = breaker
+        return breaker
+
+    @overload
+    @classmethod
+    async def parse(
+        cls: type["GitHubPortal"],
+        res: Response,
+        target: type[T],
+        mode: Literal["model"] = "model",
+    ) -> T: ...
+
+    @overload
+    @classmethod
+    async def parse(
+        cls: type["GitHubPortal"], res: Response, target: type[T], mode: ReturnMode
+    ) -> T | Any: ...
+
+    @classmethod
+    async def parse(
+        cls: type["GitHubPortal"],
+        res: Response,
+        target: type[T],
+        mode: ReturnMode = "model",
+    ) -> T | Any:
+        """
+        Decode and validate a response body against a model or type form.
+        Bodies above the `offload_validation` threshold are handled in the worker pool.
+        Args:
+            res (Response): The response to parse.
+            target (type[T]): A model or type form such as `list[MinimalRepository]`.
+            mode (ReturnMode, optional): `dict` skips validation and `bytes` skips decoding too. Defaults to "model".
+        Returns:
+            T | Any: The validated value, the decoded JSON or the raw body.
+        """
+        body = res.content
+        if mode == "bytes":
+            return body
+        if mode == "dict":
+            return loads(body)
+
+        scope = cls._intern_scope
+        threshold = cls._offload_threshold
+        if threshold is None or len(body) < threshold:
+            if scope == "session":
+                with interning(cls._identity_map):
+                    return validate_json(target, body)
+            return validate_json(target, body, scope is not None)
+
+        # Worker pools cannot see the session map, so share within the body only.
+        return await get_running_loop().run_in_executor(
+            cls._offload_executor,
+            validate_json,
+            portable(target),
+            body,
+            scope is not None,
+        )
 
     @property
     def user(self: Self) -> PrivateUser | None:
@@ -144,18 +494,86 @@ class GitHubPortal:
         finally:
             await cls.close()
 
+    @classmethod
+    @contextmanager
+    def priority(
+        cls: type["GitHubPortal"],
+        lane: Priority,
+    ) -> Generator[None, None, None]:
+        """
+        Context manager that schedules every request made inside it in the given lane.
+        Tasks created inside the block (e.g. by `asyncio.gather`) inherit the lane.
+        Args:
+            lane (Priority): The priority lane to use.
+        """
+        token = CURRENT_PRIORITY.set(lane)
+        try:
+            yield
+        finally:
+            CURRENT_PRIORITY.reset(token)
+
+    @classmethod
+    @contextmanager
+    def deadline(
+        cls: type["GitHubPortal"],
+        seconds: float,
+    ) -> Generator[None, None, None]:
+        """
+        Context manager that bounds every request made inside it, however deeply nested, to finish within `seconds`.
+        Quota and slot waits count against the deadline, and waits that would outlast it fail at once.
+        Requests that run out of time return a 504 with an `X-Deadline: exceeded` header, so portal methods return `(504, ErrorMessage)`.
+        Nested deadlines can only shorten the enclosing one. Tasks created inside the block inherit it.
+        Args:
+            seconds (float): The time budget.
+        """
+        current = CURRENT_DEADLINE.get()
+        deadline = monotonic() + seconds
+        token = CURRENT_DEADLINE.set(
+            deadline if current is None else min(current, deadline)
+        )
+        try:
+            yield
+        finally:
+            CURRENT_DEADLINE.reset(token)
+
+    @classmethod
+    def set_timeout(
+        cls: type["GitHubPortal"], method: str, seconds: float | None
+    ) -> None:
+        """
+        Run every call of a portal method under its own deadline, e.g. `set_timeout("get_repo_content", 1.5)`.
+        Streaming methods, such as searches, get the budget for each item they yield instead.
+        The enclosing `deadline()`, if shorter, still applies.
+        Args:
+            method (str): The portal method name.
+            seconds (float | None): The time budget per call, or None to remove it.
+        """
+        if seconds is None:
+            GitHubPortal._timeouts.pop(method, None)
+        else:
+            GitHubPortal._timeouts[method] = seconds
+
     @classmethod
     async def req(
         cls: type["GitHubPortal"],
         method: Literal["GET", "POST", "PUT", "DELETE", "PATCH", "HEAD", "OPTIONS"],
         url: str,
+        priority: Priority | None = None,
+        resource: str = "core",
+        cached: bool = True,
+        stale: bool = True,
         **kwargs: JSONDict,
     ) -> Response:
         """
         Makes an asynchronous HTTP request to the Github API.
+        The request waits for a connection slot in its priority lane before it is sent.
         Args:
             method (str): The HTTP method to use (e.g., 'GET', 'POST').
             url (str): The endpoint URL to which the request will be made.
+            priority (Priority | None, optional): The lane to schedule the request in. Defaults to the lane set by `priority()`, or "normal".
+            resource (str, optional): The rate limit bucket the request counts against, e.g. "search". Defaults to "core".
+            cached (bool, optional): Let a GET use the response cache, if one is set. Defaults to True.
+            stale (bool, optional): Let a GET be answered from an entry in the cache's stale-while-revalidate window. Defaults to True.
             **kwargs: Additional keyword arguments to pass to the request.
         Returns:
             Response: The response object returned by the request.
@@ -168,10 +586,346 @@ class GitHubPortal:
         if cls._client is None:
             raise RuntimeError("HTTP client is not initialized.")
 
-        response = await cls._client.request(method, url, **kwargs)  # type: ignore[arg-type]
+        cache, key, entry, who = cls._cache if cached else None, "", None, ""
+        if cache is not None:
+            if method != "GET":
+                cache.invalidate(url)
+                cache = None
+            else:
+                headers = cast(dict[str, str], kwargs.get("headers") or {})
+                key = cache_key(
+                    url,
+                    cast(dict[str, object] | None, kwargs.get("params")),
+                    headers.get("accept"),
+                )
+                who = cls._principal
+                entry = cache.get(key, who)
+                if entry is not None and entry.fresh:
+                    return entry.response(cls._client.build_request(method, url, **kwargs))  # type: ignore[arg-type]
+                if entry is not None and stale and cache.serves_stale(entry):
+
+                    async def revalidate() -> None:
+                        # A background refresh is not bound by its first reader's deadline.
+                        CURRENT_DEADLINE.set(None)
+                        await cls.req(method, url, "bulk", resource, stale=False, **kwargs)  # type: ignore[arg-type]
+
+                    cache.refresh(key, revalidate, who)
+                    return entry.response(cls._client.build_request(method, url, **kwargs))  # type: ignore[arg-type]
+                if entry is not None and entry.etag is not None:
+                    kwargs["headers"] = {**headers, "if-none-match": entry.etag}
+
+        budget = time_left()
+        if budget is not None and budget <= 0:
+            return _deadline_exceeded(cls._client.build_request(method, url, **kwargs))  # type: ignore[arg-type]
+
+        breaker, family, family_closed = cls._breaker, "", True
+        if breaker is not None:
+            family = breaker.family(url)
+            # Probes of a half-open circuit are not hedged, they are counted one by one.
+            family_closed = breaker.state(family) == "closed"
+            if not breaker.allow(family):
+                request = cls._client.build_request(method, url, **kwargs)  # type: ignore[arg-type]
+                if entry is not None and breaker.fallback:
+                    return entry.response(request)
+                return breaker.rejection(family, request)
 
+        try:
+            # Waits for quota and for a slot count against the deadline too.
+            send = partial(
+                cls._send,
+                cls._client,
+                method,
+                url,
+                priority,
+                resource,
+                breaker,
+                family,
+                kwargs,
+            )
+            async with timeout(budget):
+                hedger = cls._hedger
+                if hedger is not None and method == "GET" and family_closed:
+                    response = await cls._hedged(send, hedger)
+                else:
+                    response = await send()
+        except TimeoutError:
+            return _deadline_exceeded(cls._client.build_request(method, url, **kwargs))  # type: ignore[arg-type]
+
+        cls._scheduler.observe(response.headers)
+        if cls._quota is not None:
+            cls._quota.observe(response.headers)
+
+        if cache is not None:
+            if response.status_code == 304 and entry is not None:
+                cache.revalidated(key, who)
+                return entry.response(response.request)
+            if response.status_code == 200:
+                cache.store(key, response, principal=who)
+            elif response.status_code in MISSING_STATUSES:
+                cache.store_missing(key, response, who)
         return response
 
+    @classmethod
+    async def _hedged(
+        cls: type["GitHubPortal"],
+        send: Callable[..., CoroutineType[Any, Any, Response]],
+        hedger: Hedger,
+    ) -> Response:
+        """
+        Send a GET, and a duplicate if no answer comes within the hedge delay.
+        The delay and the latency are counted from when the request goes on the wire,
+        not while it waits for quota or a slot.
+        The first successful answer is used and the other attempt is cancelled.
+        """
+        delay = hedger.start()
+        wire: Future[float] = get_running_loop().create_future()
+        primary = create_task(send(wire))
+        tasks = [primary]
+        try:
+            first: list[Future[Any]] = [primary, wire]
+            await wait(first, return_when=FIRST_COMPLETED)
+            if wire.done():
+                done, _ = await wait(tasks, timeout=delay)
+                if not done and hedger.spend():
+                    tasks.append(create_task(send()))
+
+            pending = set(tasks)
+            while pending:
+                done, pending = await wait(pending, return_when=FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        hedger.record(
+                            perf_counter() - wire.result(), task is not primary
+                        )
+                        return task.result()
+            # Every attempt failed, raise the first one's error.
+            return await primary
+        finally:
+            wire.cancel()
+            for task in tasks:
+                task.cancel()
+            await gather(*tasks, return_exceptions=True)
+
+    @classmethod
+    def _adapt(
+        cls: type["GitHubPortal"], epoch: int, latency: float | None, failed: bool
+    ) -> None:
+        """
+        Feed a request's outcome to the adaptive limiter, if any, and apply its new limit.
+        """
+        if cls._limiter is None:
+            return
+        scheduler = cls._scheduler
+        busy = scheduler.waiting > 0 or scheduler.in_use >= scheduler.capacity
+        scheduler.resize(cls._limiter.observe(epoch, latency, failed, busy))
+
+    @classmethod
+    async def _send(
+        cls: type["GitHubPortal"],
+        client: AsyncClient,
+        method: str,
+        url: str,
+        priority: Priority | None,
+        resource: str,
+        breaker: CircuitBreaker | None,
+        family: str,
+        kwargs: dict[str, Any],
+        wire: Future[float] | None = None,
+    ) -> Response:
+        """
+        Send a request once its quota and slot are granted, recording the outcome on the breaker.
+        `wire`, if given, is resolved with the time the request is sent.
+        """
+        if cls._quota is not None and cls._quota.resource == resource:
+            await cls._quota.acquire()
+
+        limiter = cls._limiter
+        try:
+            async with cls._scheduler.slot(
+                priority or CURRENT_PRIORITY.get(), resource
+            ):
+                epoch, sent = (0 if limiter is None else limiter.epoch), perf_counter()
+                if wire is not None and not wire.done():
+                    wire.set_result(sent)
+                try:
+                    response = await client.request(method, url, **kwargs)
+                except TransportError:
+                    cls._adapt(epoch, None, True)
+                    raise
+                cls._adapt(
+                    epoch,
+                    perf_counter() - sent,
+                    overloaded(response.status_code, response.headers),
+                )
+        except TransportError:
+            if breaker is not None:
+                breaker.record(family, False)
+            raise
+        except BaseException:
+            # Cancelled, or out of time: says nothing about the endpoint.
+            if breaker is not None:
+                breaker.record(family, None)
+            raise
+        if breaker is not None:
+            breaker.record(family, response.status_code < 500)
+        return response
+
+    @classmethod
+    @asynccontextmanager
+    async def stream(
+        cls: type["GitHubPortal"],
+        method: Literal["GET", "POST", "PUT", "DELETE", "PATCH", "HEAD", "OPTIONS"],
+        url: str,
+        priority: Priority | None = None,
+        resource: str = "core",
+        **kwargs: Any,
+    ) -> AsyncGenerator[Response, None]:
+        """
+        Like `req`, but yields the response before its body is read, for bodies too large to buffer.
+        The connection slot is held until the block exits.
+        Args:
+            method (str): The HTTP method to use.
+            url (str): The endpoint URL to which the request will be made.
+            priority (Priority | None, optional): The lane to schedule the request in. Defaults to the lane set by `priority()`, or "normal".
+            resource (str, optional): The rate limit bucket the request counts against. Defaults to "core".
+            **kwargs: Additional keyword arguments to pass to the request.
+        Yields:
+            Response: The response, with the body still to be streamed.
+        Raises:
+            TimeoutError: If the `deadline()` runs out, including while the body is read.
+        """
+        if cls._client is None:
+            await cls.start()
+
+        if cls._client is None:
+            raise RuntimeError("HTTP client is not initialized.")
+
+        # The deadline also covers reading the body inside the block.
+        async with timeout(time_left()):
+            if cls._quota is not None and cls._quota.resource == resource:
+                await cls._quota.acquire()
+
+            async with cls._scheduler.slot(
+                priority or CURRENT_PRIORITY.get(), resource
+            ):
+                async with cls._client.stream(method, url, **kwargs) as response:
+                    # Redirect targets (e.g. codeload) carry no rate limit headers.
+                    for hop in (*response.history, response):
+                        cls._scheduler.observe(hop.headers)
+                        if cls._quota is not None:
+                            cls._quota.observe(hop.headers)
+                    yield response
+
+    @classmethod
+    async def paginate(
+        cls: type["GitHubPortal"],
+        method: Callable[..., CoroutineType[Any, Any, tuple[int, Any]]],
+        *args: Any,
+        per_page: int = 100,
+        page: int = 1,
+        **kwargs: Any,
+    ) -> AsyncIterator[Any]:
+        """
+        Iterate over every item of a paginated portal method, one page at a time.
+        The next page is only requested once the previous one has been consumed,
+        so a slow consumer throttles the crawl.
+        Args:
+            method (Callable): A list method accepting `per_page` and `page`, e.g. `GitHubRepositoryPortal.get_organization_repos`.
+            *args: Positional arguments for the method.
+            per_page (int, optional): The page size to request. Defaults to 100.
+            page (int, optional): The first page to request. Defaults to 1.
+            **kwargs: Keyword arguments for the method.
+        Yields:
+            Any: The items of each page. Iteration stops at the first short page or error.
+        """
+        if kwargs.get("mode") == "bytes":
+            raise ValueError("paginate needs decoded pages, not mode='bytes'")
+
+        while True:
+            status, items = await method(*args, per_page=per_page, page=page, **kwargs)
+            if not isinstance(items, list):
+                if isinstance(items, ErrorMessage):
+                    LOGGER.error(
+                        f"paginate:::Stopped at page {page} with {status}: {items.message}"
+                    )
+                return
+
+            for item in items:
+                yield item
+
+            if len(items) < per_page:
+                return
+            page += 1
+
+    @classmethod
+    def _set_authorization(cls: type["GitHubPortal"], token: str) -> None:
+        """
+        Set the bearer token on the default headers and on the running client, if any.
+        """
+        cls._headers["Authorization"] = f"Bearer {token}"
+        if cls._client is not None:
+            cls._client.headers["Authorization"] = f"Bearer {token}"
+
+    @classmethod
+    def use_token(
+        cls: type["GitHubPortal"], token: str, principal: str | None = None
+    ) -> None:
+        """
+        Use a bearer token for every request without the `/user` round trip `authenticate` makes.
+        Useful for worker processes that share an already verified token.
+        Args:
+            token (str): The bearer token.
+            principal (str | None, optional): Who the token acts as, e.g. "user:583231" or "installation:42".
+            Cached responses are kept per principal, so tokens of the same principal share them. Defaults to one principal per token.
+        """
+        cls._set_authorization(token)
+        GitHubPortal._principal = (
+            _token_principal(token) if principal is None else principal
+        )
+        cls._authenticated = True
+
+    @classmethod
+    async def rate_limit(
+        cls: type["GitHubPortal"], mode: ReturnMode = "model"
+    ) -> tuple[int, RateLimitOverview | RateLimitOverviewJSON | bytes | ErrorMessage]:
+        """
+        Gets the current budget of every rate limit resource. This request costs no quota,
+        and its answer also updates the budgets the scheduler holds requests against.
+        Available: [https://docs.github.com/en/rest/rate-limit/rate-limit?apiVersion=2022-11-28](https://docs.github.com/en/rest/rate-limit/rate-limit?apiVersion=2022-11-28)
+        Args:
+            mode (ReturnMode, optional): Return a model, the decoded JSON or the raw body. Defaults to "model".
+        Returns:
+            tuple[int, RateLimitOverview | bytes | ErrorMessage]: A tuple containing the status code and the budgets, or an error message.
+        """
+        try:
+            res = await cls.req(
+                "GET",
+                "/rate_limit",
+                priority="interactive",
+                resource="rate_limit",
+                cached=False,
+            )
+            if res.status_code != 200:
+                return (
+                    res.status_code,
+                    ErrorMessage(
+                        code=res.status_code,
+                        message=res.json().get("message", "Unknown error"),
+                        endpoint="/rate_limit",
+                    ),
+                )
+
+            overview = await cls.parse(res, RateLimitOverview)
+            for name, budget in overview.resources.items():
+                cls._scheduler.rate_limits[name] = RateLimitState(
+                    budget.limit, budget.remaining, budget.reset, budget.used
+                )
+            if mode == "model":
+                return (res.status_code, overview)
+            return (res.status_code, await cls.parse(res, RateLimitOverview, mode))
+        except Exception as e:
+            return (500, ErrorMessage(code=500, message=str(e), endpoint="/rate_limit"))
+
     @classmethod
     async def authenticate(
         cls: type["GitHubPortal"], token: str
@@ -183,7 +937,9 @@ class GitHubPortal:
         Available: [https://docs.github.com/en/rest/users/users?apiVersion=2022-11-28](https://docs.github.com/en/rest/users/users?apiVersion=2022-11-28)
         """
         try:
-            cls._headers["Authorization"] = f"Bearer {token}"
+            cls._set_authorization(token)
+            # Until the user is known, the token is its own principal.
+            GitHubPortal._principal = _token_principal(token)
             res = await cls.req("GET", "/user")
             if res.status_code != 200:
                 return (
@@ -195,19 +951,53 @@ class GitHubPortal:
                     ),
                 )
 
-            cls._user = PrivateUser(**res.json())
+            cls._user = await cls.parse(res, PrivateUser)
+            GitHubPortal._principal = f"user:{cls._user.id}"
 
         except Exception as e:
             return (500, ErrorMessage(code=500, message=str(e), endpoint="/user"))
 
         cls._authenticated = True
 
-        return (res.status_code, PrivateUser(**res.json()))
+        return (res.status_code, cls._user.model_copy())
 
 
 def needs_authentication(
     function: Callable[..., Any],
-) -> classmethod[Any, ..., CoroutineType[Any, Any, Any]]:
+) -> classmethod[Any, ..., Any]:
+    if isasyncgenfunction(function):
+        # Streaming methods cannot return the usual (401, ErrorMessage), so they log and yield nothing.
+        async def stream(
+            cls: type[GitHubPortal], *args: tuple[object, ...], **kwargs: JSONDict
+        ) -> AsyncIterator[Any]:
+            if not cls._authenticated:
+                LOGGER.error(
+                    f"{function.__name__}:::User is not authenticated. Please call authenticate() first."
+                )
+                return
+
+            seconds = cls._timeouts.get(function.__name__)
+            if seconds is None:
+                async for item in function(cls, *args, **kwargs):
+                    yield item
+                return
+
+            # A stream may run for as long as its reader wants, so the budget is per item:
+            # each step, and every request it makes, must finish within `seconds`.
+            items = function(cls, *args, **kwargs)
+            try:
+                while True:
+                    with cls.deadline(seconds):
+                        try:
+                            item = await anext(items)
+                        except StopAsyncIteration:
+                            return
+                    yield item
+            finally:
+                await items.aclose()
+
+        return classmethod(stream)
+
     async def wrapper(
         cls: type[GitHubPortal], *args: tuple[object, ...], **kwargs: JSONDict
     ) -> Any:
@@ -225,6 +1015,10 @@ def needs_authentication(
                 ),
             )
 
-        return await function(cls, *args, **kwargs)
+        seconds = cls._timeouts.get(function.__name__)
+        if seconds is None:
+            return await function(cls, *args, **kwargs)
+        with cls.deadline(seconds):
+            return await function(cls, *args, **kwargs)
 
     return classmethod(wrapper)
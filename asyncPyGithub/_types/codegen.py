@@ -0,0 +1,281 @@
+"""
+Generate `generated.py` from the JSON schemas bundled in `schemas/`.
+
+    python -m asyncPyGithub._types.codegen          # rewrite generated.py
+    python -m asyncPyGithub._types.codegen --check  # exit 1 if it is out of date
+
+Every object in a schema becomes a `<Name>JSON` TypedDict and a `<Name>Record`
+lazy decoder. Objects are named after their schema `title`, or after their parent
+and property otherwise, and structurally identical objects share one definition.
+Requires the `dev` extra (black formats the output).
+"""
+
+import re
+from argparse import ArgumentParser
+from dataclasses import dataclass, field
+from json import dumps, loads
+from keyword import iskeyword
+from pathlib import Path
+from typing import Any
+
+import black
+
+SCHEMA_DIR = Path(__file__).parent / "schemas"
+TARGET = Path(__file__).parent / "generated.py"
+
+SCHEMAS: tuple[str, ...] = ("ContentTree", "Contributor", "FullRepository", "Tag")
+"""
+The schema files to generate from, in output order.
+"""
+
+NAMES: dict[tuple[str, str], str] = {
+    ("ContentTree", "entries"): "ContentNode",
+    ("ContentNode", "_links"): "ContentLink",
+    ("FullRepository", "permissions"): "Permissions",
+    ("Repository", "permissions"): "Permissions",
+    ("Repository", "code_search_index_status"): "CodeSearchIndexStatus",
+    ("FullRepository", "security_and_analysis"): "SecurityAndAnalysis",
+    ("SecurityAndAnalysis", "advanced_security"): "SecurityStatus",
+    ("Tag", "commit"): "Commit",
+}
+"""
+Names for untitled objects, keyed by (parent name, property), matching the hand-written models.
+"""
+
+RESERVED = frozenset({"raw", "model", "decode", "decode_many"})
+"""
+LazyRecord attributes a generated field must not shadow.
+"""
+
+HEADER = '''"""
+Generated by `python -m asyncPyGithub._types.codegen` from the JSON schemas in `schemas/`.
+Do not edit by hand: change the schema and regenerate.
+"""
+'''
+
+
+@dataclass(slots=True)
+class Property:
+    key: str
+    attribute: str
+    json_type: str
+    record_type: str
+    converter: str | None
+    required: bool
+
+
+@dataclass(slots=True)
+class Definition:
+    name: str
+    fingerprint: str
+    properties: list[Property] = field(default_factory=list)
+
+
+def camel(text: str) -> str:
+    return "".join(word[:1].upper() + word[1:] for word in re.split(r"\W+|_", text))
+
+
+def fingerprint(schema: Any) -> str:
+    """
+    Structural identity of a schema, ignoring documentation-only keys.
+    """
+
+    def strip(node: Any) -> Any:
+        if isinstance(node, dict):
+            return {
+                key: strip(value)
+                for key, value in node.items()
+                if key not in ("title", "description", "examples", "default")
+            }
+        if isinstance(node, list):
+            return [strip(item) for item in node]
+        return node
+
+    return dumps(strip(schema), sort_keys=True)
+
+
+class Generator:
+    def __init__(self) -> None:
+        self.definitions: dict[str, Definition] = {}
+        self.by_fingerprint: dict[str, str] = {}
+        self.imports: set[str] = set()
+
+    def define(self, schema: dict[str, Any], name: str) -> str:
+        """
+        Register an object schema, its nested objects first, and return its name.
+        """
+        print_ = fingerprint(schema)
+        if print_ in self.by_fingerprint:
+            return self.by_fingerprint[print_]
+        if name in self.definitions:
+            raise ValueError(f"Conflicting schemas for {name}")
+
+        definition = Definition(name=name, fingerprint=print_)
+        required = set(schema.get("required", ()))
+        for key, prop in schema["properties"].items():
+            if not key.isidentifier() or iskeyword(key):
+                raise ValueError(f"{name}.{key} is not a valid TypedDict key")
+            attribute = key.lstrip("_")
+            if attribute in RESERVED or iskeyword(attribute):
+                attribute += "_"
+            json_type, record_type, converter = self.annotate(prop, name, key)
+            if key not in required and not record_type.startswith("Optional["):
+                # Absent keys read as None on a record.
+                self.imports.add("Optional")
+                record_type = f"Optional[{record_type}]"
+            definition.properties.append(
+                Property(
+                    key=key,
+                    attribute=attribute,
+                    json_type=json_type,
+                    record_type=record_type,
+                    converter=converter,
+                    required=key in required,
+                )
+            )
+
+        self.definitions[name] = definition
+        self.by_fingerprint[print_] = name
+        return name
+
+    def annotate(
+        self, schema: dict[str, Any], parent: str, key: str
+    ) -> tuple[str, str, str | None]:
+        """
+        Work out the TypedDict annotation, record annotation and converter for a property.
+        """
+        nullable = False
+        if "anyOf" in schema:
+            options = [
+                option for option in schema["anyOf"] if option != {"type": "null"}
+            ]
+            nullable = len(options) < len(schema["anyOf"])
+            schema = options[0] if len(options) == 1 else {}
+
+        kind = schema.get("type")
+        if isinstance(kind, list):
+            nullable = nullable or "null" in kind
+            rest = [item for item in kind if item != "null"]
+            kind = rest[0] if len(rest) == 1 else None
+
+        converter: str | None = None
+        if "enum" in schema:
+            self.imports.add("Literal")
+            values = ", ".join(dumps(value) for value in schema["enum"])
+            json_type = record_type = f"Literal[{values}]"
+        elif kind == "string" and schema.get("format") == "date-time":
+            self.imports.add("datetime")
+            json_type, record_type, converter = "str", "datetime", "timestamp"
+        elif kind in ("string", "integer", "number", "boolean"):
+            json_type = record_type = {
+                "string": "str",
+                "integer": "int",
+                "number": "float",
+                "boolean": "bool",
+            }[kind]
+        elif kind == "array":
+            self.imports.add("List")
+            item, item_record, item_converter = self.annotate(
+                schema.get("items", {}), parent, key
+            )
+            json_type, record_type = f"List[{item}]", f"List[{item_record}]"
+            if item_converter is not None:
+                if item_converter != item_record:
+                    raise ValueError(f"{parent}.{key}: unsupported array items")
+                converter = f"records({item_record})"
+        elif kind == "object" and schema.get("properties"):
+            fallback = (
+                camel(schema["title"]) if "title" in schema else parent + camel(key)
+            )
+            name = self.define(schema, NAMES.get((parent, key), fallback))
+            json_type, record_type, converter = (
+                f"{name}JSON",
+                f"{name}Record",
+                f"{name}Record",
+            )
+        else:
+            self.imports.update(("Any", "Dict"))
+            json_type = record_type = "Dict[str, Any]" if kind == "object" else "Any"
+
+        if nullable:
+            self.imports.add("Optional")
+            json_type, record_type = (
+                f"Optional[{json_type}]",
+                f"Optional[{record_type}]",
+            )
+        return json_type, record_type, converter
+
+    def load(self, schema_name: str) -> None:
+        schema = loads((SCHEMA_DIR / f"{schema_name}.json").read_text(encoding="utf-8"))
+        if schema.get("type") == "array":
+            schema = schema["items"]
+        self.define(schema, camel(schema.get("title", schema_name)))
+
+    def render(self) -> str:
+        typing_names = sorted(
+            {"NotRequired", "TypedDict"} | (self.imports - {"datetime"})
+        )
+        lines = [HEADER]
+        if "datetime" in self.imports:
+            lines.append("from datetime import datetime")
+        lines.append(f"from typing import {', '.join(typing_names)}")
+        lines.append("")
+        lines.append("from .record import LazyField, LazyRecord, records, timestamp")
+
+        for definition in self.definitions.values():
+            lines += ["", "", f"class {definition.name}JSON(TypedDict):"]
+            for prop in definition.properties:
+                annotation = (
+                    prop.json_type
+                    if prop.required
+                    else f"NotRequired[{prop.json_type}]"
+                )
+                lines.append(f"    {prop.key}: {annotation}")
+
+            lines += ["", "", f"class {definition.name}Record(LazyRecord):"]
+            for prop in definition.properties:
+                arguments = dumps(prop.key)
+                if prop.converter is not None:
+                    arguments += f", {prop.converter}"
+                lines.append(
+                    f"    {prop.attribute} = LazyField[{prop.record_type}]({arguments})"
+                )
+
+        source = "\n".join(lines) + "\n"
+        return black.format_str(source, mode=black.Mode(line_length=88))
+
+
+def generate() -> str:
+    """
+    Render `generated.py` from the bundled schemas.
+    Returns:
+        str: The module source.
+    """
+    generator = Generator()
+    for schema_name in SCHEMAS:
+        generator.load(schema_name)
+    return generator.render()
+
+
+def main() -> int:
+    parser = ArgumentParser(description=__doc__.splitlines()[1] if __doc__ else None)
+    parser.add_argument(
+        "--check", action="store_true", help="Fail if generated.py is out of date."
+    )
+    args = parser.parse_args()
+
+    source = generate()
+    if args.check:
+        current = TARGET.read_text(encoding="utf-8") if TARGET.exists() else ""
+        if current != source:
+            print(f"{TARGET} is out of date, rerun without --check")
+            return 1
+        return 0
+
+    TARGET.write_text(source, encoding="utf-8")
+    print(f"Wrote {TARGET}")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
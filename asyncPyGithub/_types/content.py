@@ -1,40 +1,20 @@
 from typing import (
     List,
-    NotRequired,
     Optional,
-    TypedDict,
 )
 
-from pydantic import BaseModel, HttpUrl
+from pydantic import Field, HttpUrl
 
-
-class ContentLinkJSON(TypedDict):
-    git: Optional[HttpUrl]
-    html: Optional[HttpUrl]
-    self: HttpUrl
+from .model import GitHubModel
 
 
-class ContentLink(BaseModel):
+class ContentLink(GitHubModel):
     git: Optional[HttpUrl]
     html: Optional[HttpUrl]
     self: HttpUrl
 
 
-class ContentNodeJSON(TypedDict):
-    type: str
-    size: int
-    name: str
-    path: str
-    sha: str
-    content: NotRequired[str]
-    url: HttpUrl
-    git_url: HttpUrl
-    html_url: HttpUrl
-    download_url: Optional[HttpUrl]
-    _links: ContentLinkJSON
-
-
-class ContentNode(BaseModel):
+class ContentNode(GitHubModel):
     type: str
     size: int
     name: str
@@ -42,15 +22,11 @@ class ContentNode(BaseModel):
     sha: str
     content: Optional[str] = None
     url: HttpUrl
-    git_url: HttpUrl
-    html_url: HttpUrl
+    git_url: Optional[HttpUrl]
+    html_url: Optional[HttpUrl]
     download_url: Optional[HttpUrl] = None
-    _links: ContentLink
-
-
-class ContentTreeJSON(ContentNodeJSON):
-    entries: List[ContentNodeJSON]
-    encoding: NotRequired[str]
+    # A leading underscore would make this a private attribute pydantic never fills in.
+    links: ContentLink = Field(alias="_links")
 
 
 class ContentTree(ContentNode):
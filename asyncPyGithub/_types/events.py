@@ -0,0 +1,161 @@
+from datetime import datetime
+from typing import (
+    Any,
+    Dict,
+    List,
+    Literal,
+    Optional,
+    TypedDict,
+)
+
+from pydantic import HttpUrl
+
+from .model import GitHubModel
+from .repos import FullRepository
+from .users import SimpleUser
+
+WebhookEventName = Literal["ping", "push", "repository", "create", "delete"]
+"""
+The webhook events parsed into their own payload models. Others parse as `WebhookEvent`.
+"""
+
+
+RepositoryAction = Literal[
+    "archived",
+    "created",
+    "deleted",
+    "edited",
+    "privatized",
+    "publicized",
+    "renamed",
+    "transferred",
+    "unarchived",
+]
+"""
+What happened to the repository in a `repository` event.
+"""
+
+
+RefType = Literal["branch", "tag"]
+"""
+The kind of git ref a `create` or `delete` event is about.
+"""
+
+
+class WebhookEvent(GitHubModel):
+    """
+    The fields every webhook payload may carry.
+    Attributes:
+        action (str | None): What happened, for events with several kinds of activity.
+        sender (SimpleUser | None): The user who triggered the event.
+        repository (FullRepository | None): The repository the event happened in.
+    """
+
+    action: Optional[str] = None
+    sender: Optional[SimpleUser] = None
+    repository: Optional[FullRepository] = None
+
+
+class PingEvent(WebhookEvent):
+    zen: str
+    hook_id: int
+
+
+class Pusher(GitHubModel):
+    name: str
+    email: Optional[str] = None
+
+
+class PushCommit(GitHubModel):
+    id: str
+    message: str
+    timestamp: datetime
+    url: HttpUrl
+    added: List[str] = []
+    removed: List[str] = []
+    modified: List[str] = []
+
+
+class PushEvent(WebhookEvent):
+    ref: str
+    before: str
+    after: str
+    created: bool = False
+    deleted: bool = False
+    forced: bool = False
+    commits: List[PushCommit] = []
+    head_commit: Optional[PushCommit] = None
+    pusher: Pusher
+
+
+class RepositoryEvent(WebhookEvent):
+    action: RepositoryAction
+    changes: Optional[Dict[str, Any]] = None
+
+
+class CreateEvent(WebhookEvent):
+    ref: str
+    ref_type: RefType
+    master_branch: Optional[str] = None
+
+
+class DeleteEvent(WebhookEvent):
+    ref: str
+    ref_type: RefType
+
+
+class EventActorJSON(TypedDict):
+    id: int
+    login: str
+    display_login: str
+    gravatar_id: Optional[str]
+    url: HttpUrl
+    avatar_url: HttpUrl
+
+
+class EventRepositoryJSON(TypedDict):
+    id: int
+    name: str
+    url: HttpUrl
+
+
+class GitHubEventJSON(TypedDict):
+    id: str
+    type: Optional[str]
+    actor: EventActorJSON
+    repo: EventRepositoryJSON
+    org: Optional[EventActorJSON]
+    payload: Dict[str, Any]
+    public: bool
+    created_at: Optional[datetime]
+
+
+class EventActor(GitHubModel):
+    id: int
+    login: str
+    display_login: Optional[str] = None
+    gravatar_id: Optional[str] = None
+    url: HttpUrl
+    avatar_url: HttpUrl
+
+
+class EventRepository(GitHubModel):
+    id: int
+    name: str
+    url: HttpUrl
+
+
+class GitHubEvent(GitHubModel):
+    """
+    An entry in an Events API feed, e.g. "PushEvent" or "WatchEvent".
+    The payload differs per type and is left undecoded.
+    """
+
+    id: str
+    type: Optional[str]
+    actor: EventActor
+    repo: EventRepository
+    org: Optional[EventActor] = None
+    payload: Dict[str, Any]
+    public: bool
+    created_at: Optional[datetime]
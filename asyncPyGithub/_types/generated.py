@@ -0,0 +1,759 @@
+"""
+Generated by `python -m asyncPyGithub._types.codegen` from the JSON schemas in `schemas/`.
+Do not edit by hand: change the schema and regenerate.
+"""
+
+from datetime import datetime
+from typing import Any, Dict, List, Literal, NotRequired, Optional, TypedDict
+
+from .record import LazyField, LazyRecord, records, timestamp
+
+
+class ContentLinkJSON(TypedDict):
+    git: Optional[str]
+    html: Optional[str]
+    self: str
+
+
+class ContentLinkRecord(LazyRecord):
+    git = LazyField[Optional[str]]("git")
+    html = LazyField[Optional[str]]("html")
+    self = LazyField[str]("self")
+
+
+class ContentNodeJSON(TypedDict):
+    type: str
+    size: int
+    name: str
+    path: str
+    sha: str
+    url: str
+    git_url: Optional[str]
+    html_url: Optional[str]
+    download_url: Optional[str]
+    _links: ContentLinkJSON
+
+
+class ContentNodeRecord(LazyRecord):
+    type = LazyField[str]("type")
+    size = LazyField[int]("size")
+    name = LazyField[str]("name")
+    path = LazyField[str]("path")
+    sha = LazyField[str]("sha")
+    url = LazyField[str]("url")
+    git_url = LazyField[Optional[str]]("git_url")
+    html_url = LazyField[Optional[str]]("html_url")
+    download_url = LazyField[Optional[str]]("download_url")
+    links = LazyField[ContentLinkRecord]("_links", ContentLinkRecord)
+
+
+class ContentTreeJSON(TypedDict):
+    type: str
+    size: int
+    name: str
+    path: str
+    sha: str
+    content: NotRequired[str]
+    url: str
+    git_url: Optional[str]
+    html_url: Optional[str]
+    download_url: Optional[str]
+    entries: NotRequired[List[ContentNodeJSON]]
+    encoding: NotRequired[str]
+    _links: ContentLinkJSON
+
+
+class ContentTreeRecord(LazyRecord):
+    type = LazyField[str]("type")
+    size = LazyField[int]("size")
+    name = LazyField[str]("name")
+    path = LazyField[str]("path")
+    sha = LazyField[str]("sha")
+    content = LazyField[Optional[str]]("content")
+    url = LazyField[str]("url")
+    git_url = LazyField[Optional[str]]("git_url")
+    html_url = LazyField[Optional[str]]("html_url")
+    download_url = LazyField[Optional[str]]("download_url")
+    entries = LazyField[Optional[List[ContentNodeRecord]]](
+        "entries", records(ContentNodeRecord)
+    )
+    encoding = LazyField[Optional[str]]("encoding")
+    links = LazyField[ContentLinkRecord]("_links", ContentLinkRecord)
+
+
+class ContributorJSON(TypedDict):
+    login: NotRequired[str]
+    id: NotRequired[int]
+    node_id: NotRequired[str]
+    avatar_url: NotRequired[str]
+    gravatar_id: NotRequired[Optional[str]]
+    url: NotRequired[str]
+    html_url: NotRequired[str]
+    followers_url: NotRequired[str]
+    following_url: NotRequired[str]
+    gists_url: NotRequired[str]
+    starred_url: NotRequired[str]
+    subscriptions_url: NotRequired[str]
+    organizations_url: NotRequired[str]
+    repos_url: NotRequired[str]
+    events_url: NotRequired[str]
+    received_events_url: NotRequired[str]
+    type: str
+    site_admin: NotRequired[bool]
+    contributions: int
+    email: NotRequired[str]
+    name: NotRequired[str]
+    user_view_type: NotRequired[str]
+
+
+class ContributorRecord(LazyRecord):
+    login = LazyField[Optional[str]]("login")
+    id = LazyField[Optional[int]]("id")
+    node_id = LazyField[Optional[str]]("node_id")
+    avatar_url = LazyField[Optional[str]]("avatar_url")
+    gravatar_id = LazyField[Optional[str]]("gravatar_id")
+    url = LazyField[Optional[str]]("url")
+    html_url = LazyField[Optional[str]]("html_url")
+    followers_url = LazyField[Optional[str]]("followers_url")
+    following_url = LazyField[Optional[str]]("following_url")
+    gists_url = LazyField[Optional[str]]("gists_url")
+    starred_url = LazyField[Optional[str]]("starred_url")
+    subscriptions_url = LazyField[Optional[str]]("subscriptions_url")
+    organizations_url = LazyField[Optional[str]]("organizations_url")
+    repos_url = LazyField[Optional[str]]("repos_url")
+    events_url = LazyField[Optional[str]]("events_url")
+    received_events_url = LazyField[Optional[str]]("received_events_url")
+    type = LazyField[str]("type")
+    site_admin = LazyField[Optional[bool]]("site_admin")
+    contributions = LazyField[int]("contributions")
+    email = LazyField[Optional[str]]("email")
+    name = LazyField[Optional[str]]("name")
+    user_view_type = LazyField[Optional[str]]("user_view_type")
+
+
+class SimpleUserJSON(TypedDict):
+    name: NotRequired[Optional[str]]
+    email: NotRequired[Optional[str]]
+    login: str
+    id: int
+    node_id: str
+    avatar_url: str
+    gravatar_id: Optional[str]
+    url: str
+    html_url: str
+    followers_url: str
+    following_url: str
+    gists_url: str
+    starred_url: str
+    subscriptions_url: str
+    organizations_url: str
+    repos_url: str
+    events_url: str
+    received_events_url: str
+    type: str
+    site_admin: bool
+    starred_at: NotRequired[str]
+    user_view_type: NotRequired[str]
+
+
+class SimpleUserRecord(LazyRecord):
+    name = LazyField[Optional[str]]("name")
+    email = LazyField[Optional[str]]("email")
+    login = LazyField[str]("login")
+    id = LazyField[int]("id")
+    node_id = LazyField[str]("node_id")
+    avatar_url = LazyField[str]("avatar_url")
+    gravatar_id = LazyField[Optional[str]]("gravatar_id")
+    url = LazyField[str]("url")
+    html_url = LazyField[str]("html_url")
+    followers_url = LazyField[str]("followers_url")
+    following_url = LazyField[str]("following_url")
+    gists_url = LazyField[str]("gists_url")
+    starred_url = LazyField[str]("starred_url")
+    subscriptions_url = LazyField[str]("subscriptions_url")
+    organizations_url = LazyField[str]("organizations_url")
+    repos_url = LazyField[str]("repos_url")
+    events_url = LazyField[str]("events_url")
+    received_events_url = LazyField[str]("received_events_url")
+    type = LazyField[str]("type")
+    site_admin = LazyField[bool]("site_admin")
+    starred_at = LazyField[Optional[str]]("starred_at")
+    user_view_type = LazyField[Optional[str]]("user_view_type")
+
+
+class PermissionsJSON(TypedDict):
+    admin: bool
+    maintain: NotRequired[bool]
+    push: bool
+    triage: NotRequired[bool]
+    pull: bool
+
+
+class PermissionsRecord(LazyRecord):
+    admin = LazyField[bool]("admin")
+    maintain = LazyField[Optional[bool]]("maintain")
+    push = LazyField[bool]("push")
+    triage = LazyField[Optional[bool]]("triage")
+    pull = LazyField[bool]("pull")
+
+
+class LicenseSimpleJSON(TypedDict):
+    key: str
+    name: str
+    url: Optional[str]
+    spdx_id: Optional[str]
+    node_id: str
+    html_url: NotRequired[str]
+
+
+class LicenseSimpleRecord(LazyRecord):
+    key = LazyField[str]("key")
+    name = LazyField[str]("name")
+    url = LazyField[Optional[str]]("url")
+    spdx_id = LazyField[Optional[str]]("spdx_id")
+    node_id = LazyField[str]("node_id")
+    html_url = LazyField[Optional[str]]("html_url")
+
+
+class CodeSearchIndexStatusJSON(TypedDict):
+    lexical_search_ok: NotRequired[bool]
+    lexical_commit_sha: NotRequired[str]
+
+
+class CodeSearchIndexStatusRecord(LazyRecord):
+    lexical_search_ok = LazyField[Optional[bool]]("lexical_search_ok")
+    lexical_commit_sha = LazyField[Optional[str]]("lexical_commit_sha")
+
+
+class RepositoryJSON(TypedDict):
+    id: int
+    node_id: str
+    name: str
+    full_name: str
+    license: Optional[LicenseSimpleJSON]
+    forks: int
+    permissions: NotRequired[PermissionsJSON]
+    owner: SimpleUserJSON
+    private: bool
+    html_url: str
+    description: Optional[str]
+    fork: bool
+    url: str
+    archive_url: str
+    assignees_url: str
+    blobs_url: str
+    branches_url: str
+    collaborators_url: str
+    comments_url: str
+    commits_url: str
+    compare_url: str
+    contents_url: str
+    contributors_url: str
+    deployments_url: str
+    downloads_url: str
+    events_url: str
+    forks_url: str
+    git_commits_url: str
+    git_refs_url: str
+    git_tags_url: str
+    git_url: str
+    issue_comment_url: str
+    issue_events_url: str
+    issues_url: str
+    keys_url: str
+    labels_url: str
+    languages_url: str
+    merges_url: str
+    milestones_url: str
+    notifications_url: str
+    pulls_url: str
+    releases_url: str
+    ssh_url: str
+    stargazers_url: str
+    statuses_url: str
+    subscribers_url: str
+    subscription_url: str
+    tags_url: str
+    teams_url: str
+    trees_url: str
+    clone_url: str
+    mirror_url: Optional[str]
+    hooks_url: str
+    svn_url: str
+    homepage: Optional[str]
+    language: Optional[str]
+    forks_count: int
+    stargazers_count: int
+    watchers_count: int
+    size: int
+    default_branch: str
+    open_issues_count: int
+    is_template: NotRequired[bool]
+    topics: NotRequired[List[str]]
+    has_issues: bool
+    has_projects: bool
+    has_wiki: bool
+    has_pages: bool
+    has_downloads: bool
+    has_discussions: NotRequired[bool]
+    archived: bool
+    disabled: bool
+    visibility: NotRequired[str]
+    pushed_at: Optional[str]
+    created_at: Optional[str]
+    updated_at: Optional[str]
+    allow_rebase_merge: NotRequired[bool]
+    temp_clone_token: NotRequired[str]
+    allow_squash_merge: NotRequired[bool]
+    allow_auto_merge: NotRequired[bool]
+    delete_branch_on_merge: NotRequired[bool]
+    allow_update_branch: NotRequired[bool]
+    use_squash_pr_title_as_default: NotRequired[bool]
+    squash_merge_commit_title: NotRequired[Literal["PR_TITLE", "COMMIT_OR_PR_TITLE"]]
+    squash_merge_commit_message: NotRequired[
+        Literal["PR_BODY", "COMMIT_MESSAGES", "BLANK"]
+    ]
+    merge_commit_title: NotRequired[Literal["PR_TITLE", "MERGE_MESSAGE"]]
+    merge_commit_message: NotRequired[Literal["PR_BODY", "PR_TITLE", "BLANK"]]
+    allow_merge_commit: NotRequired[bool]
+    allow_forking: NotRequired[bool]
+    web_commit_signoff_required: NotRequired[bool]
+    open_issues: int
+    watchers: int
+    master_branch: NotRequired[str]
+    starred_at: NotRequired[str]
+    anonymous_access_enabled: NotRequired[bool]
+    code_search_index_status: NotRequired[CodeSearchIndexStatusJSON]
+
+
+class RepositoryRecord(LazyRecord):
+    id = LazyField[int]("id")
+    node_id = LazyField[str]("node_id")
+    name = LazyField[str]("name")
+    full_name = LazyField[str]("full_name")
+    license = LazyField[Optional[LicenseSimpleRecord]]("license", LicenseSimpleRecord)
+    forks = LazyField[int]("forks")
+    permissions = LazyField[Optional[PermissionsRecord]](
+        "permissions", PermissionsRecord
+    )
+    owner = LazyField[SimpleUserRecord]("owner", SimpleUserRecord)
+    private = LazyField[bool]("private")
+    html_url = LazyField[str]("html_url")
+    description = LazyField[Optional[str]]("description")
+    fork = LazyField[bool]("fork")
+    url = LazyField[str]("url")
+    archive_url = LazyField[str]("archive_url")
+    assignees_url = LazyField[str]("assignees_url")
+    blobs_url = LazyField[str]("blobs_url")
+    branches_url = LazyField[str]("branches_url")
+    collaborators_url = LazyField[str]("collaborators_url")
+    comments_url = LazyField[str]("comments_url")
+    commits_url = LazyField[str]("commits_url")
+    compare_url = LazyField[str]("compare_url")
+    contents_url = LazyField[str]("contents_url")
+    contributors_url = LazyField[str]("contributors_url")
+    deployments_url = LazyField[str]("deployments_url")
+    downloads_url = LazyField[str]("downloads_url")
+    events_url = LazyField[str]("events_url")
+    forks_url = LazyField[str]("forks_url")
+    git_commits_url = LazyField[str]("git_commits_url")
+    git_refs_url = LazyField[str]("git_refs_url")
+    git_tags_url = LazyField[str]("git_tags_url")
+    git_url = LazyField[str]("git_url")
+    issue_comment_url = LazyField[str]("issue_comment_url")
+    issue_events_url = LazyField[str]("issue_events_url")
+    issues_url = LazyField[str]("issues_url")
+    keys_url = LazyField[str]("keys_url")
+    labels_url = LazyField[str]("labels_url")
+    languages_url = LazyField[str]("languages_url")
+    merges_url = LazyField[str]("merges_url")
+    milestones_url = LazyField[str]("milestones_url")
+    notifications_url = LazyField[str]("notifications_url")
+    pulls_url = LazyField[str]("pulls_url")
+    releases_url = LazyField[str]("releases_url")
+    ssh_url = LazyField[str]("ssh_url")
+    stargazers_url = LazyField[str]("stargazers_url")
+    statuses_url = LazyField[str]("statuses_url")
+    subscribers_url = LazyField[str]("subscribers_url")
+    subscription_url = LazyField[str]("subscription_url")
+    tags_url = LazyField[str]("tags_url")
+    teams_url = LazyField[str]("teams_url")
+    trees_url = LazyField[str]("trees_url")
+    clone_url = LazyField[str]("clone_url")
+    mirror_url = LazyField[Optional[str]]("mirror_url")
+    hooks_url = LazyField[str]("hooks_url")
+    svn_url = LazyField[str]("svn_url")
+    homepage = LazyField[Optional[str]]("homepage")
+    language = LazyField[Optional[str]]("language")
+    forks_count = LazyField[int]("forks_count")
+    stargazers_count = LazyField[int]("stargazers_count")
+    watchers_count = LazyField[int]("watchers_count")
+    size = LazyField[int]("size")
+    default_branch = LazyField[str]("default_branch")
+    open_issues_count = LazyField[int]("open_issues_count")
+    is_template = LazyField[Optional[bool]]("is_template")
+    topics = LazyField[Optional[List[str]]]("topics")
+    has_issues = LazyField[bool]("has_issues")
+    has_projects = LazyField[bool]("has_projects")
+    has_wiki = LazyField[bool]("has_wiki")
+    has_pages = LazyField[bool]("has_pages")
+    has_downloads = LazyField[bool]("has_downloads")
+    has_discussions = LazyField[Optional[bool]]("has_discussions")
+    archived = LazyField[bool]("archived")
+    disabled = LazyField[bool]("disabled")
+    visibility = LazyField[Optional[str]]("visibility")
+    pushed_at = LazyField[Optional[datetime]]("pushed_at", timestamp)
+    created_at = LazyField[Optional[datetime]]("created_at", timestamp)
+    updated_at = LazyField[Optional[datetime]]("updated_at", timestamp)
+    allow_rebase_merge = LazyField[Optional[bool]]("allow_rebase_merge")
+    temp_clone_token = LazyField[Optional[str]]("temp_clone_token")
+    allow_squash_merge = LazyField[Optional[bool]]("allow_squash_merge")
+    allow_auto_merge = LazyField[Optional[bool]]("allow_auto_merge")
+    delete_branch_on_merge = LazyField[Optional[bool]]("delete_branch_on_merge")
+    allow_update_branch = LazyField[Optional[bool]]("allow_update_branch")
+    use_squash_pr_title_as_default = LazyField[Optional[bool]](
+        "use_squash_pr_title_as_default"
+    )
+    squash_merge_commit_title = LazyField[
+        Optional[Literal["PR_TITLE", "COMMIT_OR_PR_TITLE"]]
+    ]("squash_merge_commit_title")
+    squash_merge_commit_message = LazyField[
+        Optional[Literal["PR_BODY", "COMMIT_MESSAGES", "BLANK"]]
+    ]("squash_merge_commit_message")
+    merge_commit_title = LazyField[Optional[Literal["PR_TITLE", "MERGE_MESSAGE"]]](
+        "merge_commit_title"
+    )
+    merge_commit_message = LazyField[Optional[Literal["PR_BODY", "PR_TITLE", "BLANK"]]](
+        "merge_commit_message"
+    )
+    allow_merge_commit = LazyField[Optional[bool]]("allow_merge_commit")
+    allow_forking = LazyField[Optional[bool]]("allow_forking")
+    web_commit_signoff_required = LazyField[Optional[bool]](
+        "web_commit_signoff_required"
+    )
+    open_issues = LazyField[int]("open_issues")
+    watchers = LazyField[int]("watchers")
+    master_branch = LazyField[Optional[str]]("master_branch")
+    starred_at = LazyField[Optional[str]]("starred_at")
+    anonymous_access_enabled = LazyField[Optional[bool]]("anonymous_access_enabled")
+    code_search_index_status = LazyField[Optional[CodeSearchIndexStatusRecord]](
+        "code_search_index_status", CodeSearchIndexStatusRecord
+    )
+
+
+class CodeOfConductSimpleJSON(TypedDict):
+    url: str
+    key: str
+    name: str
+    html_url: Optional[str]
+
+
+class CodeOfConductSimpleRecord(LazyRecord):
+    url = LazyField[str]("url")
+    key = LazyField[str]("key")
+    name = LazyField[str]("name")
+    html_url = LazyField[Optional[str]]("html_url")
+
+
+class SecurityStatusJSON(TypedDict):
+    status: NotRequired[Literal["enabled", "disabled"]]
+
+
+class SecurityStatusRecord(LazyRecord):
+    status = LazyField[Optional[Literal["enabled", "disabled"]]]("status")
+
+
+class SecurityAndAnalysisJSON(TypedDict):
+    advanced_security: NotRequired[SecurityStatusJSON]
+    code_security: NotRequired[SecurityStatusJSON]
+    dependabot_security_updates: NotRequired[SecurityStatusJSON]
+    secret_scanning: NotRequired[SecurityStatusJSON]
+    secret_scanning_push_protection: NotRequired[SecurityStatusJSON]
+    secret_scanning_non_provider_patterns: NotRequired[SecurityStatusJSON]
+    secret_scanning_ai_detection: NotRequired[SecurityStatusJSON]
+
+
+class SecurityAndAnalysisRecord(LazyRecord):
+    advanced_security = LazyField[Optional[SecurityStatusRecord]](
+        "advanced_security", SecurityStatusRecord
+    )
+    code_security = LazyField[Optional[SecurityStatusRecord]](
+        "code_security", SecurityStatusRecord
+    )
+    dependabot_security_updates = LazyField[Optional[SecurityStatusRecord]](
+        "dependabot_security_updates", SecurityStatusRecord
+    )
+    secret_scanning = LazyField[Optional[SecurityStatusRecord]](
+        "secret_scanning", SecurityStatusRecord
+    )
+    secret_scanning_push_protection = LazyField[Optional[SecurityStatusRecord]](
+        "secret_scanning_push_protection", SecurityStatusRecord
+    )
+    secret_scanning_non_provider_patterns = LazyField[Optional[SecurityStatusRecord]](
+        "secret_scanning_non_provider_patterns", SecurityStatusRecord
+    )
+    secret_scanning_ai_detection = LazyField[Optional[SecurityStatusRecord]](
+        "secret_scanning_ai_detection", SecurityStatusRecord
+    )
+
+
+class FullRepositoryJSON(TypedDict):
+    id: int
+    node_id: str
+    name: str
+    full_name: str
+    owner: SimpleUserJSON
+    private: bool
+    html_url: str
+    description: Optional[str]
+    fork: bool
+    url: str
+    archive_url: str
+    assignees_url: str
+    blobs_url: str
+    branches_url: str
+    collaborators_url: str
+    comments_url: str
+    commits_url: str
+    compare_url: str
+    contents_url: str
+    contributors_url: str
+    deployments_url: str
+    downloads_url: str
+    events_url: str
+    forks_url: str
+    git_commits_url: str
+    git_refs_url: str
+    git_tags_url: str
+    git_url: str
+    issue_comment_url: str
+    issue_events_url: str
+    issues_url: str
+    keys_url: str
+    labels_url: str
+    languages_url: str
+    merges_url: str
+    milestones_url: str
+    notifications_url: str
+    pulls_url: str
+    releases_url: str
+    ssh_url: str
+    stargazers_url: str
+    statuses_url: str
+    subscribers_url: str
+    subscription_url: str
+    tags_url: str
+    teams_url: str
+    trees_url: str
+    clone_url: str
+    mirror_url: Optional[str]
+    hooks_url: str
+    svn_url: str
+    homepage: Optional[str]
+    language: Optional[str]
+    forks_count: int
+    stargazers_count: int
+    watchers_count: int
+    size: int
+    default_branch: str
+    open_issues_count: int
+    is_template: NotRequired[bool]
+    topics: NotRequired[List[str]]
+    has_issues: bool
+    has_projects: bool
+    has_wiki: bool
+    has_pages: bool
+    has_downloads: NotRequired[bool]
+    has_discussions: bool
+    archived: bool
+    disabled: bool
+    visibility: NotRequired[str]
+    pushed_at: str
+    created_at: str
+    updated_at: str
+    permissions: NotRequired[PermissionsJSON]
+    allow_rebase_merge: NotRequired[bool]
+    template_repository: NotRequired[Optional[RepositoryJSON]]
+    temp_clone_token: NotRequired[Optional[str]]
+    allow_squash_merge: NotRequired[bool]
+    allow_auto_merge: NotRequired[bool]
+    delete_branch_on_merge: NotRequired[bool]
+    allow_merge_commit: NotRequired[bool]
+    allow_update_branch: NotRequired[bool]
+    use_squash_pr_title_as_default: NotRequired[bool]
+    squash_merge_commit_title: NotRequired[Literal["PR_TITLE", "COMMIT_OR_PR_TITLE"]]
+    squash_merge_commit_message: NotRequired[
+        Literal["PR_BODY", "COMMIT_MESSAGES", "BLANK"]
+    ]
+    merge_commit_title: NotRequired[Literal["PR_TITLE", "MERGE_MESSAGE"]]
+    merge_commit_message: NotRequired[Literal["PR_BODY", "PR_TITLE", "BLANK"]]
+    allow_forking: NotRequired[bool]
+    web_commit_signoff_required: NotRequired[bool]
+    subscribers_count: int
+    network_count: int
+    license: Optional[LicenseSimpleJSON]
+    organization: NotRequired[Optional[SimpleUserJSON]]
+    parent: NotRequired[RepositoryJSON]
+    source: NotRequired[RepositoryJSON]
+    forks: int
+    master_branch: NotRequired[str]
+    open_issues: int
+    watchers: int
+    anonymous_access_enabled: NotRequired[bool]
+    code_of_conduct: NotRequired[CodeOfConductSimpleJSON]
+    security_and_analysis: NotRequired[Optional[SecurityAndAnalysisJSON]]
+    custom_properties: NotRequired[Dict[str, Any]]
+
+
+class FullRepositoryRecord(LazyRecord):
+    id = LazyField[int]("id")
+    node_id = LazyField[str]("node_id")
+    name = LazyField[str]("name")
+    full_name = LazyField[str]("full_name")
+    owner = LazyField[SimpleUserRecord]("owner", SimpleUserRecord)
+    private = LazyField[bool]("private")
+    html_url = LazyField[str]("html_url")
+    description = LazyField[Optional[str]]("description")
+    fork = LazyField[bool]("fork")
+    url = LazyField[str]("url")
+    archive_url = LazyField[str]("archive_url")
+    assignees_url = LazyField[str]("assignees_url")
+    blobs_url = LazyField[str]("blobs_url")
+    branches_url = LazyField[str]("branches_url")
+    collaborators_url = LazyField[str]("collaborators_url")
+    comments_url = LazyField[str]("comments_url")
+    commits_url = LazyField[str]("commits_url")
+    compare_url = LazyField[str]("compare_url")
+    contents_url = LazyField[str]("contents_url")
+    contributors_url = LazyField[str]("contributors_url")
+    deployments_url = LazyField[str]("deployments_url")
+    downloads_url = LazyField[str]("downloads_url")
+    events_url = LazyField[str]("events_url")
+    forks_url = LazyField[str]("forks_url")
+    git_commits_url = LazyField[str]("git_commits_url")
+    git_refs_url = LazyField[str]("git_refs_url")
+    git_tags_url = LazyField[str]("git_tags_url")
+    git_url = LazyField[str]("git_url")
+    issue_comment_url = LazyField[str]("issue_comment_url")
+    issue_events_url = LazyField[str]("issue_events_url")
+    issues_url = LazyField[str]("issues_url")
+    keys_url = LazyField[str]("keys_url")
+    labels_url = LazyField[str]("labels_url")
+    languages_url = LazyField[str]("languages_url")
+    merges_url = LazyField[str]("merges_url")
+    milestones_url = LazyField[str]("milestones_url")
+    notifications_url = LazyField[str]("notifications_url")
+    pulls_url = LazyField[str]("pulls_url")
+    releases_url = LazyField[str]("releases_url")
+    ssh_url = LazyField[str]("ssh_url")
+    stargazers_url = LazyField[str]("stargazers_url")
+    statuses_url = LazyField[str]("statuses_url")
+    subscribers_url = LazyField[str]("subscribers_url")
+    subscription_url = LazyField[str]("subscription_url")
+    tags_url = LazyField[str]("tags_url")
+    teams_url = LazyField[str]("teams_url")
+    trees_url = LazyField[str]("trees_url")
+    clone_url = LazyField[str]("clone_url")
+    mirror_url = LazyField[Optional[str]]("mirror_url")
+    hooks_url = LazyField[str]("hooks_url")
+    svn_url = LazyField[str]("svn_url")
+    homepage = LazyField[Optional[str]]("homepage")
+    language = LazyField[Optional[str]]("language")
+    forks_count = LazyField[int]("forks_count")
+    stargazers_count = LazyField[int]("stargazers_count")
+    watchers_count = LazyField[int]("watchers_count")
+    size = LazyField[int]("size")
+    default_branch = LazyField[str]("default_branch")
+    open_issues_count = LazyField[int]("open_issues_count")
+    is_template = LazyField[Optional[bool]]("is_template")
+    topics = LazyField[Optional[List[str]]]("topics")
+    has_issues = LazyField[bool]("has_issues")
+    has_projects = LazyField[bool]("has_projects")
+    has_wiki = LazyField[bool]("has_wiki")
+    has_pages = LazyField[bool]("has_pages")
+    has_downloads = LazyField[Optional[bool]]("has_downloads")
+    has_discussions = LazyField[bool]("has_discussions")
+    archived = LazyField[bool]("archived")
+    disabled = LazyField[bool]("disabled")
+    visibility = LazyField[Optional[str]]("visibility")
+    pushed_at = LazyField[datetime]("pushed_at", timestamp)
+    created_at = LazyField[datetime]("created_at", timestamp)
+    updated_at = LazyField[datetime]("updated_at", timestamp)
+    permissions = LazyField[Optional[PermissionsRecord]](
+        "permissions", PermissionsRecord
+    )
+    allow_rebase_merge = LazyField[Optional[bool]]("allow_rebase_merge")
+    template_repository = LazyField[Optional[RepositoryRecord]](
+        "template_repository", RepositoryRecord
+    )
+    temp_clone_token = LazyField[Optional[str]]("temp_clone_token")
+    allow_squash_merge = LazyField[Optional[bool]]("allow_squash_merge")
+    allow_auto_merge = LazyField[Optional[bool]]("allow_auto_merge")
+    delete_branch_on_merge = LazyField[Optional[bool]]("delete_branch_on_merge")
+    allow_merge_commit = LazyField[Optional[bool]]("allow_merge_commit")
+    allow_update_branch = LazyField[Optional[bool]]("allow_update_branch")
+    use_squash_pr_title_as_default = LazyField[Optional[bool]](
+        "use_squash_pr_title_as_default"
+    )
+    squash_merge_commit_title = LazyField[
+        Optional[Literal["PR_TITLE", "COMMIT_OR_PR_TITLE"]]
+    ]("squash_merge_commit_title")
+    squash_merge_commit_message = LazyField[
+        Optional[Literal["PR_BODY", "COMMIT_MESSAGES", "BLANK"]]
+    ]("squash_merge_commit_message")
+    merge_commit_title = LazyField[Optional[Literal["PR_TITLE", "MERGE_MESSAGE"]]](
+        "merge_commit_title"
+    )
+    merge_commit_message = LazyField[Optional[Literal["PR_BODY", "PR_TITLE", "BLANK"]]](
+        "merge_commit_message"
+    )
+    allow_forking = LazyField[Optional[bool]]("allow_forking")
+    web_commit_signoff_required = LazyField[Optional[bool]](
+        "web_commit_signoff_required"
+    )
+    subscribers_count = LazyField[int]("subscribers_count")
+    network_count = LazyField[int]("network_count")
+    license = LazyField[Optional[LicenseSimpleRecord]]("license", LicenseSimpleRecord)
+    organization = LazyField[Optional[SimpleUserRecord]](
+        "organization", SimpleUserRecord
+    )
+    parent = LazyField[Optional[RepositoryRecord]]("parent", RepositoryRecord)
+    source = LazyField[Optional[RepositoryRecord]]("source", RepositoryRecord)
+    forks = LazyField[int]("forks")
+    master_branch = LazyField[Optional[str]]("master_branch")
+    open_issues = LazyField[int]("open_issues")
+    watchers = LazyField[int]("watchers")
+    anonymous_access_enabled = LazyField[Optional[bool]]("anonymous_access_enabled")
+    code_of_conduct = LazyField[Optional[CodeOfConductSimpleRecord]](
+        "code_of_conduct", CodeOfConductSimpleRecord
+    )
+    security_and_analysis = LazyField[Optional[SecurityAndAnalysisRecord]](
+        "security_and_analysis", SecurityAndAnalysisRecord
+    )
+    custom_properties = LazyField[Optional[Dict[str, Any]]]("custom_properties")
+
+
+class CommitJSON(TypedDict):
+    sha: str
+    url: str
+
+
+class CommitRecord(LazyRecord):
+    sha = LazyField[str]("sha")
+    url = LazyField[str]("url")
+
+
+class TagJSON(TypedDict):
+    name: str
+    commit: CommitJSON
+    zipball_url: str
+    tarball_url: str
+    node_id: str
+
+
+class TagRecord(LazyRecord):
+    name = LazyField[str]("name")
+    commit = LazyField[CommitRecord]("commit", CommitRecord)
+    zipball_url = LazyField[str]("zipball_url")
+    tarball_url = LazyField[str]("tarball_url")
+    node_id = LazyField[str]("node_id")
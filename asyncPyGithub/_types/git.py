@@ -0,0 +1,140 @@
+from collections.abc import Mapping
+from datetime import datetime
+from typing import (
+    List,
+    Literal,
+    Optional,
+    TypedDict,
+)
+
+from pydantic import HttpUrl
+
+from .model import GitHubModel
+
+FileChanges = Mapping[str, Optional[bytes]]
+"""
+The files a commit writes, by path from the repository root.
+Bytes replace or add the file, None deletes it.
+"""
+
+
+class GitActorJSON(TypedDict):
+    name: str
+    email: str
+    date: datetime
+
+
+class GitReferenceJSON(TypedDict):
+    sha: str
+    url: HttpUrl
+
+
+class GitParentJSON(TypedDict):
+    sha: str
+    url: HttpUrl
+    html_url: HttpUrl
+
+
+class GitCommitJSON(TypedDict):
+    sha: str
+    node_id: str
+    url: HttpUrl
+    html_url: HttpUrl
+    author: GitActorJSON
+    committer: GitActorJSON
+    message: str
+    tree: GitReferenceJSON
+    parents: List[GitParentJSON]
+
+
+class GitBlobJSON(TypedDict):
+    sha: str
+    node_id: str
+    size: Optional[int]
+    url: HttpUrl
+    content: str
+    encoding: str
+
+
+class GitTreeEntryJSON(TypedDict):
+    path: str
+    mode: str
+    type: Literal["blob", "tree", "commit"]
+    sha: str
+    size: Optional[int]
+    url: Optional[HttpUrl]
+
+
+class GitTreeJSON(TypedDict):
+    sha: str
+    url: HttpUrl
+    tree: List[GitTreeEntryJSON]
+    truncated: bool
+
+
+class GitActor(GitHubModel):
+    name: str
+    email: str
+    date: datetime
+
+
+class GitReference(GitHubModel):
+    sha: str
+    url: HttpUrl
+
+
+class GitParent(GitReference):
+    html_url: Optional[HttpUrl] = None
+
+
+class GitCommit(GitHubModel):
+    """
+    A commit object, as created through the Git Data API.
+    """
+
+    sha: str
+    node_id: str
+    url: HttpUrl
+    html_url: HttpUrl
+    author: GitActor
+    committer: GitActor
+    message: str
+    tree: GitReference
+    parents: List[GitParent]
+
+
+class GitBlob(GitHubModel):
+    """
+    A blob object. `content` is base64 encoded when `encoding` is "base64".
+    """
+
+    sha: str
+    node_id: str
+    size: Optional[int] = None
+    url: HttpUrl
+    content: str
+    encoding: str
+
+
+class GitTreeEntry(GitHubModel):
+    """
+    One entry of a tree: a file ("blob"), a directory ("tree") or a submodule ("commit").
+    """
+
+    path: str
+    mode: str
+    type: Literal["blob", "tree", "commit"]
+    sha: str
+    size: Optional[int] = None
+    url: Optional[HttpUrl] = None
+
+
+class GitTree(GitHubModel):
+    """
+    A tree object. Recursive listings stop at GitHub's limit and set `truncated`.
+    """
+
+    sha: str
+    url: HttpUrl
+    tree: List[GitTreeEntry]
+    truncated: bool
@@ -0,0 +1,181 @@
+from collections.abc import Hashable, Iterator, Sequence
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import lru_cache
+from typing import Any, Literal, NamedTuple, TypeVar, cast, get_args, get_origin
+
+from pydantic import BaseModel, ConfigDict, ModelWrapValidatorHandler, create_model
+
+M = TypeVar("M", bound=BaseModel)
+
+
+class GitHubModel(BaseModel):
+    """
+    Base class for the response models.
+    Validation schemas are built on first use rather than at class creation,
+    so importing the models stays cheap.
+    """
+
+    model_config = ConfigDict(defer_build=True)
+
+
+class _Projection(GitHubModel):
+    """
+    Base class of the models built by `project`.
+    They are built at runtime, so instances pickle by full model and field names
+    and the class is rebuilt on the other side.
+    """
+
+    def __reduce__(self) -> tuple[Any, ...]:
+        model, fields = _PROJECTIONS[type(self)]
+        return (_unpickle, (model, fields, self.__getstate__()))
+
+
+def _unpickle(
+    model: type[GitHubModel], fields: tuple[str, ...], state: dict[Any, Any]
+) -> GitHubModel:
+    projection = _project(model, fields)
+    instance = projection.__new__(projection)
+    instance.__setstate__(state)
+    return instance
+
+
+def project(model: type[GitHubModel], fields: Sequence[str]) -> type[GitHubModel]:
+    """
+    Build a model holding only some of another model's fields.
+    The other keys of the payload are skipped by the validator rather than parsed and stored.
+    Args:
+        model (type[GitHubModel]): The full response model, e.g. `MinimalRepository`.
+        fields (Sequence[str]): The field names to keep.
+    Returns:
+        type[GitHubModel]: The projection model, shared by every call with the same fields.
+    """
+    return _project(model, tuple(dict.fromkeys(fields)))
+
+
+@lru_cache(maxsize=None)
+def _project(model: type[GitHubModel], fields: tuple[str, ...]) -> type[GitHubModel]:
+    unknown = [name for name in fields if name not in model.model_fields]
+    if unknown:
+        raise ValueError(f"{model.__name__} has no fields {', '.join(unknown)}")
+
+    definitions: dict[str, Any] = {
+        name: (model.model_fields[name].annotation, model.model_fields[name])
+        for name in fields
+    }
+    projection = create_model(
+        f"{model.__name__}Projection", __base__=_Projection, **definitions
+    )
+    _PROJECTIONS[projection] = (model, fields)
+    return projection
+
+
+_PROJECTIONS: dict[type[GitHubModel], tuple[type[GitHubModel], tuple[str, ...]]] = {}
+"""
+The full model and field names each projection was built from.
+"""
+
+
+class ProjectionSpec(NamedTuple):
+    """
+    A projection, or a list of one, by full model and field names.
+    Sent to worker processes in place of the projection itself,
+    which is built at runtime and so cannot be pickled.
+    """
+
+    model: type[GitHubModel]
+    fields: tuple[str, ...]
+    many: bool = False
+
+    def build(self) -> Any:
+        """
+        Rebuild the type form in this process.
+        """
+        projection = _project(self.model, self.fields)
+        return list[projection] if self.many else projection  # type: ignore[valid-type]
+
+
+def portable(target: Any) -> Any:
+    """
+    A picklable stand-in for `target`: a `ProjectionSpec` for a projection or
+    a list of one, else `target` itself.
+    """
+    many = get_origin(target) is list
+    source = _PROJECTIONS.get(get_args(target)[0] if many else target)
+    return target if source is None else ProjectionSpec(*source, many)
+
+
+InternScope = Literal["response", "session"]
+"""
+How long nested objects are shared: within one response body, or until
+`GitHubPortal.intern_nested` is called again.
+"""
+
+
+class IdentityMap:
+    """
+    The instances of interned models seen so far, keyed by model class and identity field.
+    """
+
+    __slots__ = ("_objects",)
+
+    def __init__(self) -> None:
+        self._objects: dict[tuple[type[BaseModel], Hashable], BaseModel] = {}
+
+    def __len__(self) -> int:
+        return len(self._objects)
+
+    def put(self, model: type[BaseModel], key: Hashable, instance: BaseModel) -> None:
+        """
+        Make `instance` the shared one for its identity, e.g. a newer copy from a webhook.
+        """
+        self._objects[(model, key)] = instance
+
+    def discard(self, model: type[BaseModel], key: Hashable) -> None:
+        self._objects.pop((model, key), None)
+
+    def clear(self) -> None:
+        self._objects.clear()
+
+
+IDENTITY_MAP: ContextVar[IdentityMap | None] = ContextVar("IDENTITY_MAP", default=None)
+"""
+The identity map used by validation in the current context, if interning is on.
+"""
+
+
+@contextmanager
+def interning(identity_map: IdentityMap | None = None) -> Iterator[IdentityMap]:
+    """
+    Share interned nested objects for the validation done inside the block.
+    Args:
+        identity_map (IdentityMap | None, optional): A map to reuse across blocks. Defaults to a fresh one.
+    Yields:
+        IdentityMap: The map in use.
+    """
+    identity_map = identity_map if identity_map is not None else IdentityMap()
+    token = IDENTITY_MAP.set(identity_map)
+    try:
+        yield identity_map
+    finally:
+        IDENTITY_MAP.reset(token)
+
+
+def intern(
+    model: type[M], key: str, data: Any, handler: ModelWrapValidatorHandler[M]
+) -> M:
+    """
+    Body of the wrap validator of an interned model: return the instance already
+    validated for the same `key` value, or validate and remember this one.
+    Hits skip validation entirely. The first instance wins, so shared instances
+    should be treated as read-only.
+    """
+    identity_map = IDENTITY_MAP.get()
+    if identity_map is None or not isinstance(data, dict) or key not in data:
+        return handler(data)
+
+    identity = (model, data[key])
+    cached = identity_map._objects.get(identity)
+    if cached is None:
+        cached = identity_map._objects[identity] = handler(data)
+    return cast(M, cached)
@@ -0,0 +1,46 @@
+from typing import (
+    Dict,
+    Optional,
+    TypedDict,
+)
+
+from .model import GitHubModel
+
+
+class RateLimitJSON(TypedDict):
+    limit: int
+    remaining: int
+    reset: int
+    used: int
+    resource: Optional[str]
+
+
+class RateLimitOverviewJSON(TypedDict):
+    resources: Dict[str, RateLimitJSON]
+    rate: RateLimitJSON
+
+
+class RateLimit(GitHubModel):
+    """
+    The budget of one rate limit resource.
+    Attributes:
+        limit (int): The requests allowed per window.
+        remaining (int): The requests left in the current window.
+        reset (int): The epoch second the window resets at.
+        used (int): The requests made in the current window.
+    """
+
+    limit: int
+    remaining: int
+    reset: int
+    used: int
+    resource: Optional[str] = None
+
+
+class RateLimitOverview(GitHubModel):
+    """
+    Every rate limit resource of the authenticated user or app, e.g. "core", "search" and "graphql".
+    """
+
+    resources: Dict[str, RateLimit]
+    rate: RateLimit
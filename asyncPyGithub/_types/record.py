@@ -0,0 +1,119 @@
+from collections.abc import Callable
+from datetime import datetime
+from json import loads
+from typing import Any, Generic, TypeVar, cast, overload
+
+from pydantic import BaseModel
+from typing_extensions import Self
+
+T = TypeVar("T")
+R = TypeVar("R", bound="LazyRecord")
+M = TypeVar("M", bound=BaseModel)
+
+
+class LazyField(Generic[T]):
+    """
+    A record attribute that converts its raw JSON value on first access.
+    The converted value is stored on the instance, shadowing the descriptor,
+    so later reads are plain attribute lookups.
+    """
+
+    __slots__ = ("key", "convert", "name")
+
+    def __init__(self, key: str, convert: Callable[[Any], Any] | None = None) -> None:
+        self.key = key
+        self.convert = convert
+        self.name = key
+
+    def __set_name__(self, owner: type["LazyRecord"], name: str) -> None:
+        self.name = name
+
+    @overload
+    def __get__(self, obj: None, owner: type["LazyRecord"]) -> Self: ...
+
+    @overload
+    def __get__(self, obj: "LazyRecord", owner: type["LazyRecord"]) -> T: ...
+
+    def __get__(
+        self, obj: "LazyRecord | None", owner: type["LazyRecord"]
+    ) -> "T | Self":
+        if obj is None:
+            return self
+
+        value = obj._raw.get(self.key)
+        if value is not None and self.convert is not None:
+            value = self.convert(value)
+        obj.__dict__[self.name] = value
+        return cast(T, value)
+
+
+class LazyRecord:
+    """
+    Base class for the decoders generated from the bundled JSON schemas.
+    A record only parses the JSON document; each field is converted when it is
+    first read, so reading a few fields of a large payload skips validating the rest.
+    Use `model()` to validate the whole document into a response model.
+    """
+
+    def __init__(self, raw: dict[str, Any]) -> None:
+        self._raw = raw
+
+    @classmethod
+    def decode(cls, body: bytes | str) -> Self:
+        """
+        Decode a single JSON object.
+        Args:
+            body (bytes | str): The raw JSON document.
+        Returns:
+            Self: The record wrapping the document.
+        """
+        return cls(loads(body))
+
+    @classmethod
+    def decode_many(cls, body: bytes | str) -> list[Self]:
+        """
+        Decode a JSON array of objects, such as a page of a list endpoint.
+        Args:
+            body (bytes | str): The raw JSON document.
+        Returns:
+            list[Self]: One record per array element.
+        """
+        return [cls(item) for item in loads(body)]
+
+    @property
+    def raw(self) -> dict[str, Any]:
+        """
+        The decoded JSON object backing the record.
+        """
+        return self._raw
+
+    def model(self, target: type[M]) -> M:
+        """
+        Validate the whole document into a response model.
+        Args:
+            target (type[M]): The model class, e.g. `FullRepository`.
+        Returns:
+            M: The validated model.
+        """
+        return target.model_validate(self._raw)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({len(self._raw)} fields)"
+
+
+def records(cls: type[R]) -> Callable[[list[dict[str, Any]]], list[R]]:
+    """
+    Converter for a field holding an array of objects.
+    """
+
+    def convert(items: list[dict[str, Any]]) -> list[R]:
+        return [cls(item) for item in items]
+
+    return convert
+
+
+def timestamp(value: str) -> datetime:
+    """
+    Converter for `date-time` formatted fields.
+    """
+    return datetime.fromisoformat(value)
@@ -9,8 +9,10 @@ from typing import (
     TypedDict,
 )
 
-from pydantic import BaseModel, HttpUrl
+from pydantic import HttpUrl, ModelWrapValidatorHandler, model_validator
+from typing_extensions import Self
 
+from .model import GitHubModel, intern
 from .users import SimpleUser, SimpleUserJSON
 
 RepositoryType = Literal[
@@ -51,19 +53,6 @@ class NullDict(TypedDict):
     type: Literal["null"]
 
 
-class CommitJSON(TypedDict):
-    sha: str
-    url: HttpUrl
-
-
-class TagJSON(TypedDict):
-    name: str
-    commit: CommitJSON
-    zipball_url: HttpUrl
-    tarball_url: HttpUrl
-    node_id: str
-
-
 class TopicsJSON(TypedDict):
     names: List[str]
 
@@ -200,112 +189,8 @@ class MinimalRepositoryJSON(TypedDict):
     custom_properties: NotRequired[Dict[str, Any]]
 
 
-class FullRepositoryJSON(TypedDict, total=False):
-    id: int
-    node_id: str
-    name: str
-    full_name: str
-    owner: SimpleUserJSON
-    private: bool
-    html_url: HttpUrl
-    description: Optional[str]
-    fork: bool
-    url: HttpUrl
-    archive_url: str
-    assignees_url: str
-    blobs_url: str
-    branches_url: str
-    collaborators_url: str
-    comments_url: str
-    commits_url: HttpUrl
-    compare_url: HttpUrl
-    contents_url: HttpUrl
-    contributors_url: HttpUrl
-    deployments_url: HttpUrl
-    downloads_url: HttpUrl
-    events_url: HttpUrl
-    forks_url: HttpUrl
-    git_commits_url: HttpUrl
-    git_refs_url: HttpUrl
-    git_tags_url: HttpUrl
-    hooks_url: HttpUrl
-    issue_comment_url: HttpUrl
-    issue_events_url: HttpUrl
-    issues_url: HttpUrl
-    keys_url: HttpUrl
-    labels_url: HttpUrl
-    languages_url: HttpUrl
-    merges_url: HttpUrl
-    milestones_url: HttpUrl
-    notifications_url: HttpUrl
-    pulls_url: HttpUrl
-    releases_url: HttpUrl
-    ssh_url: HttpUrl
-    stargazers_url: HttpUrl
-    statuses_url: HttpUrl
-    subscribers_url: HttpUrl
-    subscription_url: HttpUrl
-    tags_url: HttpUrl
-    teams_url: HttpUrl
-    trees_url: HttpUrl
-    clone_url: HttpUrl
-    mirror_url: Optional[HttpUrl]
-    svn_url: HttpUrl
-    homepage: Optional[str]
-    language: Optional[str]
-    forks_count: int
-    stargazers_count: int
-    watchers_count: int
-    size: int
-    default_branch: str
-    open_issues_count: int
-    is_template: bool
-    topics: List[str]
-    has_issues: bool
-    has_projects: bool
-    has_wiki: bool
-    has_pages: bool
-    has_downloads: bool
-    has_discussions: bool
-    archived: bool
-    disabled: bool
-    visibility: Literal["public", "private", "internal"]
-    pushed_at: str
-    created_at: str
-    updated_at: str
-    permissions: PermissionsJSON
-    allow_rebase_merge: bool
-    template_repository: Optional[MinimalRepositoryJSON]
-    temp_clone_token: Optional[str]
-    allow_squash_merge: bool
-    allow_auto_merge: bool
-    delete_branch_on_merge: bool
-    allow_merge_commit: bool
-    use_squash_pr_title_as_default: bool
-    squash_merge_commit_title: Literal["PR_TITLE", "COMMIT_OR_PR_TITLE"]
-    squash_merge_commit_message: Literal["PR_BODY", "COMMIT_MESSAGES", "BLANK"]
-    merge_commit_title: Literal["PR_TITLE", "MERGE_MESSAGE"]
-    merge_commit_message: Literal["PR_BODY", "PR_TITLE", "BLANK"]
-    allow_forking: bool
-    web_commit_signoff_required: bool
-    subscribers_count: int
-    network_count: int
-    license: Optional[LicenseJSON]
-    organization: Optional[SimpleUserJSON]
-    parent: Optional[MinimalRepositoryJSON]
-    source: Optional[MinimalRepositoryJSON]
-    forks: int
-    master_branch: str
-    open_issues: int
-    watchers: int
-    anonymous_access_enabled: bool
-    code_of_conduct: Optional[CodeOfConductJSON]
-    security_and_analysis: Optional[SecurityAndAnalysisJSON]
-    custom_properties: Optional[Dict[str, Any]]
-
-
 # Pydantic models
-class Permissions(BaseModel):
+class Permissions(GitHubModel):
     admin: bool
     maintain: bool
     push: bool
@@ -313,7 +198,7 @@ class Permissions(BaseModel):
     pull: bool
 
 
-class CodeOfConduct(BaseModel):
+class CodeOfConduct(GitHubModel):
     key: str
     name: str
     url: HttpUrl
@@ -321,19 +206,24 @@ class CodeOfConduct(BaseModel):
     html_url: Optional[HttpUrl] = None
 
 
-class License(BaseModel):
+class License(GitHubModel):
     key: str
     name: str
     spdx_id: str
     node_id: str
     url: Optional[HttpUrl] = None
 
+    @model_validator(mode="wrap")
+    @classmethod
+    def _intern(cls, data: Any, handler: ModelWrapValidatorHandler[Self]) -> Self:
+        return intern(cls, "key", data, handler)
+
 
-class SecurityStatus(BaseModel):
+class SecurityStatus(GitHubModel):
     status: Literal["enabled", "disabled"]
 
 
-class SecurityAndAnalysis(BaseModel):
+class SecurityAndAnalysis(GitHubModel):
     advanced_security: Optional[SecurityStatus] = None
     code_security: Optional[SecurityStatus] = None
     dependabot_security_updates: Optional[SecurityStatus] = None
@@ -343,7 +233,7 @@ class SecurityAndAnalysis(BaseModel):
     secret_scanning_ai_detection: Optional[SecurityStatus] = None
 
 
-class MinimalRepository(BaseModel):
+class MinimalRepository(GitHubModel):
     id: int
     node_id: str
     name: str
@@ -436,7 +326,7 @@ class MinimalRepository(BaseModel):
     custom_properties: Optional[Dict[str, Any]] = None
 
 
-class FullRepository(BaseModel):
+class FullRepository(GitHubModel):
     id: int
     node_id: str
     name: str
@@ -541,12 +431,12 @@ class FullRepository(BaseModel):
     custom_properties: Optional[Dict[str, Any]] = None
 
 
-class Commit(BaseModel):
+class Commit(GitHubModel):
     sha: str
     url: HttpUrl
 
 
-class Tag(BaseModel):
+class Tag(GitHubModel):
     name: str
     commit: Commit
     zipball_url: HttpUrl
@@ -554,5 +444,5 @@ class Tag(BaseModel):
     node_id: str
 
 
-class Topics(BaseModel):
+class Topics(GitHubModel):
     names: List[str]
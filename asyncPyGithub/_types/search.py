@@ -0,0 +1,92 @@
+from typing import (
+    Generic,
+    List,
+    Literal,
+    TypedDict,
+    TypeVar,
+)
+
+from pydantic import HttpUrl
+
+from .model import GitHubModel
+from .repos import MinimalRepository, MinimalRepositoryJSON
+
+T = TypeVar("T")
+
+SearchOrder = Literal["asc", "desc"]
+"""
+The direction search results are sorted in, when a sort is given.
+"""
+
+
+RepositorySearchSort = Literal["stars", "forks", "help-wanted-issues", "updated"]
+"""
+The criteria repository search results can be sorted by. Defaults to best match.
+"""
+
+
+UserSearchSort = Literal["followers", "repositories", "joined"]
+"""
+The criteria user search results can be sorted by. Defaults to best match.
+"""
+
+
+RepositorySplit = Literal["created", "pushed", "size", "stars"]
+"""
+The qualifiers a repository search can be split on to get past the 1000 result cap.
+`created` and `pushed` split by date, `size` (KB) and `stars` by value.
+"""
+
+
+UserSplit = Literal["created", "followers", "repos"]
+"""
+The qualifiers a user search can be split on to get past the 1000 result cap.
+"""
+
+
+CodeSplit = Literal["size"]
+"""
+The qualifier a code search can be split on to get past the 1000 result cap (file size in bytes).
+"""
+
+
+class SearchResultsJSON(TypedDict):
+    total_count: int
+    incomplete_results: bool
+    items: List[dict[str, object]]
+
+
+class SearchResults(GitHubModel, Generic[T]):
+    """
+    One page of search results.
+    """
+
+    total_count: int
+    incomplete_results: bool
+    items: List[T]
+
+
+class CodeSearchResultJSON(TypedDict):
+    name: str
+    path: str
+    sha: str
+    url: HttpUrl
+    git_url: HttpUrl
+    html_url: HttpUrl
+    repository: MinimalRepositoryJSON
+    score: float
+
+
+class CodeSearchResult(GitHubModel):
+    """
+    A file matched by a code search.
+    """
+
+    name: str
+    path: str
+    sha: str
+    url: HttpUrl
+    git_url: HttpUrl
+    html_url: HttpUrl
+    repository: MinimalRepository
+    score: float
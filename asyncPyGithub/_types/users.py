@@ -1,30 +1,15 @@
-from pydantic import BaseModel, EmailStr, HttpUrl, PastDatetime
-from typing_extensions import Optional, TypedDict
+from typing import Any
 
+from pydantic import (
+    EmailStr,
+    HttpUrl,
+    ModelWrapValidatorHandler,
+    PastDatetime,
+    model_validator,
+)
+from typing_extensions import Optional, Self, TypedDict
 
-class ContributorJSON(TypedDict):
-    contributions: int
-    type: str
-    login: Optional[str]
-    id: Optional[int]
-    node_id: Optional[str]
-    avatar_url: Optional[HttpUrl]
-    gravatar_id: Optional[str]
-    url: Optional[HttpUrl]
-    html_url: Optional[HttpUrl]
-    followers_url: Optional[HttpUrl]
-    following_url: Optional[str]
-    gists_url: Optional[str]
-    starred_url: Optional[str]
-    subscriptions_url: Optional[HttpUrl]
-    organizations_url: Optional[HttpUrl]
-    repos_url: Optional[HttpUrl]
-    events_url: Optional[str]
-    received_events_url: Optional[HttpUrl]
-    site_admin: Optional[bool]
-    email: Optional[EmailStr]
-    name: Optional[str]
-    user_view_type: Optional[str]
+from .model import GitHubModel, intern
 
 
 class UserPlanJSON(TypedDict):
@@ -91,7 +76,7 @@ class PrivateUserJSON(TypedDict, total=False):
     ldap_dn: Optional[str]
 
 
-class PrivateUser(BaseModel):
+class PrivateUser(GitHubModel):
     """
     A GitHub User.
     """
@@ -173,7 +158,7 @@ class SimpleUserJSON(TypedDict):
     user_view_type: Optional[str]
 
 
-class SimpleUser(BaseModel):
+class SimpleUser(GitHubModel):
     """
     A simple GitHub user.
     """
@@ -201,6 +186,11 @@ class SimpleUser(BaseModel):
     starred_at: Optional[str] = None
     user_view_type: Optional[str] = None
 
+    @model_validator(mode="wrap")
+    @classmethod
+    def _intern(cls, data: Any, handler: ModelWrapValidatorHandler[Self]) -> Self:
+        return intern(cls, "id", data, handler)
+
 
 HoverCardSchema = {
     "title": "Hovercard",
@@ -232,7 +222,7 @@ class HoverCardContextJSON(TypedDict):
     octicon: str
 
 
-class HoverCardContext(BaseModel):
+class HoverCardContext(GitHubModel):
     """
     A context for a GitHub Hovercard.
     """
@@ -249,7 +239,7 @@ class HoverCardJSON(TypedDict):
     contexts: list[HoverCardContextJSON]
 
 
-class HoverCard(BaseModel):
+class HoverCard(GitHubModel):
     """
     A GitHub Hovercard.
     """
@@ -257,7 +247,7 @@ class HoverCard(BaseModel):
     contexts: list[HoverCardContext]
 
 
-class Contributor(BaseModel):
+class Contributor(GitHubModel):
     """
     A GitHub contributor.
     """
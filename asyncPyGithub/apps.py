@@ -0,0 +1,257 @@
+from __future__ import annotations
+
+from asyncio import CancelledError, Lock, Task, create_task, sleep
+from base64 import urlsafe_b64encode
+from contextlib import suppress
+from json import dumps
+from time import time
+from typing import TYPE_CHECKING, Final
+
+from typing_extensions import Self
+
+from ._types import ErrorMessage, GitHubPortal, InstallationToken
+from .base import LOGGER
+from .scheduling import CURRENT_DEADLINE
+
+if TYPE_CHECKING:
+    from cryptography.hazmat.primitives.asymmetric.rsa import RSAPrivateKey
+
+JWT_LIFETIME: Final[int] = 540
+"""
+Seconds an app JWT is valid for. GitHub allows ten minutes, less the clock drift below.
+"""
+
+CLOCK_DRIFT: Final[int] = 60
+"""
+Seconds the JWT is backdated by, in case our clock is ahead of GitHub's.
+"""
+
+REFRESH_MARGIN: Final[float] = 300.0
+"""
+Seconds before expiry an installation token is replaced.
+"""
+
+RETRY_DELAY: Final[float] = 10.0
+"""
+Seconds between attempts when a background refresh fails.
+"""
+
+
+def _b64(data: bytes) -> str:
+    return urlsafe_b64encode(data).rstrip(b"=").decode()
+
+
+def _load_key(private_key: str | bytes) -> RSAPrivateKey:
+    try:
+        from cryptography.hazmat.primitives.asymmetric.rsa import RSAPrivateKey
+        from cryptography.hazmat.primitives.serialization import load_pem_private_key
+    except ImportError as e:
+        raise ImportError(
+            "GitHub App authentication needs the 'cryptography' package: "
+            "pip install asyncPyGithub[app]"
+        ) from e
+
+    pem = private_key.encode() if isinstance(private_key, str) else private_key
+    key = load_pem_private_key(pem, password=None)
+    if not isinstance(key, RSAPrivateKey):
+        raise ValueError("GitHub App private keys are RSA keys")
+    return key
+
+
+class GitHubApp:
+    """
+    Authenticates as a GitHub App: signs the app JWT and exchanges it for installation tokens.
+
+    Tokens are cached per installation. Each installation a token was minted for gets a
+    background task that mints its replacement `refresh_margin` seconds before expiry,
+    so callers never wait on a refresh and never hold an expired token.
+
+        app = GitHubApp(app_id, private_key)
+        await app.authenticate(installation_id)  # every portal now uses the installation token
+        ...
+        await app.close()
+
+    Minting does not go through the scheduler: it counts against the app's own rate limit,
+    not the installation's, and must not queue behind the work it unblocks.
+
+    Attributes:
+        app_id (int | str): The app ID, or client ID, used as the JWT issuer.
+        refresh_margin (float): Seconds before expiry a token is replaced.
+        endpoint (str): The API root tokens are minted at, e.g. a GitHub Enterprise host or a local stand-in.
+    """
+
+    __slots__ = (
+        "app_id",
+        "refresh_margin",
+        "endpoint",
+        "_key",
+        "_jwt",
+        "_jwt_expires",
+        "_tokens",
+        "_locks",
+        "_refreshers",
+        "_active",
+    )
+
+    def __init__(
+        self,
+        app_id: int | str,
+        private_key: str | bytes,
+        refresh_margin: float = REFRESH_MARGIN,
+        endpoint: str | None = None,
+    ) -> None:
+        self.app_id = app_id
+        self.refresh_margin = refresh_margin
+        self.endpoint = (endpoint or GitHubPortal._endpoint).rstrip("/")
+        self._key = _load_key(private_key)
+        self._jwt = ""
+        self._jwt_expires = 0.0
+        self._tokens: dict[int, InstallationToken] = {}
+        self._locks: dict[int, Lock] = {}
+        self._refreshers: dict[int, Task[None]] = {}
+        self._active: int | None = None
+
+    def jwt(self: Self) -> str:
+        """
+        The app JWT, signed with RS256. It is reused until a minute before it expires.
+        Returns:
+            str: The encoded token.
+        """
+        now = time()
+        if now < self._jwt_expires - CLOCK_DRIFT:
+            return self._jwt
+
+        from cryptography.hazmat.primitives.asymmetric.padding import PKCS1v15
+        from cryptography.hazmat.primitives.hashes import SHA256
+
+        issued = int(now) - CLOCK_DRIFT
+        claims = {"iat": issued, "exp": issued + JWT_LIFETIME, "iss": str(self.app_id)}
+        signing_input = ".".join(
+            _b64(dumps(part, separators=(",", ":")).encode())
+            for part in ({"alg": "RS256", "typ": "JWT"}, claims)
+        )
+        signature = self._key.sign(signing_input.encode(), PKCS1v15(), SHA256())
+        self._jwt = f"{signing_input}.{_b64(signature)}"
+        self._jwt_expires = issued + JWT_LIFETIME
+        return self._jwt
+
+    def _due(self: Self, token: InstallationToken) -> float:
+        """
+        Seconds until a token should be replaced. Tokens shorter-lived than the margin
+        are replaced halfway through, rather than immediately and over again.
+        """
+        lifetime = token.expires_at.timestamp() - time()
+        return max(lifetime - self.refresh_margin, lifetime / 2, 0.0)
+
+    async def _mint(
+        self: Self, installation_id: int
+    ) -> tuple[int, InstallationToken | ErrorMessage]:
+        endpoint = f"{self.endpoint}/app/installations/{installation_id}/access_tokens"
+        try:
+            await GitHubPortal.start()
+            if GitHubPortal._client is None:
+                raise RuntimeError("HTTP client is not initialized.")
+            res = await GitHubPortal._client.post(
+                endpoint,
+                headers={
+                    "accept": "application/vnd.github+json",
+                    "authorization": f"Bearer {self.jwt()}",
+                },
+            )
+            if res.status_code != 201:
+                return (
+                    res.status_code,
+                    ErrorMessage(
+                        code=res.status_code,
+                        message=res.json().get("message", "Unknown error"),
+                        endpoint=endpoint,
+                    ),
+                )
+            token = await GitHubPortal.parse(res, InstallationToken)
+        except Exception as e:
+            return (500, ErrorMessage(code=500, message=str(e), endpoint=endpoint))
+
+        self._tokens[installation_id] = token
+        if installation_id == self._active:
+            GitHubPortal._set_authorization(token.token)
+        return (res.status_code, token)
+
+    async def _refresh(self: Self, installation_id: int) -> None:
+        """
+        Keep one installation's cached token ahead of its expiry.
+        A failed refresh is retried while the old token is still good.
+        """
+        # Started from whatever call minted the first token; its deadline is not ours.
+        CURRENT_DEADLINE.set(None)
+        delay = self._due(self._tokens[installation_id])
+        while True:
+            await sleep(delay)
+            status, token = await self._mint(installation_id)
+            if isinstance(token, ErrorMessage):
+                LOGGER.warning(
+                    f"GitHubApp:::Refreshing installation {installation_id} failed with {status}: {token.message}"
+                )
+                delay = RETRY_DELAY
+            else:
+                LOGGER.info(f"GitHubApp:::Refreshed installation {installation_id}")
+                delay = self._due(token)
+
+    async def installation_token(
+        self: Self, installation_id: int
+    ) -> tuple[int, InstallationToken | ErrorMessage]:
+        """
+        Get a token for an installation, minting it only if none is cached.
+        Concurrent callers share one exchange, and the token is kept fresh from then on.
+        Available: [https://docs.github.com/en/rest/apps/apps?apiVersion=2022-11-28#create-an-installation-access-token-for-an-app](https://docs.github.com/en/rest/apps/apps?apiVersion=2022-11-28#create-an-installation-access-token-for-an-app)
+        Args:
+            installation_id (int): The installation to act as.
+        Returns:
+            tuple[int, InstallationToken | ErrorMessage]: A tuple containing the status code and the token, or an error message.
+        """
+        lock = self._locks.setdefault(installation_id, Lock())
+        async with lock:
+            token = self._tokens.get(installation_id)
+            if (
+                token is not None
+                and token.expires_at.timestamp() - time() > CLOCK_DRIFT
+            ):
+                return (200, token)
+
+            status, minted = await self._mint(installation_id)
+            if isinstance(minted, InstallationToken):
+                refresher = self._refreshers.get(installation_id)
+                if refresher is None or refresher.done():
+                    self._refreshers[installation_id] = create_task(
+                        self._refresh(installation_id)
+                    )
+            return (status, minted)
+
+    async def authenticate(
+        self: Self, installation_id: int
+    ) -> tuple[int, InstallationToken | ErrorMessage]:
+        """
+        Make every portal act as an installation, and keep its token current.
+        Unlike `GitHubPortal.authenticate`, no `/user` request is made; installations have no user.
+        Args:
+            installation_id (int): The installation to act as.
+        Returns:
+            tuple[int, InstallationToken | ErrorMessage]: A tuple containing the status code and the token, or an error message.
+        """
+        status, token = await self.installation_token(installation_id)
+        if isinstance(token, InstallationToken):
+            self._active = installation_id
+            # Refreshed tokens act as the same installation, so they keep its cache entries.
+            GitHubPortal.use_token(token.token, f"installation:{installation_id}")
+        return (status, token)
+
+    async def close(self: Self) -> None:
+        """
+        Stop refreshing tokens. Cached tokens stay usable until they expire.
+        """
+        refreshers = list(self._refreshers.values())
+        self._refreshers.clear()
+        for refresher in refreshers:
+            refresher.cancel()
+        for refresher in refreshers:
+            with suppress(CancelledError):
+                await refresher
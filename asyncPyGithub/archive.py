@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+import tarfile
+from asyncio import (
+    AbstractEventLoop,
+    Queue,
+    QueueEmpty,
+    create_task,
+    get_running_loop,
+    run_coroutine_threadsafe,
+    to_thread,
+)
+from collections.abc import AsyncIterable, Callable, Iterator
+from contextlib import suppress
+from pathlib import Path
+from typing import Final, Literal
+
+from typing_extensions import Any, Self
+
+from .base import LOGGER
+
+ArchiveFormat = Literal["tarball", "zipball"]
+"""
+The archive formats GitHub serves a repository snapshot in.
+"""
+
+CHUNK_SIZE: Final[int] = 64 * 1024
+"""
+Default number of bytes read from the network per chunk.
+"""
+
+BUFFERED_CHUNKS: Final[int] = 16
+"""
+Default number of chunks held between the network and the disk, bounding memory
+to about a megabyte however large the archive is.
+"""
+
+
+class ChunkPipe:
+    """
+    A bounded hand-off between a coroutine reading a response and a thread writing it out.
+    The coroutine side blocks on `put` while the buffer is full, so a slow disk slows the
+    download instead of growing memory. The thread side reads it as a file object, which
+    is what `tarfile` needs to extract a stream.
+    """
+
+    def __init__(self: Self, loop: AbstractEventLoop, maxsize: int) -> None:
+        self._loop = loop
+        self._queue: Queue[bytes] = Queue(maxsize)
+        self._pending = b""
+        self._eof = False
+        self.error: BaseException | None = None
+
+    async def put(self: Self, chunk: bytes) -> None:
+        if self.error is not None:
+            raise self.error
+        if chunk:
+            await self._queue.put(chunk)
+
+    async def close(self: Self) -> None:
+        """
+        Signal the end of the stream once the reader has room for it.
+        """
+        await self._queue.put(b"")
+
+    def abort(self: Self) -> None:
+        """
+        Signal the end of a failed stream without waiting. Chunks the reader has not
+        taken yet are dropped, leaving the reader a truncated but gapless stream.
+        """
+        with suppress(QueueEmpty):
+            while True:
+                self._queue.get_nowait()
+        self._queue.put_nowait(b"")
+
+    def _next(self: Self) -> bytes:
+        if self._eof:
+            return b""
+        chunk = run_coroutine_threadsafe(self._queue.get(), self._loop).result()
+        self._eof = not chunk
+        return chunk
+
+    def read(self: Self, size: int = -1) -> bytes:
+        if size < 0:
+            return self._pending + b"".join(self.chunks())
+        while len(self._pending) < size and not self._eof:
+            self._pending += self._next()
+        data, self._pending = self._pending[:size], self._pending[size:]
+        return data
+
+    def chunks(self: Self) -> Iterator[bytes]:
+        if self._pending:
+            yield self._pending
+            self._pending = b""
+        while chunk := self._next():
+            yield chunk
+
+    def drain(self: Self) -> None:
+        for _ in self.chunks():
+            pass
+
+
+def write_to(pipe: ChunkPipe, path: Path, append: bool = False) -> None:
+    with path.open("ab" if append else "wb") as file:
+        for chunk in pipe.chunks():
+            file.write(chunk)
+
+
+def _extract_plain(archive: tarfile.TarFile, directory: Path) -> None:
+    # Before Python 3.11.4 tarfile has no extraction filters. Only files and directories
+    # landing inside `directory` are written; links and special files are skipped.
+    root = directory.resolve()
+    for member in archive:
+        target = (root / member.name).resolve()
+        if not (member.isfile() or member.isdir()) or not target.is_relative_to(root):
+            LOGGER.warning(f"Archive:::Skipping unsafe member {member.name}")
+            continue
+        member.mode &= 0o755
+        archive.extract(member, root)
+
+
+def _skip_unsafe(member: tarfile.TarInfo, path: str) -> tarfile.TarInfo | None:
+    # The "data" filter, but skipping what it rejects like `_extract_plain` does
+    # rather than aborting the rest of the extraction.
+    try:
+        return tarfile.data_filter(member, path)
+    except tarfile.FilterError:
+        LOGGER.warning(f"Archive:::Skipping unsafe member {member.name}")
+        return None
+
+
+def extract_to(pipe: ChunkPipe, directory: Path) -> None:
+    directory.mkdir(parents=True, exist_ok=True)
+    # "r|gz" reads strictly forward, so members are written out as they arrive.
+    with tarfile.open(fileobj=pipe, mode="r|gz") as archive:  # type: ignore[call-overload]
+        if hasattr(tarfile, "data_filter"):
+            archive.extractall(directory, filter=_skip_unsafe)
+        else:
+            _extract_plain(archive, directory)
+
+
+def _consume(pipe: ChunkPipe, sink: Callable[..., None], *args: Any) -> None:
+    try:
+        sink(pipe, *args)
+    except BaseException as e:
+        pipe.error = e
+        raise
+    finally:
+        # Unblock the producer whether or not the sink read everything.
+        pipe.drain()
+
+
+async def pump(
+    chunks: AsyncIterable[bytes],
+    sink: Callable[..., None],
+    *args: Any,
+    buffer: int = BUFFERED_CHUNKS,
+) -> None:
+    """
+    Feed a stream of chunks to a blocking sink running in a worker thread.
+
+    Args:
+        chunks (AsyncIterable[bytes]): The chunks to write, e.g. `response.aiter_bytes()`.
+        sink (Callable[..., None]): Called as `sink(pipe, *args)` in a thread, reading the pipe to its end.
+        *args: Further arguments to the sink.
+        buffer (int, optional): The number of chunks to hold while the sink is busy. Defaults to 16.
+
+    Raises:
+        Exception: Whatever the stream or the sink raised first.
+    """
+    pipe = ChunkPipe(get_running_loop(), buffer)
+    task = create_task(to_thread(_consume, pipe, sink, *args))
+    try:
+        async for chunk in chunks:
+            await pipe.put(chunk)
+    except Exception:
+        # Keep what arrived, so a file download can resume from it. The sink fails
+        # on the truncated stream too, but the download error is the cause.
+        await pipe.close()
+        with suppress(Exception):
+            await task
+        raise
+    except BaseException:
+        pipe.abort()
+        raise
+    await pipe.close()
+    await task
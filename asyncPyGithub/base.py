@@ -1,19 +1,21 @@
 from json import JSONDecodeError, dump, load
 from logging import Logger, getLogger
-from os import makedirs
+from os import environ
 from pathlib import Path
 from threading import Lock
 from typing import Final, cast
 
-from dotenv import load_dotenv
-
 LOGGER: Logger = getLogger(__name__)
 LOGGER.setLevel("INFO")
 
-load_dotenv()
 CWD: Final[Path] = Path(__file__).parent.resolve()
-CACHE_DIR: Final[Path] = CWD / "__github_cache__"
-makedirs(CACHE_DIR, exist_ok=True)
+CACHE_DIR: Final[Path] = Path(
+    environ.get("ASYNCPYGITHUB_CACHE_DIR", CWD / "__github_cache__")
+)
+"""
+Where cached data is written. Set `ASYNCPYGITHUB_CACHE_DIR` to move it out of the
+package directory, e.g. when site-packages is read-only. Created on first write.
+"""
 
 REPOSLICE_JSON: Final[Path] = CACHE_DIR / "repos.json"
 USER_JSON: Final[Path] = CACHE_DIR / "users.json"
@@ -22,6 +24,20 @@ REPO_CACHE_LOCK: Lock = Lock()
 USER_CACHE_LOCK: Lock = Lock()
 
 
+def load_environment(path: str | Path | None = None) -> bool:
+    """
+    Loads variables such as `GITHUB_TOKEN` from a `.env` file into the environment.
+    Importing the package no longer does this implicitly.
+    Args:
+        path (str | Path | None, optional): The `.env` file to load. Defaults to searching from the working directory.
+    Returns:
+        bool: True if at least one variable was set, False otherwise.
+    """
+    from dotenv import load_dotenv
+
+    return load_dotenv(path)
+
+
 def write_json(fp: Path, data: dict[str, object] | None) -> bool:
     """
     Writes a dictionary to a JSON file at the specified path.
@@ -36,6 +52,7 @@ def write_json(fp: Path, data: dict[str, object] | None) -> bool:
         return False
 
     try:
+        fp.parent.mkdir(parents=True, exist_ok=True)
         with open(fp, "w") as f:
             dump(data, f, indent=4, ensure_ascii=False)
             LOGGER.info(f"write_json:::{fp} written to successfully")
@@ -0,0 +1,175 @@
+from __future__ import annotations
+
+from collections.abc import Callable
+from json import dumps
+from math import ceil
+from time import monotonic
+from typing import Final, Literal
+
+from httpx import Request, Response
+from typing_extensions import Self
+
+from .base import LOGGER
+
+CircuitState = Literal["closed", "open", "half_open"]
+"""
+Closed circuits let requests through, open ones fail them at once, and half-open ones
+let a few probes through to find out whether the endpoints have recovered.
+"""
+
+NAMED_SEGMENTS: Final[dict[str, int]] = {"repos": 2, "orgs": 1, "users": 1}
+"""
+Path segments after the first that name an owner, repository or user.
+"""
+
+
+def endpoint_family(url: str) -> str:
+    """
+    The family an endpoint belongs to: its path with names replaced by `*`, cut after
+    the first segment that follows them. Incidents tend to hit whole families at once.
+    Args:
+        url (str): The endpoint, e.g. "repos/LEGO/lego/contents/README.md".
+    Returns:
+        str: The family, e.g. "/repos/*/*/contents", "/orgs/*/repos" or "/users/*".
+    """
+    segments = url.removeprefix("https://api.github.com").strip("/").split("/")
+    named = NAMED_SEGMENTS.get(segments[0], 0)
+    family = segments[:1] + ["*"] * len(segments[1 : 1 + named])
+    family += segments[1 + named : 2 + named]
+    return "/" + "/".join(family).partition("?")[0]
+
+
+class _Circuit:
+    """
+    The state of one endpoint family.
+    """
+
+    __slots__ = ("state", "failures", "opened", "probes")
+
+    def __init__(self) -> None:
+        self.state: CircuitState = "closed"
+        self.failures = 0
+        self.opened = 0.0
+        self.probes = 0
+
+
+class CircuitBreaker:
+    """
+    Fails requests at once while their endpoint family is failing, instead of letting
+    every caller wait out the client timeout during an incident.
+
+    A circuit opens after `failure_threshold` consecutive failures: timeouts, connection
+    errors or 5xx responses. While open, requests get a synthesized 503 without being
+    sent, or a cached copy when `fallback` is set. After `reset_timeout` seconds up to
+    `probes` requests are let through; one success closes the circuit, one failure opens
+    it again.
+
+        GitHubPortal.use_breaker(CircuitBreaker(failure_threshold=3, fallback=True))
+
+    Attributes:
+        failure_threshold (int): Consecutive failures that open a circuit.
+        reset_timeout (float): Seconds a circuit stays open before probing.
+        probes (int): Requests let through at once while half-open.
+        fallback (bool): Serve cached responses, stale or not, while a circuit is open.
+        family (Callable[[str], str]): Maps an endpoint to its circuit.
+    """
+
+    __slots__ = (
+        "failure_threshold",
+        "reset_timeout",
+        "probes",
+        "fallback",
+        "family",
+        "_circuits",
+    )
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        probes: int = 1,
+        fallback: bool = False,
+        family: Callable[[str], str] = endpoint_family,
+    ) -> None:
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.probes = probes
+        self.fallback = fallback
+        self.family = family
+        self._circuits: dict[str, _Circuit] = {}
+
+    def state(self: Self, family: str) -> CircuitState:
+        """
+        The state of a family's circuit, "closed" if it has never been used.
+        """
+        circuit = self._circuits.get(family)
+        return "closed" if circuit is None else circuit.state
+
+    def allow(self: Self, family: str) -> bool:
+        """
+        Whether a request to the family may be sent. A request let through a half-open
+        circuit is a probe, and must be followed by `record`.
+        """
+        circuit = self._circuits.setdefault(family, _Circuit())
+        if circuit.state == "open":
+            if monotonic() - circuit.opened < self.reset_timeout:
+                return False
+            circuit.state, circuit.probes = "half_open", 0
+        if circuit.state == "half_open":
+            if circuit.probes >= self.probes:
+                return False
+            circuit.probes += 1
+        return True
+
+    def record(self: Self, family: str, ok: bool | None) -> None:
+        """
+        Record the outcome of a request that was let through.
+        Args:
+            family (str): The request's endpoint family.
+            ok (bool | None): Whether it succeeded, or None if it was cancelled before it could tell.
+        """
+        circuit = self._circuits.setdefault(family, _Circuit())
+        if circuit.state == "half_open":
+            circuit.probes = max(circuit.probes - 1, 0)
+        if ok is None:
+            return
+        if ok:
+            if circuit.state == "half_open":
+                LOGGER.info(f"CircuitBreaker:::{family} recovered")
+            circuit.state, circuit.failures = "closed", 0
+            return
+
+        circuit.failures += 1
+        if circuit.state == "open":
+            # A request sent before the circuit opened; the open period is not extended.
+            return
+        if circuit.state == "half_open" or circuit.failures >= self.failure_threshold:
+            LOGGER.warning(
+                f"CircuitBreaker:::{family} failed {circuit.failures} times, failing fast for {self.reset_timeout}s"
+            )
+            circuit.state, circuit.opened = "open", monotonic()
+
+    def rejection(self: Self, family: str, request: Request) -> Response:
+        """
+        The 503 returned in place of a request to an open circuit.
+        """
+        circuit = self._circuits[family]
+        wait = max(self.reset_timeout - (monotonic() - circuit.opened), 0.0)
+        return Response(
+            503,
+            headers={
+                "content-type": "application/json",
+                "retry-after": str(ceil(wait)),
+                "x-circuit-breaker": "open",
+            },
+            content=dumps(
+                {"message": f"Circuit open for {family}, retry in {wait:.0f}s"}
+            ).encode(),
+            request=request,
+        )
+
+    def reset(self: Self) -> None:
+        """
+        Close every circuit.
+        """
+        self._circuits.clear()
@@ -0,0 +1,918 @@
+from __future__ import annotations
+
+import re
+import sqlite3
+from asyncio import Task, create_task, gather, wrap_future
+from collections import OrderedDict
+from collections.abc import Callable, Coroutine, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import suppress
+from hashlib import sha256
+from json import dumps, loads
+from math import inf
+from os import getpid, replace
+from pathlib import Path
+from tempfile import mkstemp
+from threading import Lock
+from time import time
+from typing import Any, Final
+from urllib.parse import urlencode
+from zlib import compress, decompress
+from zlib import error as ZlibError
+
+from httpx import Request, Response
+from typing_extensions import Self
+
+from .base import CACHE_DIR, LOGGER
+
+DEFAULT_ACCEPT: Final[frozenset[str]] = frozenset(
+    {"application/vnd.github+json", "application/vnd.github.v3+json"}
+)
+"""
+Accept headers that select the plain JSON representation, so they share cache entries.
+"""
+
+
+def cache_key(
+    url: str, params: Mapping[str, object] | None = None, accept: str | None = None
+) -> str:
+    """
+    The cache key of a GET request: its path relative to the API root, its sorted
+    query string and, for other media types, its Accept header.
+    Args:
+        url (str): The endpoint, e.g. "repos/LEGO/lego" or "/repos/LEGO/lego".
+        params (Mapping[str, object] | None, optional): The query parameters. Defaults to None.
+        accept (str | None, optional): The Accept header sent. Defaults to None.
+    Returns:
+        str: The key, e.g. "repos/LEGO/lego/tags?page=2".
+    """
+    segments = url.removeprefix("https://api.github.com").strip("/").split("/")
+    # Owner, repository and user names are case-insensitive, file paths are not.
+    named = 3 if segments[0] == "repos" else 2
+    key = "/".join([part.lower() for part in segments[:named]] + segments[named:])
+    if params:
+        key += "?" + urlencode(sorted((k, str(v)) for k, v in params.items()))
+    if accept is not None and accept.lower() not in DEFAULT_ACCEPT:
+        key += f"#{accept.lower()}"
+    return key
+
+
+MISSING_STATUSES: Final[frozenset[int]] = frozenset({404, 410})
+"""
+Statuses that say a resource does not exist, kept by the negative cache.
+"""
+
+
+IMMUTABLE_PATH: Final[re.Pattern[str]] = re.compile(
+    r"repos/[^/]+/[^/]+/(?:git/(?:blobs|trees|commits|tags)|commits)/"
+    r"(?:[0-9a-f]{64}|[0-9a-f]{40})",
+    re.IGNORECASE,
+)
+"""
+Paths of git objects addressed by their full SHA, whose content can never change.
+"""
+
+_PINNED_REF: Final[re.Pattern[str]] = re.compile(
+    r"(?:^|&)ref=(?:[0-9a-f]{64}|[0-9a-f]{40})(?:&|$)", re.IGNORECASE
+)
+
+
+def immutable(key: str) -> bool:
+    """
+    Whether a cache key names a response that can never change: a blob, tree, commit or
+    tag by its full SHA, or repository contents read at a full commit SHA.
+    Branch names and abbreviated SHAs can move, so they are not immutable.
+    Args:
+        key (str): The cache key, e.g. "repos/LEGO/lego/git/blobs/3a0f86f...".
+    Returns:
+        bool: Whether the response may be kept forever.
+    """
+    path, _, query = key.partition("#")[0].partition("?")
+    if IMMUTABLE_PATH.fullmatch(path):
+        return True
+    return path.split("/")[3:4] == ["contents"] and bool(_PINNED_REF.search(query))
+
+
+IMMUTABLE_HEADERS: Final[frozenset[str]] = frozenset({"content-type", "etag"})
+"""
+The only headers kept with an immutable response; the rest describe the exchange, not the object.
+"""
+
+
+def _scoped(key: str, principal: str) -> str:
+    # Where a principal's entry for a key is kept. Cache keys never hold a newline.
+    return f"{principal}\n{key}" if principal else key
+
+
+def _unscoped(stored: str) -> str:
+    return stored.rpartition("\n")[2]
+
+
+def _path(key: str) -> str:
+    return _unscoped(key).partition("#")[0].partition("?")[0]
+
+
+def _replayable(headers: Mapping[str, str]) -> dict[str, str]:
+    # Bodies are stored decoded, so their transfer headers no longer apply.
+    return {
+        k: v
+        for k, v in headers.items()
+        if k.lower() not in ("content-encoding", "content-length", "transfer-encoding")
+    }
+
+
+class CachedResponse:
+    """
+    A stored GET response.
+
+    Attributes:
+        status (int): The status code.
+        headers (dict[str, str]): The response headers.
+        body (bytes): The raw response body.
+        etag (str | None): The entity tag to revalidate with, if GitHub sent one.
+        stored (float): `time()` the response was stored or last revalidated.
+        ttl (float): Seconds the response is served without asking GitHub.
+    """
+
+    __slots__ = ("status", "headers", "body", "etag", "stored", "ttl")
+
+    def __init__(
+        self,
+        status: int,
+        headers: dict[str, str],
+        body: bytes,
+        etag: str | None,
+        ttl: float,
+        stored: float | None = None,
+    ) -> None:
+        self.status = status
+        self.headers = headers
+        self.body = body
+        self.etag = etag
+        self.ttl = ttl
+        self.stored = time() if stored is None else stored
+
+    @property
+    def fresh(self: Self) -> bool:
+        return time() - self.stored < self.ttl
+
+    def response(self: Self, request: Request) -> Response:
+        """
+        Rebuild an httpx response, as if it had just been received for `request`.
+        """
+        return Response(
+            self.status, headers=self.headers, content=self.body, request=request
+        )
+
+
+def _replaced(entry: CachedResponse, body: bytes) -> CachedResponse:
+    # A fresh copy with a body from elsewhere, which the ETag no longer matches.
+    headers = {k: v for k, v in entry.headers.items() if k.lower() != "etag"}
+    return CachedResponse(entry.status, headers, body, None, entry.ttl)
+
+
+class ImmutableStore:
+    """
+    A compact on-disk store of immutable responses, shared by every cache and process
+    pointed at the same directory.
+
+    Each response is one zlib-compressed file, named by the SHA-256 of its key and the
+    principal it was read as, and spread over 256 subdirectories. A private object read
+    by one user or installation is never served to another, while a token refreshed for the
+    same installation keeps its copies; anonymous reads share one principal. Files are written
+    under a temporary name and renamed into place, so readers never see half a file.
+    Nothing expires, since nothing can change.
+
+    Attributes:
+        directory (Path): Where the files are kept.
+        level (int): The zlib compression level.
+    """
+
+    __slots__ = ("directory", "level")
+
+    def __init__(self, directory: Path | str | None = None, level: int = 6) -> None:
+        self.directory = (
+            CACHE_DIR / "immutable" if directory is None else Path(directory)
+        )
+        self.level = level
+
+    def _file(self: Self, key: str, principal: str) -> Path:
+        digest = sha256(_scoped(key, principal).encode()).hexdigest()
+        return self.directory / digest[:2] / digest[2:]
+
+    def get(self: Self, key: str, principal: str = "") -> CachedResponse | None:
+        try:
+            data = decompress(self._file(key, principal).read_bytes())
+        except FileNotFoundError:
+            return None
+        except (OSError, ZlibError) as e:
+            LOGGER.warning(f"ImmutableStore:::Could not read {key}: {e}")
+            return None
+        meta, _, body = data.partition(b"\n")
+        status, headers = loads(meta)
+        return CachedResponse(status, headers, body, headers.get("etag"), inf)
+
+    def put(self: Self, key: str, entry: CachedResponse, principal: str = "") -> None:
+        """
+        Write a response to disk, replacing any copy already there.
+        Args:
+            key (str): The cache key.
+            entry (CachedResponse): The response.
+            principal (str, optional): The principal it was read as. Defaults to anonymous.
+        Raises:
+            OSError: If the file could not be written.
+        """
+        file = self._file(key, principal)
+        file.parent.mkdir(parents=True, exist_ok=True)
+        headers = {
+            k.lower(): v
+            for k, v in entry.headers.items()
+            if k.lower() in IMMUTABLE_HEADERS
+        }
+        meta = dumps([entry.status, headers], separators=(",", ":")).encode()
+        fd, tmp = mkstemp(dir=file.parent, suffix=".tmp")
+        try:
+            with open(fd, "wb") as f:
+                f.write(compress(meta + b"\n" + entry.body, self.level))
+            replace(tmp, file)
+        except BaseException:
+            with suppress(OSError):
+                Path(tmp).unlink()
+            raise
+
+    def clear(self: Self) -> int:
+        """
+        Delete every stored response.
+        Returns:
+            int: The number of responses deleted.
+        """
+        dropped = 0
+        for file in self.directory.glob("??/*"):
+            with suppress(FileNotFoundError):
+                file.unlink()
+                dropped += 1
+        return dropped
+
+
+class ResponseCache:
+    """
+    An in-memory cache of GET responses, keyed by `cache_key`.
+
+    Fresh entries are served without a request. Stale entries with an ETag are
+    revalidated with `If-None-Match`, and a `304 Not Modified` does not count
+    against the rate limit. Writes through the portal invalidate the path they touch.
+
+    With a `stale_while_revalidate` window, an entry that went stale less than that many
+    seconds ago is still served at once, while a conditional request refreshes it in the
+    background. One refresh runs per entry however many reads hit it, so answers are at
+    most `ttl + stale_while_revalidate` seconds old, plus the time a refresh takes.
+
+    At most `size` responses are kept; the least recently used are dropped first.
+
+    404 and 410 answers are kept apart, for `negative_ttl` seconds, so lookups of deleted
+    or renamed users and repositories are answered locally. At most `negative_size` of them
+    are kept, the least recently used are dropped first, and expired ones are asked again.
+
+    Responses for `immutable` keys, git objects by full SHA, are never revalidated. With an
+    `ImmutableStore` they are kept on disk instead of in memory, and outlive the process.
+
+    Entries are kept per principal, the user or installation a response was read as, so
+    switching between them never serves one what only the other may see. Invalidation and
+    updates apply to every principal's entries.
+    """
+
+    __slots__ = (
+        "ttl",
+        "stale_while_revalidate",
+        "negative_ttl",
+        "negative_size",
+        "immutable",
+        "size",
+        "_entries",
+        "_missing",
+        "_refreshing",
+    )
+
+    def __init__(
+        self,
+        ttl: float = 60.0,
+        stale_while_revalidate: float = 0.0,
+        negative_ttl: float = 300.0,
+        negative_size: int = 10_000,
+        immutable: ImmutableStore | None = None,
+        size: int = 50_000,
+    ) -> None:
+        self.ttl = ttl
+        self.stale_while_revalidate = stale_while_revalidate
+        self.negative_ttl = negative_ttl
+        self.negative_size = negative_size
+        self.immutable = immutable
+        self.size = size
+        self._entries: OrderedDict[str, CachedResponse] = OrderedDict()
+        self._missing: OrderedDict[str, CachedResponse] = OrderedDict()
+        self._refreshing: dict[str, Task[None]] = {}
+
+    def __len__(self: Self) -> int:
+        return len(self._entries) + len(self._missing)
+
+    def __contains__(self: Self, key: str) -> bool:
+        return key in self._entries or key in self._missing
+
+    def get(self: Self, key: str, principal: str = "") -> CachedResponse | None:
+        """
+        The entry for a key as read by `principal`, if any.
+        """
+        stored = _scoped(key, principal)
+        entry = self._entries.get(stored)
+        if entry is not None:
+            self._entries.move_to_end(stored)
+            return entry
+        if self.immutable is not None and immutable(key):
+            entry = self.immutable.get(key, principal)
+            if entry is not None:
+                return entry
+        entry = self._missing.get(stored)
+        if entry is None:
+            return None
+        if not entry.fresh:
+            # Not-found answers carry no ETag, so an expired one is only asked again.
+            del self._missing[stored]
+            return None
+        self._missing.move_to_end(stored)
+        return entry
+
+    def serves_stale(self: Self, entry: CachedResponse) -> bool:
+        """
+        Whether a stale entry may still be served while it is refreshed.
+        """
+        return time() - entry.stored < entry.ttl + self.stale_while_revalidate
+
+    def refresh(
+        self: Self,
+        key: str,
+        fetch: Callable[[], Coroutine[Any, Any, object]],
+        principal: str = "",
+    ) -> bool:
+        """
+        Run `fetch` in the background to refresh an entry, unless a refresh of it is already running.
+        Args:
+            key (str): The cache key.
+            fetch (Callable[[], Coroutine]): Makes the request that stores the new answer.
+            principal (str, optional): The principal the entry is kept for. Defaults to anonymous.
+        Returns:
+            bool: Whether a refresh was started.
+        """
+        stored = _scoped(key, principal)
+        if stored in self._refreshing:
+            return False
+        self._refreshing[stored] = create_task(self._refresh(stored, fetch))
+        return True
+
+    async def _refresh(
+        self: Self, key: str, fetch: Callable[[], Coroutine[Any, Any, object]]
+    ) -> None:
+        try:
+            await fetch()
+        except Exception as e:
+            # The stale entry stays, and the next read tries again.
+            LOGGER.warning(f"ResponseCache:::Refreshing {_unscoped(key)} failed: {e}")
+        finally:
+            self._refreshing.pop(key, None)
+
+    async def join(self: Self) -> None:
+        """
+        Wait for the background refreshes running now.
+        """
+        await gather(*self._refreshing.values(), return_exceptions=True)
+
+    def store(
+        self: Self,
+        key: str,
+        response: Response,
+        ttl: float | None = None,
+        principal: str = "",
+    ) -> CachedResponse:
+        """
+        Store a response under a key, replacing any previous entry.
+        Successful responses for immutable keys are kept forever, on disk if there is a store.
+        Args:
+            key (str): The cache key.
+            response (Response): A response whose body has been read.
+            ttl (float | None, optional): Seconds to serve it without revalidating. Defaults to the cache's `ttl`.
+            principal (str, optional): The principal the response was read as. Defaults to anonymous.
+        Returns:
+            CachedResponse: The new entry.
+        """
+        permanent = response.status_code == 200 and immutable(key)
+        if permanent:
+            ttl = inf
+        entry = CachedResponse(
+            response.status_code,
+            _replayable(response.headers),
+            response.content,
+            response.headers.get("etag"),
+            self.ttl if ttl is None else ttl,
+        )
+        stored = _scoped(key, principal)
+        self._missing.pop(stored, None)
+        if permanent and self.immutable is not None:
+            try:
+                self.immutable.put(key, entry, principal)
+                self._entries.pop(stored, None)
+                return entry
+            except OSError as e:
+                LOGGER.warning(f"ResponseCache:::Keeping {key} in memory: {e}")
+        self._keep(stored, entry)
+        return entry
+
+    def _keep(self: Self, stored: str, entry: CachedResponse) -> None:
+        self._entries[stored] = entry
+        self._entries.move_to_end(stored)
+        while len(self._entries) > self.size:
+            self._entries.popitem(last=False)
+
+    def store_missing(
+        self: Self, key: str, response: Response, principal: str = ""
+    ) -> CachedResponse | None:
+        """
+        Remember that a key does not exist, from its 404 or 410 response.
+        Args:
+            key (str): The cache key.
+            response (Response): The not-found response, its body read.
+            principal (str, optional): The principal it was not found for. Defaults to anonymous.
+        Returns:
+            CachedResponse | None: The new entry, or None if negative caching is off.
+        """
+        if self.negative_ttl <= 0 or self.negative_size <= 0:
+            return None
+        stored = _scoped(key, principal)
+        self._entries.pop(stored, None)
+        entry = self._missing[stored] = CachedResponse(
+            response.status_code,
+            _replayable(response.headers),
+            response.content,
+            None,
+            self.negative_ttl,
+        )
+        self._missing.move_to_end(stored)
+        while len(self._missing) > self.negative_size:
+            self._missing.popitem(last=False)
+        return entry
+
+    def update(self: Self, key: str, body: bytes) -> int:
+        """
+        Replace the body of a key's entries with newer data known from elsewhere, e.g. a webhook,
+        and make them fresh again. The ETag is dropped, since it no longer matches the body.
+        Args:
+            key (str): The cache key.
+            body (bytes): The new body.
+        Returns:
+            int: The number of entries updated, one per principal that had the key cached.
+        """
+        updated = [stored for stored in self._entries if _unscoped(stored) == key]
+        for stored in updated:
+            self._keep(stored, _replaced(self._entries[stored], body))
+        return len(updated)
+
+    def revalidated(self: Self, key: str, principal: str = "") -> CachedResponse | None:
+        """
+        Mark an entry fresh again after GitHub answered `304 Not Modified`.
+        """
+        entry = self._entries.get(_scoped(key, principal))
+        if entry is not None:
+            entry.stored = time()
+        return entry
+
+    def invalidate(self: Self, path: str, recursive: bool = True) -> int:
+        """
+        Drop every entry for a path and the paths below it, whatever their query, not-found answers included.
+        `invalidate("repos/LEGO/lego")` drops the repository, its topics, tags and contents,
+        but not "repos/LEGO/lego-tools".
+        Args:
+            path (str): The path, with or without a leading slash.
+            recursive (bool, optional): Also drop the paths below it. Defaults to True.
+        Returns:
+            int: The number of entries dropped.
+        """
+        path = cache_key(path)
+        dropped = 0
+        for entries in (self._entries, self._missing):
+            stale = [
+                key
+                for key in entries
+                if _path(key) == path
+                or (recursive and _path(key).startswith(f"{path}/"))
+            ]
+            for key in stale:
+                del entries[key]
+            dropped += len(stale)
+        return dropped
+
+    def clear(self: Self) -> None:
+        self._entries.clear()
+        self._missing.clear()
+
+
+SHARED_CACHE_SCHEMA: Final[
+    str
+] = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    path TEXT NOT NULL,
+    status INTEGER NOT NULL,
+    headers TEXT NOT NULL,
+    body BLOB NOT NULL,
+    etag TEXT,
+    stored REAL NOT NULL,
+    ttl REAL NOT NULL,
+    size INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS responses_path ON responses (path);
+"""
+
+
+READ_TIMEOUT: Final[float] = 0.05
+"""
+Seconds a read waits for the database. WAL readers do not wait for writers, so this only
+covers rare checkpoints and recoveries, and a read never holds up the event loop for long.
+"""
+
+
+def _below(path: str, recursive: bool) -> tuple[str, tuple[object, ...]]:
+    # No LIKE, so underscores and percent signs in names match only themselves.
+    return (
+        "path = ? OR (? AND substr(path, 1, ?) = ?)",
+        (path, recursive, len(path) + 1, f"{path}/"),
+    )
+
+
+class SharedCache(ResponseCache):
+    """
+    A `ResponseCache` kept in a sqlite database, so every process on a host shares its
+    hits, ETags and TTLs. Workers fetching the same listings then make one request
+    between them instead of one each.
+
+        GitHubPortal.use_cache(SharedCache(ttl=300, max_bytes=512 * 2**20))
+
+    The database runs in WAL mode, so reads never wait for writers and are made in place.
+    Writes are queued, in order, to a thread of their own, which waits up to `busy_timeout`
+    seconds for other processes' writes without holding up the event loop. Until a write
+    lands, this process already reads what it wrote. When the stored bodies outgrow
+    `max_bytes`, the entries stored or revalidated longest ago are dropped until a tenth
+    is free. A database that cannot be read or written is logged and skipped, never failed on.
+
+    404 and 410 answers and background refreshes stay per process, and immutable objects
+    go to the `ImmutableStore`, if there is one, as with `ResponseCache`. Entries are kept
+    per principal, so workers acting as different users or installations can share a database.
+
+    Attributes:
+        path (Path): The database file.
+        max_bytes (int | None): The most body and header bytes kept, or None for no bound.
+        busy_timeout (float): Seconds a write waits for another process's write.
+    """
+
+    __slots__ = (
+        "path",
+        "max_bytes",
+        "busy_timeout",
+        "_reader",
+        "_writer",
+        "_writes",
+        "_pending",
+        "_sequence",
+        "_lock",
+        "_pid",
+    )
+
+    def __init__(
+        self,
+        path: Path | str | None = None,
+        ttl: float = 60.0,
+        max_bytes: int | None = 256 * 2**20,
+        stale_while_revalidate: float = 0.0,
+        negative_ttl: float = 300.0,
+        negative_size: int = 10_000,
+        immutable: ImmutableStore | None = None,
+        busy_timeout: float = 5.0,
+    ) -> None:
+        super().__init__(
+            ttl, stale_while_revalidate, negative_ttl, negative_size, immutable
+        )
+        self.path = CACHE_DIR / "responses.sqlite3" if path is None else Path(path)
+        self.max_bytes = max_bytes
+        self.busy_timeout = busy_timeout
+        self._pid = 0
+        self._forked()
+
+    def _forked(self: Self) -> None:
+        # Connections, threads and locks do not survive a fork; a child starts afresh.
+        if self._pid == getpid():
+            return
+        self._reader: sqlite3.Connection | None = None
+        self._writer: sqlite3.Connection | None = None
+        self._writes: ThreadPoolExecutor | None = None
+        # Writes not yet committed, by key: their number and the entry, or None if deleted.
+        self._pending: dict[str, tuple[int, CachedResponse | None]] = {}
+        self._sequence = 0
+        self._lock = Lock()
+        self._pid = getpid()
+
+    def _connect(self: Self, timeout: float) -> sqlite3.Connection:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        db = sqlite3.connect(self.path, timeout=timeout, isolation_level=None)
+        db.execute("PRAGMA journal_mode=WAL")
+        db.execute("PRAGMA synchronous=NORMAL")
+        db.executescript(SHARED_CACHE_SCHEMA)
+        return db
+
+    def _read(self: Self) -> sqlite3.Connection:
+        self._forked()
+        if self._reader is None:
+            self._reader = self._connect(READ_TIMEOUT)
+        return self._reader
+
+    def _run(
+        self: Self, job: Callable[[sqlite3.Connection], object], what: str
+    ) -> None:
+        # On the writer thread, the only one to use its connection.
+        try:
+            if self._writer is None:
+                self._writer = self._connect(self.busy_timeout)
+            db = self._writer
+            # Take the write lock up front, rather than upgrading to it and risking a deadlock.
+            db.execute("BEGIN IMMEDIATE")
+            try:
+                job(db)
+            except BaseException:
+                db.execute("ROLLBACK")
+                raise
+            db.execute("COMMIT")
+        except sqlite3.Error as e:
+            LOGGER.warning(f"SharedCache:::Could not {what}: {e}")
+
+    def _queue(
+        self: Self,
+        changes: dict[str, CachedResponse | None],
+        job: Callable[[sqlite3.Connection], object],
+        what: str,
+    ) -> None:
+        """
+        Hand a write to the writer thread, reading `changes` from memory until it lands.
+        """
+        self._forked()
+        with self._lock:
+            self._sequence += 1
+            number = self._sequence
+            for key, entry in changes.items():
+                self._pending[key] = (number, entry)
+        if self._writes is None:
+            self._writes = ThreadPoolExecutor(1, thread_name_prefix="SharedCache")
+        future = self._writes.submit(self._run, job, what)
+        future.add_done_callback(lambda _: self._settle(changes, number))
+
+    def _settle(
+        self: Self, changes: dict[str, CachedResponse | None], number: int
+    ) -> None:
+        with self._lock:
+            for key in changes:
+                # A later write to the key is still pending, and still wins.
+                if self._pending.get(key, (0, None))[0] == number:
+                    del self._pending[key]
+
+    def _evict(self: Self, db: sqlite3.Connection) -> None:
+        if self.max_bytes is None:
+            return
+        (total,) = db.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()
+        if total <= self.max_bytes:
+            return
+        db.execute(
+            """
+            DELETE FROM responses WHERE key IN (
+                SELECT key FROM (
+                    SELECT key, SUM(size) OVER (ORDER BY stored DESC, key) AS kept
+                    FROM responses
+                ) WHERE kept > ?
+            )
+            """,
+            (self.max_bytes * 0.9,),
+        )
+
+    def _save(self: Self, stored: str, entry: CachedResponse) -> None:
+        headers = dumps(entry.headers, separators=(",", ":"))
+        row = (
+            stored,
+            _path(stored),
+            entry.status,
+            headers,
+            entry.body,
+            entry.etag,
+            entry.stored,
+            entry.ttl,
+            len(entry.body) + len(headers),
+        )
+
+        def save(db: sqlite3.Connection) -> None:
+            db.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                row,
+            )
+            self._evict(db)
+
+        self._queue({stored: entry}, save, f"store {_unscoped(stored)}")
+
+    def _load(self: Self, stored: str) -> CachedResponse | None:
+        self._forked()
+        with self._lock:
+            pending = self._pending.get(stored)
+        if pending is not None:
+            return pending[1]
+        try:
+            row = (
+                self._read()
+                .execute(
+                    "SELECT status, headers, body, etag, ttl, stored FROM responses WHERE key = ?",
+                    (stored,),
+                )
+                .fetchone()
+            )
+        except sqlite3.Error as e:
+            LOGGER.warning(f"SharedCache:::Could not read {_unscoped(stored)}: {e}")
+            return None
+        if row is None:
+            return None
+        status, headers, body, etag, ttl, when = row
+        return CachedResponse(status, loads(headers), body, etag, ttl, when)
+
+    def _drop(
+        self: Self,
+        where: str,
+        params: tuple[object, ...],
+        matches: Callable[[str], bool],
+        what: str,
+    ) -> int:
+        """
+        Delete the rows matching a condition, and hide them at once, with the pending
+        writes whose keys `matches`.
+        Returns:
+            int: The number of entries dropped.
+        """
+        try:
+            keys = {
+                key
+                for (key,) in self._read().execute(
+                    f"SELECT key FROM responses WHERE {where}", params
+                )
+            }
+        except sqlite3.Error as e:
+            LOGGER.warning(f"SharedCache:::Could not {what}: {e}")
+            keys = set()
+        with self._lock:
+            pending = [
+                k for k, (_, entry) in self._pending.items() if entry is not None
+            ]
+        keys.update(filter(matches, pending))
+        self._queue(
+            dict.fromkeys(keys),
+            lambda db: db.execute(f"DELETE FROM responses WHERE {where}", params),
+            what,
+        )
+        return len(keys)
+
+    def __len__(self: Self) -> int:
+        """
+        The entries written to the database, plus this process's not-found answers.
+        """
+        try:
+            (count,) = self._read().execute("SELECT COUNT(*) FROM responses").fetchone()
+        except sqlite3.Error as e:
+            LOGGER.warning(f"SharedCache:::Could not count entries: {e}")
+            count = 0
+        return int(count) + super().__len__()
+
+    def __contains__(self: Self, key: str) -> bool:
+        return self._load(key) is not None or super().__contains__(key)
+
+    def get(self: Self, key: str, principal: str = "") -> CachedResponse | None:
+        return self._load(_scoped(key, principal)) or super().get(key, principal)
+
+    def store(
+        self: Self,
+        key: str,
+        response: Response,
+        ttl: float | None = None,
+        principal: str = "",
+    ) -> CachedResponse:
+        permanent = response.status_code == 200 and immutable(key)
+        if permanent and self.immutable is not None:
+            return super().store(key, response, ttl, principal)
+        entry = CachedResponse(
+            response.status_code,
+            _replayable(response.headers),
+            response.content,
+            response.headers.get("etag"),
+            inf if permanent else self.ttl if ttl is None else ttl,
+        )
+        stored = _scoped(key, principal)
+        self._missing.pop(stored, None)
+        self._save(stored, entry)
+        return entry
+
+    def store_missing(
+        self: Self, key: str, response: Response, principal: str = ""
+    ) -> CachedResponse | None:
+        entry = super().store_missing(key, response, principal)
+        if entry is not None:
+            stored = _scoped(key, principal)
+            self._queue(
+                {stored: None},
+                lambda db: db.execute("DELETE FROM responses WHERE key = ?", (stored,)),
+                f"drop {key}",
+            )
+        return entry
+
+    def update(self: Self, key: str, body: bytes) -> int:
+        try:
+            rows = self._read().execute(
+                "SELECT key FROM responses WHERE path = ?", (_path(key),)
+            )
+            keys = {stored for (stored,) in rows}
+        except sqlite3.Error as e:
+            LOGGER.warning(f"SharedCache:::Could not update {key}: {e}")
+            keys = set()
+        with self._lock:
+            keys.update(self._pending)
+        updated = 0
+        for stored in keys:
+            entry = self._load(stored) if _unscoped(stored) == key else None
+            if entry is not None:
+                self._save(stored, _replaced(entry, body))
+                updated += 1
+        return updated
+
+    def revalidated(self: Self, key: str, principal: str = "") -> CachedResponse | None:
+        stored = _scoped(key, principal)
+        entry = self._load(stored)
+        if entry is None:
+            return None
+        entry = CachedResponse(
+            entry.status, entry.headers, entry.body, entry.etag, entry.ttl
+        )
+        when = entry.stored
+        self._queue(
+            {stored: entry},
+            lambda db: db.execute(
+                "UPDATE responses SET stored = ? WHERE key = ?", (when, stored)
+            ),
+            f"revalidate {key}",
+        )
+        return entry
+
+    def invalidate(self: Self, path: str, recursive: bool = True) -> int:
+        dropped = super().invalidate(path, recursive)
+        path = cache_key(path)
+        where, params = _below(path, recursive)
+        return dropped + self._drop(
+            where,
+            params,
+            lambda key: _path(key) == path
+            or (recursive and _path(key).startswith(f"{path}/")),
+            f"invalidate {path}",
+        )
+
+    def clear(self: Self) -> None:
+        super().clear()
+        self._drop("1", (), lambda key: True, "clear the cache")
+
+    def flush(self: Self) -> None:
+        """
+        Block until every queued write has landed. Prefer `await join()` on the event loop.
+        """
+        if self._writes is not None and self._pid == getpid():
+            self._writes.submit(int).result()
+
+    async def join(self: Self) -> None:
+        """
+        Wait for the background refreshes running now, and for every queued write.
+        """
+        await super().join()
+        if self._writes is not None and self._pid == getpid():
+            await wrap_future(self._writes.submit(int))
+
+    def _close_writer(self: Self) -> None:
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+    def close(self: Self) -> None:
+        """
+        Land queued writes and close this process's connections. The cache reopens them if used again.
+        """
+        if self._pid != getpid():
+            return
+        if self._writes is not None:
+            self._writes.submit(self._close_writer)
+            self._writes.shutdown(wait=True)
+            self._writes = None
+        if self._reader is not None:
+            self._reader.close()
+            self._reader = None
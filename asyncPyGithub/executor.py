@@ -0,0 +1,217 @@
+from __future__ import annotations
+
+from asyncio import AbstractEventLoop, Queue, gather, get_running_loop, run, to_thread
+from collections.abc import Awaitable, Callable, Iterable, Iterator
+from multiprocessing import get_context
+from multiprocessing.process import BaseProcess
+from multiprocessing.queues import Queue as ProcessQueue
+from os import cpu_count
+from queue import Empty
+from threading import Semaphore
+
+from typing_extensions import Any, Self
+
+from ._types import ErrorMessage, GitHubPortal
+from .base import LOGGER
+from .scheduling import QuotaBroker
+
+CrawlTask = Callable[[Any], Awaitable[Any]]
+"""
+A module-level async function run once per work item inside a worker process.
+It must be importable by name, since it is pickled to spawned workers.
+"""
+
+
+def _read(
+    work: ProcessQueue[tuple[int, Any] | None],
+    inbox: Queue[tuple[int, Any] | None],
+    loop: AbstractEventLoop,
+    consumers: int,
+    idle: Semaphore,
+) -> None:
+    # One thread blocks on the process queue for every consumer, so however many
+    # consumers there are, the loop's default thread pool is never used up by waits.
+    # It only takes an item for an idle consumer, leaving the rest to other workers.
+    remaining = consumers
+    while remaining:
+        idle.acquire()
+        entry = work.get()
+        loop.call_soon_threadsafe(inbox.put_nowait, entry)
+        if entry is None:
+            remaining -= 1
+
+
+async def _consume(
+    task: CrawlTask,
+    inbox: Queue[tuple[int, Any] | None],
+    results: ProcessQueue[tuple[int, Any]],
+    idle: Semaphore,
+) -> None:
+    while True:
+        entry = await inbox.get()
+        if entry is None:
+            return
+        index, item = entry
+        try:
+            result = await task(item)
+        except Exception as err:
+            LOGGER.error(f"CrawlExecutor:::Task failed on {item!r}: {err}")
+            result = ErrorMessage(code=500, message=str(err))
+        # Process queues are unbounded and hand items to a feeder thread, so this does not block.
+        results.put((index, result))
+        idle.release()
+
+
+async def _worker_main(
+    task: CrawlTask,
+    token: str | None,
+    broker: QuotaBroker,
+    concurrency: int,
+    work: ProcessQueue[tuple[int, Any] | None],
+    results: ProcessQueue[tuple[int, Any]],
+) -> None:
+    GitHubPortal._quota = broker
+    if token is not None:
+        GitHubPortal.use_token(token)
+    try:
+        inbox: Queue[tuple[int, Any] | None] = Queue()
+        idle = Semaphore(concurrency)
+        await gather(
+            to_thread(_read, work, inbox, get_running_loop(), concurrency, idle),
+            *(_consume(task, inbox, results, idle) for _ in range(concurrency)),
+        )
+    finally:
+        await GitHubPortal.close()
+
+
+def _worker(
+    task: CrawlTask,
+    token: str | None,
+    broker: QuotaBroker,
+    concurrency: int,
+    work: ProcessQueue[tuple[int, Any] | None],
+    results: ProcessQueue[tuple[int, Any]],
+) -> None:
+    run(_worker_main(task, token, broker, concurrency, work, results))
+
+
+class CrawlExecutor:
+    """
+    Runs a crawl task over many work items across worker processes.
+
+    Each worker process runs its own event loop and `GitHubPortal` client, takes items from
+    a shared queue and runs up to `concurrency` tasks at once. All workers draw from one
+    `QuotaBroker`, so together they never spend more than the token's rate limit, while
+    response validation is spread over several cores.
+
+    Example:
+        async def org_repos(org: str) -> tuple[int, list[MinimalRepository] | ErrorMessage]:
+            return await GitHubRepositoryPortal.get_organization_repos(org, per_page=100)
+
+        with CrawlExecutor(org_repos, token, processes=4) as executor:
+            for org, (status, repos) in executor.map(["LEGO", "github", "python"]):
+                ...
+    """
+
+    __slots__ = (
+        "task",
+        "token",
+        "processes",
+        "concurrency",
+        "broker",
+        "_context",
+        "_work",
+        "_results",
+        "_workers",
+    )
+
+    def __init__(
+        self,
+        task: CrawlTask,
+        token: str | None = None,
+        processes: int | None = None,
+        concurrency: int = 10,
+        broker: QuotaBroker | None = None,
+    ) -> None:
+        """
+        Args:
+            task (CrawlTask): The module-level async function to run per item.
+            token (str | None, optional): The bearer token each worker uses. Defaults to None (unauthenticated).
+            processes (int | None, optional): The number of worker processes. Defaults to the CPU count.
+            concurrency (int, optional): Concurrent tasks per worker process. Defaults to 10.
+            broker (QuotaBroker | None, optional): The shared budget. Defaults to a new broker.
+        """
+        self._context = get_context("spawn")
+        self.task = task
+        self.token = token
+        self.processes = processes or cpu_count() or 1
+        self.concurrency = concurrency
+        self.broker = broker or QuotaBroker(context=self._context)
+        self._work: ProcessQueue[tuple[int, Any] | None] = self._context.Queue()
+        self._results: ProcessQueue[tuple[int, Any]] = self._context.Queue()
+        self._workers: list[BaseProcess] = []
+
+    def start(self: Self) -> None:
+        """
+        Spawn the worker processes if they are not running yet.
+        """
+        if self._workers:
+            return
+        for _ in range(self.processes):
+            worker = self._context.Process(
+                target=_worker,
+                args=(
+                    self.task,
+                    self.token,
+                    self.broker,
+                    self.concurrency,
+                    self._work,
+                    self._results,
+                ),
+                daemon=True,
+            )
+            worker.start()
+            self._workers.append(worker)
+
+    def shutdown(self: Self) -> None:
+        """
+        Let every worker finish its queued items, then wait for the processes to exit.
+        """
+        for _ in range(self.processes * self.concurrency):
+            self._work.put(None)
+        for worker in self._workers:
+            worker.join()
+        self._workers.clear()
+
+    def __enter__(self: Self) -> Self:
+        self.start()
+        return self
+
+    def __exit__(self: Self, *_: object) -> None:
+        self.shutdown()
+
+    def map(self: Self, items: Iterable[Any]) -> Iterator[tuple[Any, Any]]:
+        """
+        Run the task over every item, yielding `(item, result)` pairs as they complete.
+        A task that raises yields an `ErrorMessage` as its result.
+        Args:
+            items (Iterable[Any]): The picklable work items.
+        Yields:
+            tuple[Any, Any]: Each item with the task's result.
+        """
+        self.start()
+        pending = dict(enumerate(items))
+        for entry in pending.items():
+            self._work.put(entry)
+
+        while pending:
+            try:
+                index, result = self._results.get(timeout=0.5)
+            except Empty:
+                if not any(worker.is_alive() for worker in self._workers):
+                    LOGGER.error(
+                        f"CrawlExecutor:::All workers exited with {len(pending)} items pending"
+                    )
+                    return
+                continue
+            yield pending.pop(index), result
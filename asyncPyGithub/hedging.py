@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+from collections import deque
+from math import ceil
+
+from typing_extensions import Self
+
+
+class Hedger:
+    """
+    Decides when a slow GET gets a duplicate, and how many duplicates may be sent.
+
+    A request still unanswered after the `percentile` latency of recent requests is sent
+    again, on another pooled connection, and whichever answer comes first is used. Each
+    request earns `budget` of a hedge, so at most that fraction of requests, plus a
+    small burst, is sent twice and quota use stays bounded.
+
+        GitHubPortal.use_hedging(Hedger(percentile=0.95, budget=0.05))
+
+    Over HTTP/2 every request shares one connection, so hedges only help against
+    stalls on GitHub's side, not on the connection.
+
+    Attributes:
+        percentile (float): The latency percentile after which a request is hedged.
+        budget (float): The fraction of requests that may be hedged.
+        burst (float): The most hedges that can be saved up while traffic is healthy.
+        minimum_delay (float): The shortest wait before hedging, in seconds.
+        warmup (int): The latencies needed before any request is hedged.
+        requests (int): The requests seen.
+        hedged (int): The hedges sent.
+        won (int): The hedges that answered first.
+    """
+
+    __slots__ = (
+        "percentile",
+        "budget",
+        "burst",
+        "minimum_delay",
+        "warmup",
+        "requests",
+        "hedged",
+        "won",
+        "_latencies",
+        "_credit",
+    )
+
+    def __init__(
+        self,
+        percentile: float = 0.95,
+        budget: float = 0.05,
+        burst: float = 5.0,
+        minimum_delay: float = 0.05,
+        warmup: int = 20,
+        window: int = 500,
+    ) -> None:
+        if not 0.0 < percentile < 1.0:
+            raise ValueError("percentile must be within (0, 1)")
+        if not 0.0 <= budget <= 1.0:
+            raise ValueError("budget must be within [0, 1]")
+
+        self.percentile = percentile
+        self.budget = budget
+        self.burst = burst
+        self.minimum_delay = minimum_delay
+        self.warmup = warmup
+        self.requests = 0
+        self.hedged = 0
+        self.won = 0
+        self._latencies: deque[float] = deque(maxlen=window)
+        self._credit = 0.0
+
+    @property
+    def delay(self: Self) -> float | None:
+        """
+        Seconds to wait for an answer before hedging, or None until enough latencies are known.
+        """
+        if len(self._latencies) < self.warmup:
+            return None
+        ranked = sorted(self._latencies)
+        index = min(ceil(len(ranked) * self.percentile) - 1, len(ranked) - 1)
+        return max(ranked[index], self.minimum_delay)
+
+    def start(self: Self) -> float | None:
+        """
+        Count a request and earn its share of the budget.
+        Returns:
+            float | None: The delay to hedge it after, or None to never hedge it.
+        """
+        self.requests += 1
+        self._credit = min(self._credit + self.budget, self.burst)
+        return self.delay
+
+    def spend(self: Self) -> bool:
+        """
+        Take one hedge from the budget, if there is one.
+        """
+        if self._credit < 1.0:
+            return False
+        self._credit -= 1.0
+        self.hedged += 1
+        return True
+
+    def record(self: Self, latency: float, hedge_won: bool = False) -> None:
+        """
+        Record how long a request took to get its first answer.
+        """
+        self._latencies.append(latency)
+        if hedge_won:
+            self.won += 1
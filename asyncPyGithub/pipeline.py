@@ -0,0 +1,241 @@
+from __future__ import annotations
+
+from asyncio import CancelledError, Queue, Task, create_task, gather
+from collections.abc import AsyncIterable, AsyncIterator, Awaitable, Callable
+from inspect import isasyncgenfunction
+from time import perf_counter
+
+from typing_extensions import Any, Self, cast
+
+from .base import LOGGER
+
+StageFunction = Callable[[Any], AsyncIterator[Any] | Awaitable[Any]]
+"""
+A pipeline stage. Either an async generator function yielding zero or more outputs per input,
+or a coroutine function returning a single output (None drops the item).
+"""
+
+_DONE: object = object()
+
+
+class StageStats:
+    """
+    Running counters for a single pipeline stage.
+
+    Attributes:
+        name (str): The stage name.
+        concurrency (int): The number of workers in the stage.
+        processed (int): Inputs fully handled by the stage.
+        emitted (int): Outputs passed on to the next stage.
+        failed (int): Inputs whose stage function raised.
+        busy (float): Total seconds workers spent on inputs, including time blocked on a full downstream queue.
+        started (float | None): `perf_counter()` time the first input was taken.
+        finished (float | None): `perf_counter()` time the last worker exited.
+    """
+
+    __slots__ = (
+        "name",
+        "concurrency",
+        "processed",
+        "emitted",
+        "failed",
+        "busy",
+        "started",
+        "finished",
+        "_queue",
+    )
+
+    def __init__(self, name: str, concurrency: int, queue: Queue[Any]) -> None:
+        self.name = name
+        self.concurrency = concurrency
+        self.processed = 0
+        self.emitted = 0
+        self.failed = 0
+        self.busy = 0.0
+        self.started: float | None = None
+        self.finished: float | None = None
+        self._queue = queue
+
+    @property
+    def elapsed(self: Self) -> float:
+        """
+        Seconds since the stage took its first input, up to when it finished.
+        """
+        if self.started is None:
+            return 0.0
+        return (self.finished or perf_counter()) - self.started
+
+    @property
+    def throughput(self: Self) -> float:
+        """
+        Inputs processed per second of wall-clock time.
+        """
+        elapsed = self.elapsed
+        return self.processed / elapsed if elapsed > 0 else 0.0
+
+    @property
+    def queued(self: Self) -> int:
+        """
+        Inputs waiting in the stage's input queue.
+        """
+        return self._queue.qsize()
+
+    def model_dump(self: Self) -> dict[str, str | int | float]:
+        """
+        Converts the stats to a JSON-compatible dictionary.
+        """
+        return {
+            "name": self.name,
+            "concurrency": self.concurrency,
+            "processed": self.processed,
+            "emitted": self.emitted,
+            "failed": self.failed,
+            "queued": self.queued,
+            "busy": self.busy,
+            "elapsed": self.elapsed,
+            "throughput": self.throughput,
+        }
+
+
+class Pipeline:
+    """
+    Chains async stages with bounded queues so a slow stage throttles the ones before it.
+
+    Each stage runs `concurrency` workers that pull from its input queue and push into the
+    next stage's queue. Queues hold at most `buffer` items, so when a downstream stage falls
+    behind, upstream workers (and ultimately the source, e.g. a paginated listing) block on
+    `put` instead of buffering everything in memory.
+
+    Example:
+        pipeline = (
+            Pipeline(GitHubRepositoryPortal.paginate(GitHubRepositoryPortal.get_organization_repos, "LEGO"))
+            .stage("contributors", contributors_of, concurrency=4)
+            .stage("users", lookup_user, concurrency=8)
+        )
+        async for user in pipeline:
+            ...
+    """
+
+    __slots__ = ("_source", "_stages", "_buffer", "stats")
+
+    def __init__(self, source: AsyncIterable[Any], buffer: int = 100) -> None:
+        if buffer < 1:
+            raise ValueError("buffer must be at least 1")
+        self._source = source
+        self._buffer = buffer
+        self._stages: list[tuple[StageFunction, int]] = []
+        self.stats: dict[str, StageStats] = {}
+
+    def stage(
+        self: Self,
+        name: str,
+        function: StageFunction,
+        concurrency: int = 1,
+        buffer: int | None = None,
+    ) -> Self:
+        """
+        Append a stage to the pipeline.
+        Args:
+            name (str): A unique name for the stage, used as the key in `stats`.
+            function (StageFunction): The async generator or coroutine function to run per item.
+            concurrency (int, optional): The number of concurrent workers. Defaults to 1.
+            buffer (int | None, optional): The size of the stage's input queue. Defaults to the pipeline buffer.
+        Returns:
+            Pipeline: The pipeline, for chaining.
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        if name in self.stats:
+            raise ValueError(f"stage {name!r} already exists")
+
+        queue: Queue[Any] = Queue(maxsize=buffer or self._buffer)
+        self.stats[name] = StageStats(name, concurrency, queue)
+        self._stages.append((function, len(self.stats) - 1))
+        return self
+
+    async def _feed(self: Self, out: Queue[Any]) -> None:
+        try:
+            async for item in self._source:
+                await out.put(item)
+        except CancelledError:
+            raise
+        except Exception as err:
+            LOGGER.error(f"Pipeline:::Source failed: {err}")
+        await out.put(_DONE)
+
+    async def _work(
+        self: Self,
+        function: StageFunction,
+        stats: StageStats,
+        inbox: Queue[Any],
+        out: Queue[Any],
+    ) -> None:
+        is_generator = isasyncgenfunction(function)
+        while True:
+            item = await inbox.get()
+            if item is _DONE:
+                await inbox.put(_DONE)
+                return
+
+            if stats.started is None:
+                stats.started = perf_counter()
+            began = perf_counter()
+            try:
+                if is_generator:
+                    async for result in cast(AsyncIterator[Any], function(item)):
+                        await out.put(result)
+                        stats.emitted += 1
+                else:
+                    result = await cast(Awaitable[Any], function(item))
+                    if result is not None:
+                        await out.put(result)
+                        stats.emitted += 1
+            except CancelledError:
+                raise
+            except Exception as err:
+                stats.failed += 1
+                LOGGER.error(f"Pipeline:::Stage {stats.name} failed on {item!r}: {err}")
+            finally:
+                stats.busy += perf_counter() - began
+            stats.processed += 1
+
+    async def _run_stage(
+        self: Self,
+        function: StageFunction,
+        stats: StageStats,
+        inbox: Queue[Any],
+        out: Queue[Any],
+    ) -> None:
+        await gather(
+            *(self._work(function, stats, inbox, out) for _ in range(stats.concurrency))
+        )
+        stats.finished = perf_counter()
+        await out.put(_DONE)
+
+    async def __aiter__(self: Self) -> AsyncIterator[Any]:
+        """
+        Run the pipeline, yielding the outputs of the last stage as they arrive.
+        Breaking out of the loop cancels every stage.
+        """
+        stats = list(self.stats.values())
+        queues = [s._queue for s in stats] + [Queue(maxsize=self._buffer)]
+        tasks: list[Task[None]] = [create_task(self._feed(queues[0]))]
+        for function, index in self._stages:
+            tasks.append(
+                create_task(
+                    self._run_stage(
+                        function, stats[index], queues[index], queues[index + 1]
+                    )
+                )
+            )
+
+        try:
+            while True:
+                item = await queues[-1].get()
+                if item is _DONE:
+                    break
+                yield item
+        finally:
+            for task in tasks:
+                task.cancel()
+            await gather(*tasks, return_exceptions=True)
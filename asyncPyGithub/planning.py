@@ -0,0 +1,220 @@
+from __future__ import annotations
+
+from asyncio import create_task, gather, sleep
+from collections.abc import Awaitable, Callable, Iterable, Mapping
+from math import ceil
+from time import time
+from typing import Final, TypeVar
+
+from typing_extensions import Self
+
+from ._types import ErrorMessage, GitHubPortal
+from .scheduling import RateLimitState
+
+T = TypeVar("T")
+
+WINDOW: Final[float] = 3600.0
+"""
+Length of a primary rate limit window, in seconds.
+"""
+
+
+def pages(items: int, per_page: int = 100) -> int:
+    """
+    The requests needed to list `items` objects, `per_page` at a time. An empty list still costs one.
+    """
+    return max(1, ceil(items / per_page))
+
+
+class CostEstimate:
+    """
+    A tally of the requests an operation will make, by step.
+
+        estimate = CostEstimate()
+        for org, repo_count in orgs.items():
+            estimate.add("get_organization_repos", items=repo_count)
+        estimate.add("list_contributors", calls=total_repos)
+
+    Attributes:
+        steps (dict[str, int]): The requests per step.
+    """
+
+    __slots__ = ("steps",)
+
+    def __init__(self) -> None:
+        self.steps: dict[str, int] = {}
+
+    @property
+    def requests(self: Self) -> int:
+        return sum(self.steps.values())
+
+    def add(
+        self: Self,
+        step: str,
+        items: int | None = None,
+        per_page: int = 100,
+        calls: int = 1,
+    ) -> Self:
+        """
+        Count a step that lists `items` objects, or makes single requests if `items` is None.
+        Args:
+            step (str): The name the requests are tallied under, e.g. "list_contributors".
+            items (int | None, optional): The objects each call pages through, from a cached count such as `public_repos`. Defaults to None.
+            per_page (int, optional): The page size used. Defaults to 100.
+            calls (int, optional): How many times the step runs. Defaults to 1.
+        Returns:
+            CostEstimate: The estimate, for chaining.
+        """
+        cost = calls * (1 if items is None else pages(items, per_page))
+        self.steps[step] = self.steps.get(step, 0) + cost
+        return self
+
+    def add_each(
+        self: Self, step: str, counts: Mapping[str, int], per_page: int = 100
+    ) -> Self:
+        """
+        Count one paginated call per entry of `counts`, e.g. one `get_organization_repos` per org.
+        """
+        for count in counts.values():
+            self.add(step, count, per_page)
+        return self
+
+
+class Forecast:
+    """
+    How a number of requests fits into a rate limit budget when paced evenly.
+
+    Attributes:
+        cost (int): The requests to make.
+        budget (int): The requests usable before the current window resets.
+        interval (float): The seconds between requests that spends the budget exactly at the reset.
+        windows (int): The windows the work spans, 1 if it fits in the current one.
+        finish (float): The epoch time the last request is expected to go out.
+    """
+
+    __slots__ = ("cost", "budget", "interval", "windows", "finish")
+
+    def __init__(
+        self,
+        cost: int,
+        state: RateLimitState,
+        reserve: int = 0,
+        now: float | None = None,
+    ) -> None:
+        now = time() if now is None else now
+        window_left = max(state.reset - now, 0.0)
+        usable = max(state.limit - reserve, 1)
+
+        self.cost = cost
+        self.budget = max(state.remaining - reserve, 0) if window_left else usable
+        # With nothing left, pace for the next window instead.
+        self.interval = window_left / self.budget if self.budget else WINDOW / usable
+
+        if cost <= self.budget:
+            self.windows = 1
+            self.finish = now + cost * self.interval
+        else:
+            overflow = cost - self.budget
+            self.windows = 1 + ceil(overflow / usable)
+            self.finish = now + window_left + overflow * WINDOW / usable
+
+    @property
+    def fits(self: Self) -> bool:
+        """
+        Whether the work fits in what is left of the current window.
+        """
+        return self.windows == 1
+
+    def __repr__(self: Self) -> str:
+        return (
+            f"Forecast(cost={self.cost}, budget={self.budget}, "
+            f"interval={self.interval:.2f}s, windows={self.windows})"
+        )
+
+
+class QuotaPlanner:
+    """
+    Forecasts whether work fits in a rate limit budget, and paces it across the window.
+
+    Bursting through the budget and then stalling until the reset starves everything
+    else sharing the token. `pace()` instead spaces requests so that the budget left,
+    minus `reserve`, runs out exactly when the window resets. The spacing is recomputed
+    from the live budget on every call, so other traffic slows the pace down.
+    """
+
+    __slots__ = ("resource", "reserve", "_next")
+
+    def __init__(self, resource: str = "core", reserve: int = 0) -> None:
+        self.resource = resource
+        self.reserve = reserve
+        self._next = 0.0
+
+    @property
+    def state(self: Self) -> RateLimitState | None:
+        """
+        The budget last seen by the scheduler, from `/rate_limit` or response headers.
+        """
+        return GitHubPortal._scheduler.rate_limits.get(self.resource)
+
+    async def refresh(self: Self) -> RateLimitState | None:
+        """
+        Read the current budget from `/rate_limit`, which costs no quota.
+        """
+        status, overview = await GitHubPortal.rate_limit()
+        if isinstance(overview, ErrorMessage):
+            return None
+        return self.state
+
+    async def forecast(self: Self, cost: int | CostEstimate) -> Forecast | None:
+        """
+        Forecast how `cost` requests fit in the budget, reading it first if it is not known.
+        Args:
+            cost (int | CostEstimate): The requests to make.
+        Returns:
+            Forecast | None: The forecast, or None if the budget could not be read.
+        """
+        state = self.state or await self.refresh()
+        if state is None:
+            return None
+        requests = cost.requests if isinstance(cost, CostEstimate) else cost
+        return Forecast(requests, state, self.reserve)
+
+    async def pace(self: Self, cost: int = 1) -> None:
+        """
+        Wait for the turn of the next `cost` requests. Call it before each job;
+        concurrent callers are queued one interval apart.
+        Args:
+            cost (int, optional): The requests the next job makes. Defaults to 1.
+        """
+        state = self.state
+        now = time()
+        if state is None or state.reset <= now:
+            # Unknown or already reset: nothing to spread yet.
+            return
+        forecast = Forecast(cost, state, self.reserve, now)
+        start = max(now, self._next, now if forecast.budget else state.reset)
+        interval = forecast.interval
+        self._next = start + cost * interval
+        if start > now:
+            await sleep(start - now)
+
+    async def schedule(
+        self: Self, jobs: Iterable[Callable[[], Awaitable[T]]], cost: int = 1
+    ) -> list[T]:
+        """
+        Start each job on its paced turn and wait for all of them.
+        Args:
+            jobs (Iterable[Callable[[], Awaitable[T]]]): Coroutine functions, each making about `cost` requests.
+            cost (int, optional): The requests one job makes. Defaults to 1.
+        Returns:
+            list[T]: The results, in job order.
+        """
+
+        async def run(job: Callable[[], Awaitable[T]]) -> T:
+            return await job()
+
+        tasks = []
+        for job in jobs:
+            await self.pace(cost)
+            tasks.append(create_task(run(job)))
+        return list(await gather(*tasks))
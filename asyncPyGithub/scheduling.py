@@ -0,0 +1,497 @@
+from __future__ import annotations
+
+from asyncio import Future, get_running_loop, sleep
+from collections import deque
+from collections.abc import Mapping
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from multiprocessing import get_context
+from multiprocessing.context import BaseContext
+from time import monotonic, time
+
+from typing_extensions import AsyncGenerator, Final, Literal, Self
+
+from .base import LOGGER
+
+Priority = Literal["interactive", "normal", "bulk"]
+"""
+The priority lane a request is scheduled in.
+'interactive' is meant for user-facing calls such as hovercards and profile lookups,
+'bulk' for background crawls and pagination. Usually defaults to 'normal'.
+"""
+
+PRIORITY_WEIGHTS: Final[dict[Priority, int]] = {
+    "interactive": 8,
+    "normal": 4,
+    "bulk": 1,
+}
+"""
+Relative share of free connection slots each lane receives when all lanes are backlogged.
+"""
+
+CURRENT_PRIORITY: ContextVar[Priority] = ContextVar(
+    "asyncPyGithub_priority", default="normal"
+)
+
+CURRENT_DEADLINE: ContextVar[float | None] = ContextVar(
+    "asyncPyGithub_deadline", default=None
+)
+"""
+The `monotonic()` time requests must be done by, set by `GitHubPortal.deadline()`.
+"""
+
+
+def time_left() -> float | None:
+    """
+    Seconds until the current deadline, negative once it has passed, or None without one.
+    """
+    deadline = CURRENT_DEADLINE.get()
+    return None if deadline is None else deadline - monotonic()
+
+
+def _within_deadline(delay: float, what: str) -> None:
+    # Waiting past the deadline only to fail then would waste what is left of it.
+    budget = time_left()
+    if budget is not None and delay > budget:
+        raise TimeoutError(f"{what} in {delay:.1f}s, after the deadline")
+
+
+class RateLimitState:
+    """
+    The last observed rate limit for a single GitHub rate limit resource (core, search, ...).
+
+    Attributes:
+        limit (int): The maximum number of requests allowed in the window.
+        remaining (int): The number of requests left in the window.
+        reset (float): The epoch timestamp at which the window resets.
+        used (int): The number of requests made in the window.
+    """
+
+    __slots__ = ("limit", "remaining", "reset", "used")
+
+    def __init__(self, limit: int, remaining: int, reset: float, used: int = 0) -> None:
+        self.limit = limit
+        self.remaining = remaining
+        self.reset = reset
+        self.used = used
+
+    @classmethod
+    def from_headers(cls: type[Self], headers: Mapping[str, str]) -> Self | None:
+        """
+        Build a rate limit state from the `X-RateLimit-*` response headers.
+        Args:
+            headers (Mapping[str, str]): The response headers.
+        Returns:
+            RateLimitState | None: The parsed state, or None if the headers are absent or malformed.
+        """
+        try:
+            return cls(
+                limit=int(headers["x-ratelimit-limit"]),
+                remaining=int(headers["x-ratelimit-remaining"]),
+                reset=float(headers["x-ratelimit-reset"]),
+                used=int(headers.get("x-ratelimit-used", 0)),
+            )
+        except (KeyError, ValueError):
+            return None
+
+
+class RequestScheduler:
+    """
+    Weighted fair queue in front of the shared connection pool.
+
+    Every request takes one of `capacity` slots before it is sent. When slots run out,
+    waiting requests are queued per priority lane and released in order of their
+    virtual finish time, so a lane with weight 8 is served eight times as often as a
+    lane with weight 1 while both are backlogged.
+
+    A `reserved` fraction of the slots is held back for the 'interactive' lane: other
+    lanes wait for a slot rather than eat into it. A `reserved_quota` fraction of each
+    rate limit window can be held back the same way, but it is off by default, since
+    other lanes then wait for the window to reset, which can take up to an hour.
+    """
+
+    __slots__ = (
+        "capacity",
+        "weights",
+        "reserved",
+        "reserved_quota",
+        "in_use",
+        "rate_limits",
+        "_lanes",
+        "_finish",
+        "_vtime",
+    )
+
+    def __init__(
+        self,
+        capacity: int = 20,
+        weights: Mapping[Priority, int] | None = None,
+        reserved: float = 0.2,
+        reserved_quota: float = 0.0,
+    ) -> None:
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        if not 0.0 <= reserved < 1.0:
+            raise ValueError("reserved must be within [0, 1)")
+        if not 0.0 <= reserved_quota < 1.0:
+            raise ValueError("reserved_quota must be within [0, 1)")
+
+        self.capacity = capacity
+        self.weights: dict[Priority, int] = dict(weights or PRIORITY_WEIGHTS)
+        self.reserved = reserved
+        self.reserved_quota = reserved_quota
+        self.in_use = 0
+        self.rate_limits: dict[str, RateLimitState] = {}
+        self._lanes: dict[Priority, deque[tuple[float, Future[None]]]] = {
+            lane: deque() for lane in self.weights
+        }
+        self._finish: dict[Priority, float] = {lane: 0.0 for lane in self.weights}
+        self._vtime = 0.0
+
+    @property
+    def reserved_slots(self: Self) -> int:
+        """
+        The number of slots only the 'interactive' lane may use.
+        """
+        return int(self.capacity * self.reserved)
+
+    @property
+    def waiting(self: Self) -> int:
+        """
+        The number of requests currently queued across all lanes.
+        """
+        return sum(len(lane) for lane in self._lanes.values())
+
+    def _has_room(self: Self, priority: Priority) -> bool:
+        if priority == "interactive":
+            return self.in_use < self.capacity
+        return self.in_use < self.capacity - self.reserved_slots
+
+    def resize(self: Self, capacity: int) -> None:
+        """
+        Change the number of slots. Requests already holding a slot beyond a smaller capacity finish normally.
+        Args:
+            capacity (int): The new number of slots.
+        """
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        grew, self.capacity = capacity > self.capacity, capacity
+        if grew:
+            self._dispatch()
+
+    def _dispatch(self: Self) -> None:
+        """
+        Hand free slots to queued requests, lowest virtual finish time first.
+        """
+        while True:
+            best: Priority | None = None
+            for lane, queue in self._lanes.items():
+                while queue and queue[0][1].done():
+                    queue.popleft()
+                if not queue or not self._has_room(lane):
+                    continue
+                if best is None or queue[0][0] < self._lanes[best][0][0]:
+                    best = lane
+
+            if best is None:
+                return
+
+            tag, waiter = self._lanes[best].popleft()
+            self._vtime = max(self._vtime, tag)
+            self.in_use += 1
+            waiter.set_result(None)
+
+    def _quota_reserved(self: Self, priority: Priority, resource: str) -> float:
+        """
+        Seconds a request must wait: any request once the resource is exhausted, and
+        non-interactive requests once only the share reserved for 'interactive' is left.
+        """
+        state = self.rate_limits.get(resource)
+        if state is None:
+            return 0.0
+        if state.remaining <= 0:
+            return max(0.0, state.reset - time())
+        if (
+            priority == "interactive"
+            or state.remaining > state.limit * self.reserved_quota
+        ):
+            return 0.0
+        return max(0.0, state.reset - time())
+
+    async def acquire(
+        self: Self, priority: Priority = "normal", resource: str = "core"
+    ) -> None:
+        """
+        Wait for a connection slot in the given lane.
+        Args:
+            priority (Priority, optional): The lane to queue in. Defaults to "normal".
+            resource (str, optional): The rate limit resource the request counts against. Defaults to "core".
+        """
+        delay = self._quota_reserved(priority, resource)
+        if delay > 0:
+            _within_deadline(delay, f"Reserved {resource} quota frees up")
+            LOGGER.warning(
+                f"acquire:::{priority} request held {delay:.1f}s for reserved {resource} quota"
+            )
+            await sleep(delay)
+
+        state = self.rate_limits.get(resource)
+        if state is not None:
+            # Count the request now so a burst cannot overdraw the window
+            # before the responses report the new remaining budget.
+            state.remaining -= 1
+
+        if self.waiting == 0 and self._has_room(priority):
+            self.in_use += 1
+            return
+
+        start = max(self._vtime, self._finish[priority])
+        tag = start + 1.0 / self.weights[priority]
+        self._finish[priority] = tag
+
+        waiter: Future[None] = get_running_loop().create_future()
+        self._lanes[priority].append((tag, waiter))
+        self._dispatch()
+        try:
+            await waiter
+        except BaseException:
+            if waiter.done() and not waiter.cancelled():
+                self.release()
+            raise
+
+    def release(self: Self) -> None:
+        """
+        Return a slot to the pool and wake the next queued request.
+        """
+        self.in_use -= 1
+        self._dispatch()
+
+    @asynccontextmanager
+    async def slot(
+        self: Self, priority: Priority = "normal", resource: str = "core"
+    ) -> AsyncGenerator[None, None]:
+        """
+        Hold a connection slot for the duration of the block.
+        Args:
+            priority (Priority, optional): The lane to queue in. Defaults to "normal".
+            resource (str, optional): The rate limit resource the request counts against. Defaults to "core".
+        """
+        await self.acquire(priority, resource)
+        try:
+            yield
+        finally:
+            self.release()
+
+    def observe(self: Self, headers: Mapping[str, str]) -> None:
+        """
+        Record the rate limit advertised by a response.
+        Args:
+            headers (Mapping[str, str]): The response headers.
+        """
+        state = RateLimitState.from_headers(headers)
+        if state is not None:
+            self.rate_limits[headers.get("x-ratelimit-resource", "core")] = state
+
+
+def overloaded(status: int, headers: Mapping[str, str]) -> bool:
+    """
+    Whether a response says GitHub wants fewer concurrent requests: a 429, a 5xx, or a
+    403 secondary rate limit, told apart from other 403s by its `Retry-After`.
+    """
+    if status == 429 or status >= 500:
+        return True
+    return status == 403 and "retry-after" in headers
+
+
+class AdaptiveLimiter:
+    """
+    Finds the concurrency GitHub tolerates right now, and keeps the scheduler's capacity there.
+
+    The limit grows additively, by one slot per round of requests, while the pool is
+    busy and responses are healthy. It is cut multiplicatively by `backoff` on 429s,
+    5xx, secondary rate limits and connection errors, or when the smoothed latency
+    climbs past `tolerance` times the best latency seen lately. Only one cut is made
+    per round trip: failures of requests sent before the last cut do not cut again.
+    Until the first cut the limit grows by one slot per response, to find the
+    ceiling quickly.
+
+        GitHubPortal.use_limiter(AdaptiveLimiter())
+        ...
+        print(GitHubPortal._limiter.concurrency)
+
+    Attributes:
+        minimum (int): The lowest the limit goes.
+        maximum (int): The highest the limit goes, at most the connection pool size.
+        backoff (float): The factor the limit is cut by.
+        tolerance (float | None): The latency increase read as congestion, or None to ignore latency.
+        limit (float): The current limit; `concurrency` is its whole part.
+        latency (float | None): The smoothed latency of recent responses, in seconds.
+        baseline (float | None): The best latency seen lately, in seconds.
+        epoch (int): The number of cuts so far; requests remember the epoch they were sent in.
+    """
+
+    __slots__ = (
+        "minimum",
+        "maximum",
+        "backoff",
+        "tolerance",
+        "limit",
+        "latency",
+        "baseline",
+        "epoch",
+        "_slow_start",
+    )
+
+    def __init__(
+        self,
+        initial: int = 4,
+        minimum: int = 1,
+        maximum: int = 20,
+        backoff: float = 0.5,
+        tolerance: float | None = 3.0,
+    ) -> None:
+        if not 1 <= minimum <= initial <= maximum:
+            raise ValueError("expected 1 <= minimum <= initial <= maximum")
+        if not 0.0 < backoff < 1.0:
+            raise ValueError("backoff must be within (0, 1)")
+
+        self.minimum = minimum
+        self.maximum = maximum
+        self.backoff = backoff
+        self.tolerance = tolerance
+        self.limit = float(initial)
+        self.latency: float | None = None
+        self.baseline: float | None = None
+        self.epoch = 0
+        self._slow_start = True
+
+    @property
+    def concurrency(self: Self) -> int:
+        """
+        The number of requests allowed in flight.
+        """
+        return int(self.limit)
+
+    def _congested(self: Self, latency: float) -> bool:
+        self.latency = (
+            latency if self.latency is None else self.latency * 0.8 + latency * 0.2
+        )
+        # The baseline follows new minimums at once and forgets old ones slowly.
+        self.baseline = (
+            latency
+            if self.baseline is None
+            else min(latency, self.baseline + (latency - self.baseline) * 0.01)
+        )
+        return self.tolerance is not None and (
+            self.latency > self.baseline * self.tolerance
+        )
+
+    def observe(
+        self: Self, epoch: int, latency: float | None, failed: bool, busy: bool
+    ) -> int:
+        """
+        Adjust the limit after a response, or a failure to get one.
+        Args:
+            epoch (int): The `epoch` when the request was sent.
+            latency (float | None): The seconds the request took, or None if it failed without a response.
+            failed (bool): Whether the outcome asks for less concurrency, see `overloaded`.
+            busy (bool): Whether the pool was full, so that more room could have been used.
+        Returns:
+            int: The new concurrency.
+        """
+        congested = latency is not None and self._congested(latency)
+        if failed or congested:
+            if epoch == self.epoch:
+                self.epoch += 1
+                self._slow_start = False
+                self.limit = max(float(self.minimum), self.limit * self.backoff)
+                LOGGER.warning(
+                    f"AdaptiveLimiter:::{'Errors' if failed else 'Latency'} cut concurrency to {self.concurrency}"
+                )
+        elif busy:
+            step = 1.0 if self._slow_start else 1.0 / self.limit
+            self.limit = min(float(self.maximum), self.limit + step)
+        return self.concurrency
+
+
+class QuotaBroker:
+    """
+    A rate limit budget shared between processes through shared memory.
+
+    Every request takes one unit of the budget before it is sent; responses then correct
+    the budget from their `X-RateLimit-*` headers. Once the budget is down to `reserve`,
+    requests in every process wait for the window to reset instead of exceeding the quota.
+    Until the first response arrives the budget is unknown and requests are let through.
+
+    The broker must be created in the parent process and handed to workers when they are
+    started, as with any `multiprocessing` synchronisation primitive.
+    """
+
+    __slots__ = ("reserve", "resource", "_lock", "_remaining", "_reset")
+
+    def __init__(
+        self,
+        reserve: int = 0,
+        resource: str = "core",
+        context: BaseContext | None = None,
+    ) -> None:
+        ctx = context or get_context("spawn")
+        self.reserve = reserve
+        self.resource = resource
+        self._lock = ctx.Lock()
+        self._remaining = ctx.Value("q", -1, lock=False)
+        self._reset = ctx.Value("d", 0.0, lock=False)
+
+    @property
+    def remaining(self: Self) -> int | None:
+        """
+        The shared remaining budget, or None while it is unknown.
+        """
+        with self._lock:
+            value = int(self._remaining.value)
+        return None if value < 0 else value
+
+    def try_acquire(self: Self) -> float:
+        """
+        Take one unit of the budget if there is one.
+        Returns:
+            float: 0.0 if a unit was taken, otherwise the seconds until the window resets.
+        """
+        now = time()
+        with self._lock:
+            if self._reset.value and now >= self._reset.value:
+                self._remaining.value = -1
+                self._reset.value = 0.0
+            if self._remaining.value < 0:
+                return 0.0
+            if self._remaining.value > self.reserve:
+                self._remaining.value -= 1
+                return 0.0
+            return max(float(self._reset.value) - now, 0.05)
+
+    async def acquire(self: Self) -> None:
+        """
+        Wait until a unit of the shared budget is available and take it.
+        """
+        while (delay := self.try_acquire()) > 0:
+            _within_deadline(delay, "The shared budget resets")
+            LOGGER.warning(f"QuotaBroker:::Budget exhausted, waiting {delay:.1f}s")
+            await sleep(delay)
+
+    def observe(self: Self, headers: Mapping[str, str]) -> None:
+        """
+        Correct the shared budget from the rate limit advertised by a response.
+        Args:
+            headers (Mapping[str, str]): The response headers.
+        """
+        if headers.get("x-ratelimit-resource", "core") != self.resource:
+            return
+        state = RateLimitState.from_headers(headers)
+        if state is None:
+            return
+        with self._lock:
+            if state.reset > self._reset.value or self._remaining.value < 0:
+                self._remaining.value = state.remaining
+                self._reset.value = state.reset
+            else:
+                self._remaining.value = min(self._remaining.value, state.remaining)
@@ -0,0 +1,228 @@
+from __future__ import annotations
+
+from asyncio import get_running_loop
+from collections.abc import AsyncIterable, AsyncIterator, Iterable, Iterator
+from contextlib import contextmanager
+from socket import AF_UNSPEC, SOCK_STREAM, gaierror
+from time import monotonic
+from typing import Final
+from urllib.request import getproxies
+
+import httpcore
+import httpx
+from httpx import (
+    AsyncBaseTransport,
+    AsyncByteStream,
+    Limits,
+    Request,
+    Response,
+    create_ssl_context,
+)
+from typing_extensions import Self
+
+from .base import LOGGER
+
+
+class CachingResolver(httpcore.AsyncNetworkBackend):
+    """
+    Network backend that resolves each host once per `ttl` seconds.
+
+    Python does not cache DNS lookups, so every new pooled connection would otherwise pay
+    a `getaddrinfo` round trip. New connections reuse the cached addresses, trying each in
+    turn, and a host whose addresses all fail to connect is looked up again.
+    TLS still verifies and sends SNI for the original host name.
+    """
+
+    __slots__ = ("ttl", "_backend", "_cache")
+
+    def __init__(
+        self,
+        ttl: float = 300.0,
+        backend: httpcore.AsyncNetworkBackend | None = None,
+    ) -> None:
+        self.ttl = ttl
+        self._backend = backend or httpcore.AnyIOBackend()
+        self._cache: dict[tuple[str, int], tuple[list[str], float]] = {}
+
+    async def resolve(self: Self, host: str, port: int) -> list[str]:
+        """
+        Look up the addresses of a host, from the cache while it is fresh.
+        Args:
+            host (str): The host name.
+            port (int): The port to connect to.
+        Returns:
+            list[str]: The resolved addresses, or the host itself if the lookup failed.
+        """
+        cached = self._cache.get((host, port))
+        if cached is not None and cached[1] > monotonic():
+            return cached[0]
+
+        try:
+            infos = await get_running_loop().getaddrinfo(
+                host, port, family=AF_UNSPEC, type=SOCK_STREAM
+            )
+        except gaierror as err:
+            LOGGER.warning(f"CachingResolver:::Could not resolve {host}: {err}")
+            return [host]
+
+        addresses = list(dict.fromkeys(str(info[4][0]) for info in infos))
+        self._cache[(host, port)] = (addresses, monotonic() + self.ttl)
+        return addresses
+
+    def forget(self: Self, host: str, port: int) -> None:
+        """
+        Drop a host from the cache so the next connection looks it up again.
+        """
+        self._cache.pop((host, port), None)
+
+    async def connect_tcp(
+        self: Self,
+        host: str,
+        port: int,
+        timeout: float | None = None,
+        local_address: str | None = None,
+        socket_options: Iterable[httpcore.SOCKET_OPTION] | None = None,
+    ) -> httpcore.AsyncNetworkStream:
+        last_error: Exception | None = None
+        for address in await self.resolve(host, port):
+            try:
+                return await self._backend.connect_tcp(
+                    address, port, timeout, local_address, socket_options
+                )
+            except (httpcore.ConnectError, httpcore.ConnectTimeout) as err:
+                last_error = err
+
+        self.forget(host, port)
+        raise last_error or httpcore.ConnectError(f"No addresses for {host}")
+
+    async def connect_unix_socket(
+        self: Self,
+        path: str,
+        timeout: float | None = None,
+        socket_options: Iterable[httpcore.SOCKET_OPTION] | None = None,
+    ) -> httpcore.AsyncNetworkStream:
+        return await self._backend.connect_unix_socket(path, timeout, socket_options)
+
+    async def sleep(self: Self, seconds: float) -> None:
+        await self._backend.sleep(seconds)
+
+
+HTTPCORE_ERRORS: Final[tuple[tuple[type[Exception], type[httpx.HTTPError]], ...]] = (
+    (httpcore.PoolTimeout, httpx.PoolTimeout),
+    (httpcore.ConnectTimeout, httpx.ConnectTimeout),
+    (httpcore.ReadTimeout, httpx.ReadTimeout),
+    (httpcore.WriteTimeout, httpx.WriteTimeout),
+    (httpcore.TimeoutException, httpx.TimeoutException),
+    (httpcore.ConnectError, httpx.ConnectError),
+    (httpcore.ReadError, httpx.ReadError),
+    (httpcore.WriteError, httpx.WriteError),
+    (httpcore.NetworkError, httpx.NetworkError),
+    (httpcore.ProxyError, httpx.ProxyError),
+    (httpcore.UnsupportedProtocol, httpx.UnsupportedProtocol),
+    (httpcore.RemoteProtocolError, httpx.RemoteProtocolError),
+    (httpcore.LocalProtocolError, httpx.LocalProtocolError),
+    (httpcore.ProtocolError, httpx.ProtocolError),
+)
+"""
+httpcore errors and the httpx errors they are raised as, most specific first, so
+callers catching `httpx.TransportError` see the same errors as with httpx's own transport.
+"""
+
+
+@contextmanager
+def _httpx_errors() -> Iterator[None]:
+    try:
+        yield
+    except Exception as err:
+        for source, target in HTTPCORE_ERRORS:
+            if isinstance(err, source):
+                raise target(str(err)) from err
+        raise
+
+
+class _ResponseStream(AsyncByteStream):
+    __slots__ = ("_stream",)
+
+    def __init__(self, stream: AsyncIterable[bytes]) -> None:
+        self._stream = stream
+
+    async def __aiter__(self: Self) -> AsyncIterator[bytes]:
+        with _httpx_errors():
+            async for chunk in self._stream:
+                yield chunk
+
+    async def aclose(self: Self) -> None:
+        aclose = getattr(self._stream, "aclose", None)
+        if aclose is not None:
+            await aclose()
+
+
+class ResolvingTransport(AsyncBaseTransport):
+    """
+    An httpx transport over an httpcore connection pool built here, so the pool can
+    use a network backend, such as the `CachingResolver`, that httpx has no argument for.
+    Requests, responses and errors are converted through public httpx and httpcore API only.
+    """
+
+    __slots__ = ("_pool",)
+
+    def __init__(self, pool: httpcore.AsyncConnectionPool) -> None:
+        self._pool = pool
+
+    async def handle_async_request(self: Self, request: Request) -> Response:
+        assert isinstance(request.stream, AsyncByteStream)
+        core_request = httpcore.Request(
+            method=request.method,
+            url=httpcore.URL(
+                scheme=request.url.raw_scheme,
+                host=request.url.raw_host,
+                port=request.url.port,
+                target=request.url.raw_path,
+            ),
+            headers=request.headers.raw,
+            content=request.stream,
+            extensions=request.extensions,
+        )
+        with _httpx_errors():
+            response = await self._pool.handle_async_request(core_request)
+        # An async pool always answers with an async stream.
+        assert isinstance(response.stream, AsyncIterable)
+
+        return Response(
+            status_code=response.status,
+            headers=response.headers,
+            stream=_ResponseStream(response.stream),
+            extensions=response.extensions,
+        )
+
+    async def aclose(self: Self) -> None:
+        await self._pool.aclose()
+
+
+def build_transport(
+    limits: Limits, http2: bool, resolver: CachingResolver
+) -> ResolvingTransport | None:
+    """
+    Build a pooled transport whose new connections go through the caching resolver.
+    Args:
+        limits (Limits): The connection pool limits.
+        http2 (bool): Whether to negotiate HTTP/2.
+        resolver (CachingResolver): The DNS caching network backend.
+    Returns:
+        ResolvingTransport | None: The transport, or None when an environment proxy is configured
+        (the proxy resolves names itself and httpx only honours it for its default transport).
+    """
+    if "https" in getproxies() or "all" in getproxies():
+        return None
+
+    return ResolvingTransport(
+        httpcore.AsyncConnectionPool(
+            ssl_context=create_ssl_context(),
+            max_connections=limits.max_connections,
+            max_keepalive_connections=limits.max_keepalive_connections,
+            keepalive_expiry=limits.keepalive_expiry,
+            http1=True,
+            http2=http2,
+            network_backend=resolver,
+        )
+    )
@@ -0,0 +1,293 @@
+from __future__ import annotations
+
+import hmac
+from asyncio import gather
+from collections.abc import Awaitable, Callable, Mapping
+from hashlib import sha256
+from json import dumps
+from typing import Any, Final
+
+from pydantic import ValidationError
+from typing_extensions import Self
+
+from ._types import (
+    CreateEvent,
+    DeleteEvent,
+    GitHubPortal,
+    PingEvent,
+    PushEvent,
+    RepositoryEvent,
+    SimpleUser,
+    WebhookEvent,
+)
+from ._types.base import validate_json
+from .base import LOGGER
+from .cache import ResponseCache, cache_key
+
+EVENT_MODELS: Final[dict[str, type[WebhookEvent]]] = {
+    "ping": PingEvent,
+    "push": PushEvent,
+    "repository": RepositoryEvent,
+    "create": CreateEvent,
+    "delete": DeleteEvent,
+}
+
+WebhookHandler = Callable[[WebhookEvent], Awaitable[None]]
+"""
+A coroutine function called with each parsed event it was registered for.
+"""
+
+ASGIMessage = dict[str, Any]
+ASGIReceive = Callable[[], Awaitable[ASGIMessage]]
+ASGISend = Callable[[ASGIMessage], Awaitable[None]]
+
+
+class WebhookSignatureError(ValueError):
+    """
+    Raised when a delivery's `X-Hub-Signature-256` does not match its body.
+    """
+
+
+def sign(secret: str | bytes, body: bytes) -> str:
+    """
+    The `X-Hub-Signature-256` header GitHub sends with a body, for replaying captured deliveries.
+    Args:
+        secret (str | bytes): The webhook secret.
+        body (bytes): The raw request body.
+    Returns:
+        str: The signature, e.g. "sha256=6dcb09b5...".
+    """
+    key = secret.encode() if isinstance(secret, str) else secret
+    return "sha256=" + hmac.new(key, body, sha256).hexdigest()
+
+
+def verify_signature(secret: str | bytes, body: bytes, signature: str | None) -> bool:
+    """
+    Check a delivery's signature in constant time.
+    Args:
+        secret (str | bytes): The webhook secret.
+        body (bytes): The raw request body, exactly as received.
+        signature (str | None): The `X-Hub-Signature-256` header.
+    Returns:
+        bool: True if the body was signed with the secret.
+    """
+    if not signature:
+        return False
+    return hmac.compare_digest(sign(secret, body), signature)
+
+
+def parse_event(name: str, body: bytes) -> WebhookEvent:
+    """
+    Parse a webhook payload into the model for its event.
+    Args:
+        name (str): The `X-GitHub-Event` header, e.g. "push".
+        body (bytes): The raw JSON payload.
+    Returns:
+        WebhookEvent: A `PushEvent`, `RepositoryEvent`, etc., or a plain `WebhookEvent` for other events.
+    """
+    return validate_json(EVENT_MODELS.get(name, WebhookEvent), body)
+
+
+def refresh_caches(
+    event: WebhookEvent, cache: ResponseCache | None = None
+) -> list[str]:
+    """
+    Bring the portal's caches up to date with an event, instead of polling for it.
+    Repository metadata that changed is dropped from the response cache, topics are
+    rewritten in place, and with session interning on, the sender and owner replace any stale interned copy.
+    Args:
+        event (WebhookEvent): The parsed event.
+        cache (ResponseCache | None, optional): The response cache to update. Defaults to the portal's.
+    Returns:
+        list[str]: The cache paths dropped, for logging.
+    """
+    if GitHubPortal._intern_scope == "session":
+        for user in (event.sender, event.repository and event.repository.owner):
+            if isinstance(user, SimpleUser):
+                GitHubPortal._identity_map.put(SimpleUser, user.id, user)
+
+    cache = cache if cache is not None else GitHubPortal.cache()
+    if cache is None or event.repository is None:
+        return []
+
+    repo = f"repos/{event.repository.full_name}"
+    paths: list[str] = []
+    match event:
+        case PushEvent():
+            # Contents, commits, branches, tags and pushed_at may all have changed.
+            paths.append(repo)
+        case RepositoryEvent(action="renamed" | "transferred" | "deleted"):
+            paths.append(repo)
+            changes = event.changes or {}
+            # The old name or owner, which cached entries are still keyed by.
+            name = changes.get("repository", {}).get("name", {}).get("from")
+            if name is not None:
+                paths.append(f"repos/{event.repository.owner.login}/{name}")
+            for account in changes.get("owner", {}).get("from", {}).values():
+                paths.append(f"repos/{account['login']}/{event.repository.name}")
+        case RepositoryEvent():
+            cache.invalidate(repo, recursive=False)
+            cache.update(
+                cache_key(f"{repo}/topics"),
+                dumps({"names": event.repository.topics}).encode(),
+            )
+        case CreateEvent(ref_type="tag") | DeleteEvent(ref_type="tag"):
+            paths.append(f"{repo}/tags")
+        case CreateEvent() | DeleteEvent():
+            paths.append(f"{repo}/branches")
+
+    for path in paths:
+        cache.invalidate(path)
+    return paths
+
+
+class WebhookDispatcher:
+    """
+    Verifies, parses and routes webhook deliveries, and keeps the portal's caches
+    current with them. It is also an ASGI application, so it can be served directly
+    or mounted in any ASGI framework:
+
+        hooks = WebhookDispatcher(secret)
+
+        @hooks.on("push")
+        async def pushed(event: WebhookEvent) -> None: ...
+
+        uvicorn.run(hooks)
+    """
+
+    __slots__ = ("secret", "update_caches", "cache", "_handlers")
+
+    def __init__(
+        self,
+        secret: str | bytes | None,
+        update_caches: bool = True,
+        cache: ResponseCache | None = None,
+    ) -> None:
+        """
+        Args:
+            secret (str | bytes | None): The webhook secret. None accepts unsigned deliveries, for local testing only.
+            update_caches (bool, optional): Apply `refresh_caches` to every event before the handlers run. Defaults to True.
+            cache (ResponseCache | None, optional): The response cache to update. Defaults to the portal's at delivery time.
+        """
+        self.secret = secret
+        self.update_caches = update_caches
+        self.cache = cache
+        self._handlers: dict[tuple[str, str | None], list[WebhookHandler]] = {}
+
+    def on(
+        self: Self, event: str, action: str | None = None
+    ) -> Callable[[WebhookHandler], WebhookHandler]:
+        """
+        Register a handler for an event, or only for one of its actions.
+        Args:
+            event (str): The event name, e.g. "push", or "*" for every event.
+            action (str | None, optional): The action, e.g. "edited". Defaults to every action.
+        Returns:
+            Callable[[WebhookHandler], WebhookHandler]: A decorator registering the handler.
+        """
+
+        def register(handler: WebhookHandler) -> WebhookHandler:
+            self._handlers.setdefault((event, action), []).append(handler)
+            return handler
+
+        return register
+
+    async def dispatch(self: Self, name: str, event: WebhookEvent) -> None:
+        """
+        Update the caches and run every handler registered for the event, concurrently.
+        Raises:
+            Exception: The first error a handler raised, after all of them ran.
+        """
+        if self.update_caches:
+            dropped = refresh_caches(event, self.cache)
+            if dropped:
+                LOGGER.info(f"WebhookDispatcher:::{name} dropped {dropped}")
+
+        handlers = [
+            handler
+            for key in dict.fromkeys(((name, None), (name, event.action), ("*", None)))
+            for handler in self._handlers.get(key, ())
+        ]
+        results = await gather(
+            *(handler(event) for handler in handlers), return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                raise result
+
+    async def deliver(
+        self: Self, headers: Mapping[str, str], body: bytes
+    ) -> WebhookEvent:
+        """
+        Handle one delivery: verify its signature, parse it and dispatch it.
+        Args:
+            headers (Mapping[str, str]): The request headers, with lowercase names.
+            body (bytes): The raw request body.
+        Returns:
+            WebhookEvent: The parsed event.
+        Raises:
+            WebhookSignatureError: If a secret is set and the signature does not match.
+            ValidationError: If the payload does not fit its event model.
+        """
+        if self.secret is not None and not verify_signature(
+            self.secret, body, headers.get("x-hub-signature-256")
+        ):
+            raise WebhookSignatureError("signature does not match the payload")
+
+        name = headers.get("x-github-event", "")
+        event = parse_event(name, body)
+        await self.dispatch(name, event)
+        return event
+
+    async def __call__(
+        self: Self, scope: ASGIMessage, receive: ASGIReceive, send: ASGISend
+    ) -> None:
+        if scope["type"] == "lifespan":
+            while True:
+                message = await receive()
+                if message["type"] == "lifespan.startup":
+                    await send({"type": "lifespan.startup.complete"})
+                elif message["type"] == "lifespan.shutdown":
+                    return await send({"type": "lifespan.shutdown.complete"})
+
+        if scope["type"] != "http":
+            return
+
+        if scope["method"] != "POST":
+            return await _respond(send, 405)
+
+        body = b""
+        more = True
+        while more:
+            message = await receive()
+            body += message.get("body", b"")
+            more = message.get("more_body", False)
+
+        headers = {
+            k.decode("latin-1").lower(): v.decode("latin-1")
+            for k, v in scope["headers"]
+        }
+        delivery = headers.get("x-github-delivery", "?")
+        try:
+            await self.deliver(headers, body)
+        except WebhookSignatureError:
+            LOGGER.warning(
+                f"WebhookDispatcher:::Rejected delivery {delivery}, bad signature"
+            )
+            return await _respond(send, 401)
+        except ValidationError as err:
+            LOGGER.error(
+                f"WebhookDispatcher:::Bad payload in delivery {delivery}: {err}"
+            )
+            return await _respond(send, 400)
+        except Exception as err:
+            LOGGER.error(
+                f"WebhookDispatcher:::Handler failed for delivery {delivery}: {err}"
+            )
+            return await _respond(send, 500)
+        await _respond(send, 204)
+
+
+async def _respond(send: ASGISend, status: int) -> None:
+    await send({"type": "http.response.start", "status": status, "headers": []})
+    await send({"type": "http.response.body", "body": b""})
@@ -9,6 +9,7 @@ import respx
 from httpx import Response
 
 from asyncPyGithub import GitHubPortal
+from asyncPyGithub.scheduling import RequestScheduler
 
 MOCK_ENV_VARS: Final[dict[str, str]] = {"GITHUB_TOKEN": "mock_token"}
 API_BASE_URL: Final[str] = "https://api.github.com"
@@ -32,6 +33,14 @@ async def reset_portal_state() -> AsyncGenerator[None, None]:
     GitHubPortal._authenticated = False
     GitHubPortal._client = None
     GitHubPortal._headers["Authorization"] = None
+    GitHubPortal._principal = ""
+    GitHubPortal._scheduler = RequestScheduler(capacity=GitHubPortal._pool_size)
+    GitHubPortal.intern_nested("response")
+    GitHubPortal.use_cache(None)
+    GitHubPortal.use_breaker(None)
+    GitHubPortal._timeouts.clear()
+    GitHubPortal.use_limiter(None)
+    GitHubPortal.use_hedging(None)
 
     yield
 
@@ -37,6 +37,9 @@ async def test_authenticate_sucessful(mock_requests: respx.MockRouter) -> None:
     assert (
         user.model_dump(mode="json") == mock_user
     ), f"User data mismatch: {user.model_dump(mode='json')} != {mock_user}"
+    assert (
+        GitHubPortal._principal == f"user:{user.id}"
+    ), "Cached responses should be kept per user, not per token."
 
 
 @no_type_check
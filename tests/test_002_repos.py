@@ -50,3 +50,97 @@ async def test_get_organization_repos_successful(
             repo, MinimalRepository
         ), "Expected a MinimalRepository instance."
         repo = cast(MinimalRepository, repo)
+
+
+@no_type_check
+@mark.asyncio
+async def test_get_organization_repos_return_modes(
+    mock_requests: respx.MockRouter,
+) -> None:
+    GitHubPortal.use_token("mock_token")
+
+    mock_repos = read_json(JSONDIR / "org_repos.json")
+    mock_requests.get("/orgs/LEGO/repos").mock(
+        return_value=Response(200, json=mock_repos)
+    )
+
+    status, repos = await GitHubRepositoryPortal.get_organization_repos(
+        organization="LEGO", mode="dict"
+    )
+    assert status == 200, f">> Could not fetch organization repositories::{repos}"
+    assert repos == mock_repos, "dict mode should return the decoded JSON unchanged."
+
+    status, body = await GitHubRepositoryPortal.get_organization_repos(
+        organization="LEGO", mode="bytes"
+    )
+    assert status == 200, f">> Could not fetch organization repositories::{body}"
+    assert isinstance(body, bytes), "bytes mode should return the raw body."
+    assert body == mock_requests.calls.last.response.content, "Body was re-encoded."
+
+
+@no_type_check
+@mark.asyncio
+async def test_get_organization_repos_projection(
+    mock_requests: respx.MockRouter,
+) -> None:
+    GitHubPortal.use_token("mock_token")
+
+    mock_repos = read_json(JSONDIR / "org_repos.json")
+    mock_requests.get("/orgs/LEGO/repos").mock(
+        return_value=Response(200, json=mock_repos)
+    )
+
+    fields = ("id", "full_name", "pushed_at", "stargazers_count")
+    status, repos = await GitHubRepositoryPortal.get_organization_repos(
+        organization="LEGO", fields=fields
+    )
+    assert status == 200, f">> Could not fetch organization repositories::{repos}"
+    _, full = await GitHubRepositoryPortal.get_organization_repos(organization="LEGO")
+
+    for projected, repo in zip(repos, full):
+        assert (
+            tuple(type(projected).model_fields) == fields
+        ), "Projection should only define the requested fields."
+        assert projected.model_dump() == repo.model_dump(
+            include=set(fields)
+        ), "Projected values differ from the full model."
+
+    status, error = await GitHubRepositoryPortal.get_organization_repos(
+        organization="LEGO", fields=("stars",)
+    )
+    assert status == 400, "Unknown fields should be a client error."
+    assert isinstance(error, ErrorMessage) and "stars" in error.message
+
+
+@no_type_check
+@mark.asyncio
+async def test_get_organization_repos_interns_owners(
+    mock_requests: respx.MockRouter,
+) -> None:
+    GitHubPortal.use_token("mock_token")
+
+    mock_repos = read_json(JSONDIR / "org_repos.json")
+    mock_requests.get("/orgs/LEGO/repos").mock(
+        return_value=Response(200, json=mock_repos)
+    )
+    owners = {repo["owner"]["id"] for repo in mock_repos}
+
+    _, repos = await GitHubRepositoryPortal.get_organization_repos("LEGO")
+    assert len({id(repo.owner) for repo in repos}) == len(
+        owners
+    ), "Owners within one response should share an instance."
+
+    _, again = await GitHubRepositoryPortal.get_organization_repos("LEGO")
+    assert again[0].owner is not repos[0].owner, "Response scope leaked across calls."
+
+    GitHubPortal.intern_nested("session")
+    _, first = await GitHubRepositoryPortal.get_organization_repos("LEGO")
+    _, second = await GitHubRepositoryPortal.get_organization_repos("LEGO")
+    assert first[0].owner is second[0].owner, "Session scope should share owners."
+
+    GitHubPortal.intern_nested(None)
+    _, plain = await GitHubRepositoryPortal.get_organization_repos("LEGO")
+    assert len({id(repo.owner) for repo in plain}) == len(
+        plain
+    ), "Interning should be off."
+    assert plain[0].owner == first[0].owner, "Interned and plain owners differ."
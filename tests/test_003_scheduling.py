@@ -0,0 +1,153 @@
+import asyncio
+from pathlib import Path
+from time import time
+from typing import no_type_check
+
+import respx
+from httpx import Request, Response
+from pytest import mark
+
+from asyncPyGithub import AdaptiveLimiter, GitHubPortal, GitHubUserPortal, read_json
+from asyncPyGithub.scheduling import RateLimitState, RequestScheduler
+
+JSONDIR = Path(__file__).parent.resolve() / "traffic"
+USER_ENDPOINT = "/user"
+
+
+@no_type_check
+@mark.asyncio
+async def test_interactive_skips_ahead_of_bulk() -> None:
+    scheduler = RequestScheduler(capacity=1, reserved=0.0)
+    order: list[str] = []
+
+    async def run(lane: str, name: str) -> None:
+        async with scheduler.slot(lane):
+            order.append(name)
+            await asyncio.sleep(0)
+
+    await scheduler.acquire("bulk")
+    tasks = [asyncio.create_task(run("bulk", f"bulk-{i}")) for i in range(4)]
+    await asyncio.sleep(0)
+    tasks.append(asyncio.create_task(run("interactive", "interactive")))
+    await asyncio.sleep(0)
+
+    scheduler.release()
+    await asyncio.gather(*tasks)
+
+    assert order.index("interactive") <= 1, f"Interactive request was starved: {order}"
+    assert scheduler.in_use == 0, "All slots should be released."
+
+
+@no_type_check
+@mark.asyncio
+async def test_reserved_slots_only_serve_interactive() -> None:
+    scheduler = RequestScheduler(capacity=5, reserved=0.2)
+    for _ in range(4):
+        await scheduler.acquire("bulk")
+
+    bulk = asyncio.create_task(scheduler.acquire("bulk"))
+    await asyncio.sleep(0)
+    assert not bulk.done(), "Bulk request took the reserved slot."
+
+    await asyncio.wait_for(scheduler.acquire("interactive"), timeout=1)
+    assert scheduler.in_use == 5
+
+    scheduler.release()
+    scheduler.release()
+    await asyncio.wait_for(bulk, timeout=1)
+
+
+@no_type_check
+@mark.asyncio
+async def test_reserved_quota_holds_bulk(mock_requests: respx.MockRouter) -> None:
+    GitHubPortal._scheduler = RequestScheduler(
+        capacity=GitHubPortal._pool_size, reserved_quota=0.2
+    )
+    mock_auth = read_json(JSONDIR / "authenticate.json")
+    mock_requests.get(USER_ENDPOINT).mock(
+        return_value=Response(
+            200,
+            json=mock_auth,
+            headers={
+                "x-ratelimit-limit": "5000",
+                "x-ratelimit-remaining": "10",
+                "x-ratelimit-reset": str(int(time()) + 3600),
+                "x-ratelimit-resource": "core",
+            },
+        )
+    )
+    mock_requests.get("/users/someone/hovercard").mock(
+        return_value=Response(200, json={"contexts": []})
+    )
+    await GitHubPortal.authenticate("mock_token")
+
+    with GitHubPortal.priority("interactive"):
+        status, _ = await asyncio.wait_for(
+            GitHubUserPortal.get_hovercard("someone"), timeout=1
+        )
+    assert status == 200, "Interactive request should use the reserved quota."
+
+    with GitHubPortal.priority("bulk"):
+        held = asyncio.create_task(GitHubUserPortal.get_hovercard("someone"))
+        await asyncio.sleep(0.05)
+    assert not held.done(), "Bulk request should wait for the rate limit reset."
+    held.cancel()
+    await asyncio.gather(held, return_exceptions=True)
+
+
+@no_type_check
+@mark.asyncio
+async def test_adaptive_limiter_finds_the_ceiling(
+    mock_requests: respx.MockRouter,
+) -> None:
+    limiter = GitHubPortal.use_limiter(AdaptiveLimiter(initial=2, tolerance=None))
+    in_flight, served = 0, []
+
+    async def server(request: Request) -> Response:
+        # Tolerates eight concurrent requests, then trips the secondary rate limit.
+        nonlocal in_flight
+        in_flight += 1
+        try:
+            await asyncio.sleep(0.005)
+            if in_flight > 8:
+                return Response(403, headers={"retry-after": "1"})
+            served.append(in_flight)
+            return Response(200, text="Keep it logically awesome.")
+        finally:
+            in_flight -= 1
+
+    mock_requests.get("/zen").mock(side_effect=server)
+    responses = await asyncio.gather(
+        *(GitHubPortal.req("GET", "/zen") for _ in range(400))
+    )
+
+    rejected = sum(res.status_code == 403 for res in responses)
+    assert rejected < 40, f"Too many secondary rate limits: {rejected}"
+    assert 4 <= limiter.concurrency <= 9, f"Limit did not settle: {limiter.concurrency}"
+    assert max(served) >= 7, "Concurrency should climb close to the ceiling."
+    assert GitHubPortal._scheduler.capacity == limiter.concurrency, "Not applied."
+
+
+def test_adaptive_limiter_cuts_once_per_round_trip() -> None:
+    limiter = AdaptiveLimiter(initial=16, maximum=20, tolerance=None)
+    epoch = limiter.epoch
+    for _ in range(5):
+        limiter.observe(epoch, 0.1, failed=True, busy=True)
+    assert limiter.concurrency == 8, "A burst of failures should cut only once."
+
+    for _ in range(9):
+        limiter.observe(limiter.epoch, 0.1, failed=False, busy=True)
+    assert limiter.concurrency == 9, "Growth should be about one slot per round."
+    limiter.observe(limiter.epoch, 0.1, failed=False, busy=False)
+    assert limiter.concurrency == 9, "An idle pool should not raise the limit."
+
+
+@no_type_check
+@mark.asyncio
+async def test_quota_is_not_reserved_by_default() -> None:
+    scheduler = RequestScheduler(capacity=5)
+    scheduler.rate_limits["core"] = RateLimitState(
+        limit=5000, remaining=10, reset=time() + 3600
+    )
+    await asyncio.wait_for(scheduler.acquire("normal"), timeout=1)
+    scheduler.release()
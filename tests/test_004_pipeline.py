@@ -0,0 +1,106 @@
+import asyncio
+from collections.abc import AsyncIterator
+from pathlib import Path
+from typing import Any, no_type_check
+
+import respx
+from httpx import Response
+from pytest import mark
+
+from asyncPyGithub import (
+    GitHubPortal,
+    GitHubRepositoryPortal,
+    MinimalRepository,
+    Pipeline,
+    read_json,
+)
+
+JSONDIR = Path(__file__).parent.resolve() / "traffic"
+USER_ENDPOINT = "/user"
+
+
+@no_type_check
+@mark.asyncio
+async def test_paginate_organization_repos(mock_requests: respx.MockRouter) -> None:
+    mock_auth = read_json(JSONDIR / "authenticate.json")
+    mock_requests.get(USER_ENDPOINT).mock(return_value=Response(200, json=mock_auth))
+    await GitHubPortal.authenticate("mock_token")
+
+    mock_repos = read_json(JSONDIR / "org_repos.json")
+    route = mock_requests.get("/orgs/LEGO/repos").mock(
+        side_effect=[
+            Response(200, json=mock_repos),
+            Response(200, json=mock_repos[:2]),
+        ]
+    )
+
+    repos = [
+        repo
+        async for repo in GitHubRepositoryPortal.paginate(
+            GitHubRepositoryPortal.get_organization_repos, "LEGO", per_page=5
+        )
+    ]
+    assert len(repos) == 7, f"Expected 7 repositories over two pages, got {len(repos)}"
+    assert all(isinstance(repo, MinimalRepository) for repo in repos)
+    assert route.call_count == 2, "Pagination should stop at the first short page."
+    assert route.calls[1].request.url.params["page"] == "2"
+
+
+@no_type_check
+@mark.asyncio
+async def test_pipeline_fan_out_and_stats() -> None:
+    async def source() -> AsyncIterator[int]:
+        for i in range(10):
+            yield i
+
+    async def explode(item: int) -> AsyncIterator[int]:
+        for j in range(3):
+            yield item * 10 + j
+
+    async def drop_odd(item: int) -> Any:
+        await asyncio.sleep(0)
+        return item if item % 2 == 0 else None
+
+    pipeline = (
+        Pipeline(source(), buffer=2)
+        .stage("explode", explode, concurrency=2)
+        .stage("filter", drop_odd, concurrency=3)
+    )
+    results = sorted([item async for item in pipeline])
+
+    expected = sorted(i * 10 + j for i in range(10) for j in range(3) if j % 2 == 0)
+    assert results == expected
+    assert pipeline.stats["explode"].processed == 10
+    assert pipeline.stats["explode"].emitted == 30
+    assert pipeline.stats["filter"].processed == 30
+    assert pipeline.stats["filter"].emitted == len(expected)
+    assert pipeline.stats["filter"].throughput > 0
+
+
+@no_type_check
+@mark.asyncio
+async def test_pipeline_backpressure_bounds_source() -> None:
+    produced = 0
+
+    async def source() -> AsyncIterator[int]:
+        nonlocal produced
+        for i in range(1000):
+            produced += 1
+            yield i
+
+    release = asyncio.Event()
+
+    async def slow(item: int) -> int:
+        await release.wait()
+        return item
+
+    pipeline = Pipeline(source(), buffer=4).stage("slow", slow, concurrency=1)
+    iterator = pipeline.__aiter__()
+    first = asyncio.create_task(iterator.__anext__())
+    await asyncio.sleep(0.05)
+
+    assert produced <= 6, f"Source ran ahead of a stalled stage: {produced} items"
+
+    release.set()
+    assert await first == 0
+    await iterator.aclose()
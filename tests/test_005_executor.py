@@ -0,0 +1,73 @@
+from asyncio import sleep
+from os import cpu_count, getpid
+from time import time
+from typing import no_type_check
+
+from asyncPyGithub import GitHubPortal
+from asyncPyGithub.executor import CrawlExecutor
+from asyncPyGithub.scheduling import QuotaBroker
+
+
+async def spend_quota(item: int) -> int:
+    assert GitHubPortal._quota is not None, "Workers should share the broker."
+    await GitHubPortal._quota.acquire()
+    return item * 2
+
+
+async def slow_pid(item: int) -> int:
+    await sleep(0.3)
+    return getpid()
+
+
+async def explode(item: int) -> int:
+    raise ValueError(f"bad item {item}")
+
+
+@no_type_check
+def test_executor_shares_one_budget() -> None:
+    broker = QuotaBroker()
+    broker.observe(
+        {
+            "x-ratelimit-limit": "5000",
+            "x-ratelimit-remaining": "50",
+            "x-ratelimit-reset": str(int(time()) + 3600),
+        }
+    )
+
+    with CrawlExecutor(
+        spend_quota, processes=2, concurrency=3, broker=broker
+    ) as executor:
+        results = dict(executor.map(range(12)))
+
+    assert results == {i: i * 2 for i in range(12)}
+    assert broker.remaining == 38, f"Expected 12 units spent, got {broker.remaining}"
+
+
+@no_type_check
+def test_executor_reports_task_errors() -> None:
+    with CrawlExecutor(explode, processes=1, concurrency=1) as executor:
+        results = dict(executor.map([1, 2]))
+
+    assert set(results) == {1, 2}
+    assert all(result.code == 500 for result in results.values())
+    assert "bad item 1" in results[1].message
+
+
+@no_type_check
+def test_executor_outnumbers_thread_pool() -> None:
+    # More consumers than the default thread pool has threads must not starve it.
+    concurrency = min(32, (cpu_count() or 1) + 4) + 4
+    with CrawlExecutor(spend_quota, processes=1, concurrency=concurrency) as executor:
+        results = dict(executor.map(range(3)))
+
+    assert results == {0: 0, 1: 2, 2: 4}
+
+
+@no_type_check
+def test_executor_leaves_work_for_idle_workers() -> None:
+    with CrawlExecutor(slow_pid, processes=2, concurrency=1) as executor:
+        # Let both workers start, so neither can be first to the whole queue.
+        list(executor.map([0]))
+        pids = [pid for _, pid in executor.map(range(6))]
+
+    assert len(set(pids)) == 2, f"Idle workers should share the queue: {pids}"
@@ -0,0 +1,101 @@
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, no_type_check
+
+import respx
+from httpx import Response
+from pytest import mark
+
+from asyncPyGithub import (
+    GitHubPortal,
+    GitHubRepositoryPortal,
+    MinimalRepository,
+    read_json,
+)
+
+JSONDIR = Path(__file__).parent.resolve() / "traffic"
+USER_ENDPOINT = "/user"
+
+
+class CountingExecutor(ThreadPoolExecutor):
+    submitted = 0
+
+    def submit(self, fn: Callable[..., Any], /, *args: Any, **kwargs: Any) -> Any:
+        CountingExecutor.submitted += 1
+        return super().submit(fn, *args, **kwargs)
+
+
+@no_type_check
+async def _org_repos(mock_requests: respx.MockRouter) -> tuple[int, Any, Any]:
+    mock_auth = read_json(JSONDIR / "authenticate.json")
+    mock_requests.get(USER_ENDPOINT).mock(return_value=Response(200, json=mock_auth))
+    await GitHubPortal.authenticate("mock_token")
+
+    mock_repos = read_json(JSONDIR / "org_repos.json")
+    mock_requests.get("/orgs/LEGO/repos").mock(
+        return_value=Response(200, json=mock_repos)
+    )
+    status, repos = await GitHubRepositoryPortal.get_organization_repos("LEGO")
+    return status, repos, mock_repos
+
+
+@no_type_check
+@mark.asyncio
+async def test_offload_only_above_threshold(mock_requests: respx.MockRouter) -> None:
+    CountingExecutor.submitted = 0
+    executor = CountingExecutor(max_workers=1)
+    try:
+        GitHubPortal.offload_validation(threshold=10 * 1024 * 1024, executor=executor)
+        status, repos, _ = await _org_repos(mock_requests)
+        assert status == 200
+        assert CountingExecutor.submitted == 0, "Small bodies should stay on the loop."
+
+        GitHubPortal.offload_validation(threshold=1, executor=executor)
+        status, repos, mock_repos = await _org_repos(mock_requests)
+        assert status == 200
+        assert CountingExecutor.submitted > 0, "Large bodies should be offloaded."
+        assert [repo.model_dump(mode="json") for repo in repos] == mock_repos
+    finally:
+        GitHubPortal.offload_validation(None)
+        executor.shutdown()
+
+
+@no_type_check
+@mark.asyncio
+async def test_offload_to_process_pool(mock_requests: respx.MockRouter) -> None:
+    try:
+        GitHubPortal.offload_validation(threshold=1)
+        status, repos, mock_repos = await _org_repos(mock_requests)
+    finally:
+        GitHubPortal.offload_validation(None)
+
+    assert status == 200, f"Process pool validation failed::{repos}"
+    assert all(isinstance(repo, MinimalRepository) for repo in repos)
+    assert [repo.model_dump(mode="json") for repo in repos] == mock_repos
+
+
+@no_type_check
+@mark.asyncio
+async def test_offload_projection_to_process_pool(
+    mock_requests: respx.MockRouter,
+) -> None:
+    GitHubPortal.use_token("mock_token")
+    mock_repos = read_json(JSONDIR / "org_repos.json")
+    mock_requests.get("/orgs/LEGO/repos").mock(
+        return_value=Response(200, json=mock_repos)
+    )
+
+    fields = ("id", "full_name")
+    try:
+        GitHubPortal.offload_validation(threshold=1)
+        status, repos = await GitHubRepositoryPortal.get_organization_repos(
+            "LEGO", fields=fields
+        )
+    finally:
+        GitHubPortal.offload_validation(None)
+
+    assert status == 200, f"Process pool projection failed::{repos}"
+    assert all(tuple(type(repo).model_fields) == fields for repo in repos)
+    assert [repo.model_dump() for repo in repos] == [
+        {name: repo[name] for name in fields} for repo in mock_repos
+    ]
@@ -0,0 +1,87 @@
+import asyncio
+from typing import Any, no_type_check
+
+import httpcore
+import httpx
+import respx
+from httpx import Response
+from pytest import MonkeyPatch, mark
+
+from asyncPyGithub import GitHubPortal
+from asyncPyGithub.transport import CachingResolver, build_transport
+
+
+class RecordingBackend(httpcore.AsyncNetworkBackend):
+    def __init__(self, refuse: set[str] | None = None) -> None:
+        self.connected: list[str] = []
+        self.refuse = refuse or set()
+
+    async def connect_tcp(self, host: str, port: int, *args: Any) -> Any:
+        self.connected.append(host)
+        if host in self.refuse:
+            raise httpcore.ConnectError(f"refused {host}")
+        return object()
+
+
+@no_type_check
+@mark.asyncio
+async def test_warm_up_opens_pool(mock_requests: respx.MockRouter) -> None:
+    route = mock_requests.get("/rate_limit").mock(
+        return_value=Response(200, json={"resources": {}})
+    )
+    status, elapsed = await GitHubPortal.warm_up(connections=4)
+
+    assert status == 200, f"Warm up failed::{elapsed}"
+    assert isinstance(elapsed, float) and elapsed >= 0
+    assert route.call_count == 4
+    assert GitHubPortal._client is not None, "Warm up should start the client."
+
+
+@no_type_check
+@mark.asyncio
+async def test_resolver_caches_lookups(monkeypatch: MonkeyPatch) -> None:
+    lookups = 0
+
+    async def fake_getaddrinfo(host: str, port: int, **_: Any) -> list[Any]:
+        nonlocal lookups
+        lookups += 1
+        return [(2, 1, 6, "", ("192.0.2.1", port)), (2, 1, 6, "", ("192.0.2.2", port))]
+
+    loop = asyncio.get_running_loop()
+    monkeypatch.setattr(loop, "getaddrinfo", fake_getaddrinfo)
+
+    backend = RecordingBackend(refuse={"192.0.2.1"})
+    resolver = CachingResolver(ttl=60, backend=backend)
+    for _ in range(3):
+        await resolver.connect_tcp("api.github.com", 443)
+
+    assert lookups == 1, "Host should be resolved once per TTL."
+    assert (
+        backend.connected.count("192.0.2.2") == 3
+    ), "Should fall over to next address."
+
+    backend.refuse.add("192.0.2.2")
+    try:
+        await resolver.connect_tcp("api.github.com", 443)
+    except httpcore.ConnectError:
+        pass
+    await resolver.resolve("api.github.com", 443)
+    assert lookups == 2, "A host that cannot be reached should be looked up again."
+
+
+@no_type_check
+@mark.asyncio
+async def test_transport_connects_through_resolver() -> None:
+    backend = RecordingBackend(refuse={"192.0.2.1"})
+    resolver = CachingResolver(ttl=60, backend=backend)
+    resolver._cache[("api.github.com", 443)] = (["192.0.2.1"], float("inf"))
+    transport = build_transport(httpx.Limits(max_connections=1), False, resolver)
+
+    async with httpx.AsyncClient(transport=transport) as client:
+        try:
+            await client.get("https://api.github.com/rate_limit")
+        except httpx.ConnectError:
+            pass
+        else:
+            raise AssertionError("httpcore errors should surface as httpx errors.")
+    assert backend.connected == ["192.0.2.1"], "Connections should use the resolver."
@@ -0,0 +1,54 @@
+import json
+import subprocess
+import sys
+from pathlib import Path
+from typing import Any, Final, cast
+
+IMPORT_BUDGET: Final[float] = 0.05
+"""
+Seconds `import asyncPyGithub` may take in a fresh interpreter.
+"""
+
+PROBE: Final[
+    str
+] = """
+import json, sys, time
+started = time.perf_counter()
+import asyncPyGithub
+elapsed = time.perf_counter() - started
+heavy = sorted(m for m in ("httpx", "httpcore", "pydantic", "dotenv") if m in sys.modules)
+print(json.dumps({"elapsed": elapsed, "heavy": heavy}))
+"""
+
+
+def _probe(tmp_path: Path, code: str) -> dict[str, Any]:
+    env = {"ASYNCPYGITHUB_CACHE_DIR": str(tmp_path / "cache"), "PYTHONPATH": "."}
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=Path(__file__).parent.parent,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return cast(dict[str, Any], json.loads(result.stdout.strip().splitlines()[-1]))
+
+
+def test_import_is_lazy_and_side_effect_free(tmp_path: Path) -> None:
+    report = _probe(tmp_path, PROBE)
+
+    assert report["heavy"] == [], f"Package import pulled in {report['heavy']}"
+    assert not (tmp_path / "cache").exists(), "Import should not create the cache dir."
+    assert (
+        report["elapsed"] < IMPORT_BUDGET
+    ), f"Import took {report['elapsed']}s, budget is {IMPORT_BUDGET}s"
+
+
+def test_lazy_attribute_access(tmp_path: Path) -> None:
+    report = _probe(
+        tmp_path,
+        "import json, asyncPyGithub\n"
+        "portal = asyncPyGithub.GitHubUserPortal\n"
+        "print(json.dumps({'name': portal.__name__, 'all': sorted(asyncPyGithub.__all__) == sorted(n for n in asyncPyGithub.__all__ if hasattr(asyncPyGithub, n))}))",
+    )
+    assert report == {"name": "GitHubUserPortal", "all": True}
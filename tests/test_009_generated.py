@@ -0,0 +1,110 @@
+from json import dumps
+from pathlib import Path
+from time import perf_counter
+from typing import Any, Callable, no_type_check
+
+from pytest import importorskip
+
+from asyncPyGithub import MinimalRepository, read_json
+from asyncPyGithub._types import (
+    ContentNode,
+    ContentTree,
+    ContentTreeRecord,
+    FullRepositoryRecord,
+)
+from asyncPyGithub._types.base import validate_json
+
+JSONDIR = Path(__file__).parent.resolve() / "traffic"
+GENERATED = (
+    Path(__file__).parent.parent.resolve() / "asyncPyGithub" / "_types" / "generated.py"
+)
+
+
+def best_of(runs: int, fn: Callable[[], Any]) -> float:
+    timings = []
+    for _ in range(runs):
+        started = perf_counter()
+        fn()
+        timings.append(perf_counter() - started)
+    return min(timings)
+
+
+def test_generated_module_is_current() -> None:
+    importorskip("black")
+    from asyncPyGithub._types.codegen import generate
+
+    assert generate() == GENERATED.read_text(
+        encoding="utf-8"
+    ), "generated.py is stale, run `python -m asyncPyGithub._types.codegen`."
+
+
+@no_type_check
+def test_records_match_models() -> None:
+    body = dumps(read_json(JSONDIR / "org_repos.json")).encode()
+    records = FullRepositoryRecord.decode_many(body)
+    models = validate_json(list[MinimalRepository], body)
+
+    assert len(records) == len(models), "Expected one record per repository."
+    for record, model in zip(records, models):
+        assert record.id == model.id, "Record and model ids differ."
+        assert record.full_name == model.full_name, "Record and model names differ."
+        assert record.owner.login == model.owner.login, "Nested owner not decoded."
+        assert record.created_at == model.created_at, "Timestamps not converted."
+        assert record.topics == model.topics, "Topics differ."
+        assert (
+            record.permissions.admin == model.permissions.admin
+        ), "Permissions differ."
+        assert record.model(MinimalRepository) == model, "model() did not validate."
+        assert "license" not in vars(record), "Unread fields should stay unparsed."
+
+
+@no_type_check
+def test_content_links_are_populated() -> None:
+    node = {
+        "type": "file",
+        "size": 12,
+        "name": "README.md",
+        "path": "README.md",
+        "sha": "3d21ec53a331a6f037a91c368710b99387d012c1",
+        "url": "https://api.github.com/repos/o/r/contents/README.md",
+        "git_url": "https://api.github.com/repos/o/r/git/blobs/3d21ec5",
+        "html_url": "https://github.com/o/r/blob/main/README.md",
+        "download_url": "https://raw.githubusercontent.com/o/r/main/README.md",
+        "_links": {
+            "git": "https://api.github.com/repos/o/r/git/blobs/3d21ec5",
+            "html": "https://github.com/o/r/blob/main/README.md",
+            "self": "https://api.github.com/repos/o/r/contents/README.md",
+        },
+    }
+    body = dumps({**node, "entries": [node]}).encode()
+
+    tree = validate_json(ContentTree, body)
+    assert str(tree.links.self) == node["_links"]["self"], "_links was not parsed."
+    assert tree.entries[0].links.html is not None, "Entry _links was not parsed."
+
+    record = ContentTreeRecord.decode(body)
+    assert record.links.self == node["_links"]["self"], "Record _links not decoded."
+    assert record.entries[0].name == "README.md", "Record entries not decoded."
+
+    for file in (node, {**node, "content": "IyBMRUdPCg==", "encoding": "base64"}):
+        parsed = validate_json(ContentTree | ContentNode, dumps(file).encode())
+        assert type(parsed) is ContentNode, "A file must not parse as an empty tree."
+
+
+@no_type_check
+def test_records_are_faster_for_partial_reads() -> None:
+    body = dumps(read_json(JSONDIR / "org_repos.json") * 200).encode()
+    validate_json(list[MinimalRepository], body)
+
+    def full() -> None:
+        for repo in validate_json(list[MinimalRepository], body):
+            (repo.full_name, repo.stargazers_count, repo.owner.login)
+
+    def lazy() -> None:
+        for repo in FullRepositoryRecord.decode_many(body):
+            (repo.full_name, repo.stargazers_count, repo.owner.login)
+
+    model_time, record_time = best_of(3, full), best_of(3, lazy)
+    assert (
+        record_time < model_time
+    ), f"Lazy records ({record_time:.4f}s) should beat full validation ({model_time:.4f}s)."
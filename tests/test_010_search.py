@@ -0,0 +1,133 @@
+from pathlib import Path
+from time import monotonic, time
+from typing import no_type_check
+
+import respx
+from httpx import Request, Response
+from pytest import mark
+
+from asyncPyGithub import (
+    GitHubPortal,
+    GitHubSearchPortal,
+    MinimalRepository,
+    read_json,
+)
+from asyncPyGithub.scheduling import RateLimitState
+
+JSONDIR = Path(__file__).parent.resolve() / "traffic"
+
+# Matches per star range for "topic:lego"; the open range is over the cap.
+RANGES = {"0..*": 1500, "0..1000": 150, "1001..*": 40}
+
+
+def search_page(request: Request) -> Response:
+    query = request.url.params["q"]
+    page = int(request.url.params["page"])
+    per_page = int(request.url.params["per_page"])
+    stars = query.rpartition("stars:")[2]
+    total = RANGES[stars]
+
+    items = [{"html_url": f"https://github.com/lego/{stars}-{n}"} for n in range(total)]
+    if stars == "1001..*":
+        # A repository that moved between ranges while paging.
+        items[0] = {"html_url": "https://github.com/lego/0..1000-0"}
+    return Response(
+        200,
+        json={
+            "total_count": total,
+            "incomplete_results": False,
+            "items": items[(page - 1) * per_page : page * per_page],
+        },
+        headers={"x-ratelimit-resource": "search"},
+    )
+
+
+@no_type_check
+@mark.asyncio
+async def test_search_repositories_streams_models(
+    mock_requests: respx.MockRouter,
+) -> None:
+    GitHubPortal.use_token("mock_token")
+    mock_repos = read_json(JSONDIR / "org_repos.json")
+    route = mock_requests.get("/search/repositories").mock(
+        return_value=Response(
+            200,
+            json={
+                "total_count": len(mock_repos),
+                "incomplete_results": False,
+                "items": mock_repos,
+            },
+        )
+    )
+
+    repos = [
+        repo
+        async for repo in GitHubSearchPortal.search_repositories(
+            "org:LEGO", sort="stars"
+        )
+    ]
+    assert len(repos) == len(mock_repos), "Expected every search result."
+    assert all(
+        isinstance(repo, MinimalRepository) for repo in repos
+    ), "Expected MinimalRepository instances."
+    assert route.call_count == 1, "A short first page should end the search."
+    params = route.calls.last.request.url.params
+    assert params["q"] == "org:LEGO" and params["sort"] == "stars", "Bad query."
+
+
+@no_type_check
+@mark.asyncio
+async def test_search_splits_past_the_cap(mock_requests: respx.MockRouter) -> None:
+    GitHubPortal.use_token("mock_token")
+    route = mock_requests.get("/search/repositories").mock(side_effect=search_page)
+
+    urls = [
+        repo["html_url"]
+        async for repo in GitHubSearchPortal.search_repositories(
+            "topic:lego", split="stars", mode="dict"
+        )
+    ]
+    assert len(urls) == 150 + 40 - 1, "Expected every match once, across ranges."
+    assert len(set(urls)) == len(urls), "Duplicates should be dropped."
+    queries = [call.request.url.params["q"] for call in route.calls]
+    assert queries == [
+        "topic:lego stars:0..*",
+        "topic:lego stars:0..1000",
+        "topic:lego stars:0..1000",
+        "topic:lego stars:1001..*",
+    ], f"Unexpected query sequence {queries}"
+
+
+@no_type_check
+@mark.asyncio
+async def test_search_waits_for_its_own_bucket(
+    mock_requests: respx.MockRouter,
+) -> None:
+    GitHubPortal.use_token("mock_token")
+    mock_requests.get("/search/users").mock(
+        return_value=Response(
+            200, json={"total_count": 0, "incomplete_results": False, "items": []}
+        )
+    )
+    mock_requests.get("/rate_limit").mock(return_value=Response(200, json={}))
+    GitHubPortal._scheduler.rate_limits["search"] = RateLimitState(
+        limit=30, remaining=0, reset=time() + 0.3
+    )
+
+    started = monotonic()
+    await GitHubPortal.req("GET", "/rate_limit")
+    assert monotonic() - started < 0.2, "Core requests should not wait on search."
+
+    users = [user async for user in GitHubSearchPortal.search_users("lund")]
+    assert users == [], "Expected no results."
+    assert monotonic() - started >= 0.25, "Search should wait for its bucket reset."
+
+
+@no_type_check
+@mark.asyncio
+async def test_search_requires_authentication(
+    mock_requests: respx.MockRouter,
+) -> None:
+    results = [item async for item in GitHubSearchPortal.search_code("GitHubPortal")]
+    assert results == [], "Unauthenticated searches should yield nothing."
+    assert not mock_requests.calls, "No request should be sent without a token."
@@ -0,0 +1,148 @@
+import io
+import tarfile
+from collections.abc import AsyncIterator
+from pathlib import Path
+from random import Random
+from typing import no_type_check
+
+import respx
+from httpx import AsyncByteStream, ReadError, Request, Response
+from pytest import MonkeyPatch, mark
+
+from asyncPyGithub import GitHubPortal, GitHubRepositoryPortal
+
+SHA = "6dcb09b5b57875f334f61aebed695e2e4193db5e"
+CODELOAD = f"https://codeload.github.com/LEGO/lego/legacy.tar.gz/{SHA}"
+
+
+def tarball(
+    files: dict[str, bytes],
+    prefix: str = f"LEGO-lego-{SHA[:7]}/",
+    links: dict[str, str] | None = None,
+) -> bytes:
+    body = io.BytesIO()
+    with tarfile.open(fileobj=body, mode="w:gz") as archive:
+        for name, target in (links or {}).items():
+            info = tarfile.TarInfo(f"{prefix}{name}")
+            info.type, info.linkname = tarfile.SYMTYPE, target
+            archive.addfile(info)
+        for name, data in files.items():
+            info = tarfile.TarInfo(f"{prefix}{name}")
+            info.size = len(data)
+            archive.addfile(info, io.BytesIO(data))
+    return body.getvalue()
+
+
+class Interrupted(AsyncByteStream):
+    """
+    A body that drops the connection after the first `cut` bytes.
+    """
+
+    def __init__(self, body: bytes, cut: int) -> None:
+        self.body, self.cut = body, cut
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        yield self.body[: self.cut]
+        raise ReadError("connection reset")
+
+
+@no_type_check
+@mark.asyncio
+async def test_download_archive_extracts_while_streaming(
+    mock_requests: respx.MockRouter, tmp_path: Path
+) -> None:
+    GitHubPortal.use_token("mock_token")
+    files = {"README.md": b"# LEGO\n", "src/brick.py": b"STUDS = 8\n" * 50_000}
+    mock_requests.get(f"/repos/LEGO/lego/tarball/{SHA}").mock(
+        return_value=Response(302, headers={"location": CODELOAD})
+    )
+    mock_requests.get(CODELOAD).mock(return_value=Response(200, content=tarball(files)))
+
+    status, result = await GitHubRepositoryPortal.download_archive(
+        "LEGO", "lego", SHA, tmp_path / "lego", extract=True, chunk_size=1024, buffer=2
+    )
+    assert status == 200, f"Expected status 200, got {status}: {result}"
+    root = tmp_path / "lego" / f"LEGO-lego-{SHA[:7]}"
+    for name, data in files.items():
+        assert (root / name).read_bytes() == data, f"{name} was not extracted intact."
+
+
+@no_type_check
+@mark.asyncio
+@mark.parametrize("filters", [True, False])
+async def test_extract_skips_unsafe_members(
+    mock_requests: respx.MockRouter,
+    tmp_path: Path,
+    monkeypatch: MonkeyPatch,
+    filters: bool,
+) -> None:
+    if not filters:
+        # Python before 3.11.4 has no tarfile.data_filter.
+        monkeypatch.delattr(tarfile, "data_filter")
+    GitHubPortal.use_token("mock_token")
+    body = tarball(
+        {"lego/README.md": b"# LEGO\n", "../escaped.txt": b"nope"},
+        "",
+        links={"lego/passwd": "/etc/passwd", "lego/up": "../.."},
+    )
+    mock_requests.get(f"/repos/LEGO/lego/tarball/{SHA}").mock(
+        return_value=Response(200, content=body)
+    )
+
+    status, result = await GitHubRepositoryPortal.download_archive(
+        "LEGO", "lego", SHA, tmp_path / "out", extract=True
+    )
+    assert status == 200, f"Expected status 200, got {status}: {result}"
+    assert (tmp_path / "out" / "lego" / "README.md").read_bytes() == b"# LEGO\n"
+    assert not (tmp_path / "escaped.txt").exists(), "Members must stay inside."
+    for link in ("passwd", "up"):
+        assert not (tmp_path / "out" / "lego" / link).is_symlink(), "Links must too."
+
+
+@no_type_check
+@mark.asyncio
+async def test_download_archive_resumes_interrupted_download(
+    mock_requests: respx.MockRouter, tmp_path: Path
+) -> None:
+    GitHubPortal.use_token("mock_token")
+    body = tarball({"data.bin": Random(0).randbytes(200_000)})
+    cut = 40 * 4096
+
+    def codeload(request: Request) -> Response:
+        if "range" not in request.headers:
+            return Response(200, stream=Interrupted(body, cut))
+        start = int(request.headers["range"].removeprefix("bytes=").rstrip("-"))
+        return Response(206, content=body[start:])
+
+    mock_requests.get(f"/repos/LEGO/lego/tarball/{SHA}").mock(
+        return_value=Response(302, headers={"location": CODELOAD})
+    )
+    route = mock_requests.get(CODELOAD).mock(side_effect=codeload)
+
+    destination = tmp_path / "lego.tar.gz"
+    status, result = await GitHubRepositoryPortal.download_archive(
+        "LEGO", "lego", SHA, destination, chunk_size=4096
+    )
+    assert status == 200, f"Expected status 200, got {status}: {result}"
+    assert result == destination, "Expected the archive path."
+    assert destination.read_bytes() == body, "Resumed archive is corrupt."
+    assert not destination.with_name("lego.tar.gz.part").exists(), "Part file left."
+    assert route.calls.last.request.headers["range"] == f"bytes={cut}-", "Bad range."
+
+
+@no_type_check
+@mark.asyncio
+async def test_download_archive_reports_missing_repository(
+    mock_requests: respx.MockRouter, tmp_path: Path
+) -> None:
+    GitHubPortal.use_token("mock_token")
+    mock_requests.get("/repos/LEGO/missing/zipball").mock(
+        return_value=Response(404, json={"message": "Not Found"})
+    )
+
+    status, result = await GitHubRepositoryPortal.download_archive(
+        "LEGO", "missing", "", tmp_path / "missing.zip", format="zipball"
+    )
+    assert status == 404, f"Expected status 404, got {status}"
+    assert result.message == "Not Found", "Expected the API error message."
+    assert not list(tmp_path.iterdir()), "Nothing should be written on error."
@@ -0,0 +1,265 @@
+import json
+from base64 import b64decode
+from hashlib import sha1
+from typing import no_type_check
+
+import respx
+from httpx import Request, Response
+from pytest import mark
+
+from asyncPyGithub import (
+    ErrorMessage,
+    GitHubPortal,
+    GitHubRepositoryPortal,
+    ResponseCache,
+)
+from asyncPyGithub._types import GitCommit
+
+GIT = "/repos/LEGO/config/git"
+ACTOR = {"name": "bot", "email": "bot@lego.com", "date": "2024-01-01T00:00:00Z"}
+
+
+def commit_json(sha: str, tree: str, parent: str) -> dict[str, object]:
+    return {
+        "sha": sha,
+        "node_id": f"C_{sha}",
+        "url": f"https://api.github.com{GIT}/commits/{sha}",
+        "html_url": f"https://github.com/LEGO/config/commit/{sha}",
+        "author": ACTOR,
+        "committer": ACTOR,
+        "message": "Push config",
+        "tree": {"sha": tree, "url": f"https://api.github.com{GIT}/trees/{tree}"},
+        "parents": [
+            {
+                "sha": parent,
+                "url": f"https://api.github.com{GIT}/commits/{parent}",
+                "html_url": f"https://github.com/LEGO/config/commit/{parent}",
+            }
+        ],
+    }
+
+
+def tree_json(sha: str, entries: dict[str, str]) -> dict[str, object]:
+    return {
+        "sha": sha,
+        "url": f"https://api.github.com{GIT}/trees/{sha}",
+        "tree": [
+            {
+                "path": path,
+                "mode": mode,
+                "type": "tree" if mode == "040000" else "blob",
+                "sha": f"{sha}_{path}",
+            }
+            for path, mode in entries.items()
+        ],
+        "truncated": False,
+    }
+
+
+def create_blob(request: Request) -> Response:
+    data = b64decode(json.loads(request.content)["content"])
+    sha = sha1(b"blob %d\0" % len(data) + data).hexdigest()
+    return Response(201, json={"sha": sha, "url": f"https://api.github.com/{sha}"})
+
+
+@no_type_check
+@mark.asyncio
+async def test_commit_files_builds_one_commit(mock_requests: respx.MockRouter) -> None:
+    GitHubPortal.use_token("mock_token")
+    files = {
+        "teams/a.yml": b"members: 8\n",
+        "teams/b.yml": b"members: 8\n",
+        "teams/c.yml": b"members: 2\n",
+        "teams/old.yml": None,
+    }
+    blobs = mock_requests.post(f"{GIT}/blobs").mock(side_effect=create_blob)
+    mock_requests.get(f"{GIT}/ref/heads/main").mock(
+        return_value=Response(200, json={"object": {"sha": "head1"}})
+    )
+    mock_requests.get(f"{GIT}/commits/head1").mock(
+        return_value=Response(200, json=commit_json("head1", "tree1", "head0"))
+    )
+    mock_requests.get(f"{GIT}/trees/tree1").mock(
+        return_value=Response(
+            200, json=tree_json("tree1", {"README.md": "100644", "teams": "040000"})
+        )
+    )
+    mock_requests.get(f"{GIT}/trees/tree1_teams").mock(
+        return_value=Response(
+            200, json=tree_json("tree1_teams", {"a.yml": "100644", "old.yml": "100644"})
+        )
+    )
+    trees = mock_requests.post(f"{GIT}/trees").mock(
+        return_value=Response(201, json={"sha": "tree2"})
+    )
+    commits = mock_requests.post(f"{GIT}/commits").mock(
+        return_value=Response(201, json=commit_json("head2", "tree2", "head1"))
+    )
+    ref = mock_requests.patch(f"{GIT}/refs/heads/main").mock(
+        return_value=Response(200, json={"object": {"sha": "head2"}})
+    )
+
+    status, commit = await GitHubRepositoryPortal.commit_files(
+        "LEGO", "config", "main", files, "Push config"
+    )
+    assert status == 201, f"Expected status 201, got {status}: {commit}"
+    assert isinstance(commit, GitCommit), "Expected a GitCommit instance."
+    assert commit.sha == "head2", "Expected the new commit."
+
+    assert blobs.call_count == 2, "Identical contents should be uploaded once."
+    tree = json.loads(trees.calls.last.request.content)
+    assert tree["base_tree"] == "tree1", "Tree should build on the head's tree."
+    entries = {entry["path"]: entry["sha"] for entry in tree["tree"]}
+    assert entries["teams/a.yml"] == entries["teams/b.yml"], "Shared blob expected."
+    assert entries["teams/old.yml"] is None, "Deleted paths need a null sha."
+    assert json.loads(commits.calls.last.request.content)["parents"] == ["head1"]
+    assert json.loads(ref.calls.last.request.content) == {
+        "sha": "head2",
+        "force": False,
+    }, "Ref should fast-forward to the new commit."
+
+
+@no_type_check
+@mark.asyncio
+async def test_commit_files_rebuilds_when_branch_moves(
+    mock_requests: respx.MockRouter,
+) -> None:
+    GitHubPortal.use_token("mock_token")
+    blobs = mock_requests.post(f"{GIT}/blobs").mock(side_effect=create_blob)
+    mock_requests.get(f"{GIT}/ref/heads/main").mock(
+        side_effect=[
+            Response(200, json={"object": {"sha": "head1"}}),
+            Response(200, json={"object": {"sha": "head9"}}),
+        ]
+    )
+    for head in ("head1", "head9"):
+        mock_requests.get(f"{GIT}/commits/{head}").mock(
+            return_value=Response(200, json=commit_json(head, f"t_{head}", "head0"))
+        )
+        mock_requests.get(f"{GIT}/trees/t_{head}").mock(
+            return_value=Response(200, json=tree_json(f"t_{head}", {}))
+        )
+    mock_requests.post(f"{GIT}/trees").mock(
+        return_value=Response(201, json={"sha": "tree2"})
+    )
+    commits = mock_requests.post(f"{GIT}/commits").mock(
+        side_effect=[
+            Response(201, json=commit_json("stale", "tree2", "head1")),
+            Response(201, json=commit_json("head10", "tree2", "head9")),
+        ]
+    )
+    mock_requests.patch(f"{GIT}/refs/heads/main").mock(
+        side_effect=[
+            Response(422, json={"message": "Update is not a fast forward"}),
+            Response(200, json={"object": {"sha": "head10"}}),
+        ]
+    )
+
+    status, commit = await GitHubRepositoryPortal.commit_files(
+        "LEGO", "config", "main", {"a.yml": b"a"}, "Push config", mode="dict"
+    )
+    assert status == 201, f"Expected status 201, got {status}: {commit}"
+    assert commit["sha"] == "head10", "Expected the rebuilt commit."
+    assert blobs.call_count == 1, "Blobs should not be uploaded again."
+    assert json.loads(commits.calls.last.request.content)["parents"] == ["head9"]
+
+
+@no_type_check
+@mark.asyncio
+async def test_commit_files_reads_current_head_with_cache(
+    mock_requests: respx.MockRouter,
+) -> None:
+    GitHubPortal.use_token("mock_token")
+    GitHubPortal.use_cache(ResponseCache(ttl=600))
+    mock_requests.post(f"{GIT}/blobs").mock(side_effect=create_blob)
+    refs = mock_requests.get(f"{GIT}/ref/heads/main").mock(
+        side_effect=[
+            Response(200, json={"object": {"sha": "head1"}}),
+            Response(200, json={"object": {"sha": "head2"}}),
+        ]
+    )
+    for head in ("head1", "head2"):
+        mock_requests.get(f"{GIT}/commits/{head}").mock(
+            return_value=Response(200, json=commit_json(head, f"t_{head}", "head0"))
+        )
+        mock_requests.get(f"{GIT}/trees/t_{head}").mock(
+            return_value=Response(200, json=tree_json(f"t_{head}", {}))
+        )
+    mock_requests.post(f"{GIT}/trees").mock(
+        return_value=Response(201, json={"sha": "tree2"})
+    )
+    commits = mock_requests.post(f"{GIT}/commits").mock(
+        side_effect=[
+            Response(201, json=commit_json("head2", "tree2", "head1")),
+            Response(201, json=commit_json("head3", "tree2", "head2")),
+        ]
+    )
+    mock_requests.patch(f"{GIT}/refs/heads/main").mock(
+        return_value=Response(200, json={"object": {"sha": "head3"}})
+    )
+
+    for name in ("a.yml", "b.yml"):
+        status, commit = await GitHubRepositoryPortal.commit_files(
+            "LEGO", "config", "main", {name: b"a"}, "Push config"
+        )
+        assert status == 201, f"Expected status 201, got {status}: {commit}"
+    assert refs.call_count == 2, "The head should never come from the cache."
+    parents = [json.loads(call.request.content)["parents"] for call in commits.calls]
+    assert parents == [["head1"], ["head2"]], "Each commit should build on the last."
+
+
+@no_type_check
+@mark.asyncio
+async def test_commit_files_keeps_file_modes(mock_requests: respx.MockRouter) -> None:
+    GitHubPortal.use_token("mock_token")
+    mock_requests.post(f"{GIT}/blobs").mock(side_effect=create_blob)
+    mock_requests.get(f"{GIT}/ref/heads/main").mock(
+        return_value=Response(200, json={"object": {"sha": "head1"}})
+    )
+    mock_requests.get(f"{GIT}/commits/head1").mock(
+        return_value=Response(200, json=commit_json("head1", "tree1", "head0"))
+    )
+    mock_requests.get(f"{GIT}/trees/tree1").mock(
+        return_value=Response(
+            200,
+            json=tree_json(
+                "tree1", {"bin": "040000", "docs": "040000", "run": "100644"}
+            ),
+        )
+    )
+    mock_requests.get(f"{GIT}/trees/tree1_bin").mock(
+        return_value=Response(200, json=tree_json("tree1_bin", {"build": "100755"}))
+    )
+    trees = mock_requests.post(f"{GIT}/trees").mock(
+        return_value=Response(201, json={"sha": "tree2"})
+    )
+    mock_requests.post(f"{GIT}/commits").mock(
+        return_value=Response(201, json=commit_json("head2", "tree2", "head1"))
+    )
+    mock_requests.patch(f"{GIT}/refs/heads/main").mock(
+        return_value=Response(200, json={"object": {"sha": "head2"}})
+    )
+
+    files = {"bin/build": b"#!/bin/sh\n", "bin/new": b"#!/bin/sh\n", "run": b"go"}
+    status, commit = await GitHubRepositoryPortal.commit_files(
+        "LEGO", "config", "main", files, "Push config"
+    )
+    assert status == 201, f"Expected status 201, got {status}: {commit}"
+    tree = json.loads(trees.calls.last.request.content)["tree"]
+    assert {entry["path"]: entry["mode"] for entry in tree} == {
+        "bin/build": "100755",
+        "bin/new": "100644",
+        "run": "100644",
+    }, "Existing files should keep their mode, and only their folders be read."
+
+
+@no_type_check
+@mark.asyncio
+async def test_commit_files_rejects_bad_arguments() -> None:
+    GitHubPortal.use_token("mock_token")
+    for files, mode in (({}, "model"), ({"a.yml": b"a"}, "bytes")):
+        status, error = await GitHubRepositoryPortal.commit_files(
+            "LEGO", "config", "main", files, "Push config", mode=mode
+        )
+        assert status == 400, f"Expected status 400, got {status}: {error}"
+        assert isinstance(error, ErrorMessage), "Expected an ErrorMessage."
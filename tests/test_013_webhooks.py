@@ -0,0 +1,152 @@
+from json import dumps
+from pathlib import Path
+from typing import no_type_check
+
+import respx
+from httpx import ASGITransport, AsyncClient, Response
+from pytest import mark
+
+from asyncPyGithub import (
+    GitHubPortal,
+    GitHubRepositoryPortal,
+    ResponseCache,
+    WebhookDispatcher,
+    read_json,
+)
+from asyncPyGithub._types import PushEvent, SimpleUser, Topics
+from asyncPyGithub.cache import cache_key
+from asyncPyGithub.webhooks import parse_event, refresh_caches, sign
+
+JSONDIR = Path(__file__).parent.resolve() / "traffic"
+SECRET = "It's a Secret to Everybody"
+REPO = "/repos/LEGO/assume-aws-sso-role"
+
+
+def delivery(
+    event: str, payload: dict[str, object], secret: str = SECRET
+) -> dict[str, object]:
+    body = dumps(payload).encode()
+    return {
+        "content": body,
+        "headers": {
+            "x-github-event": event,
+            "x-github-delivery": "72d3162e-cc78-11e3-81ab-4c9367dc0958",
+            "x-hub-signature-256": sign(secret, body),
+            "content-type": "application/json",
+        },
+    }
+
+
+@no_type_check
+@mark.asyncio
+async def test_cache_serves_and_revalidates(mock_requests: respx.MockRouter) -> None:
+    GitHubPortal.use_token("mock_token")
+    GitHubPortal.use_cache(ResponseCache(ttl=60))
+    route = mock_requests.get(f"{REPO}/topics").mock(
+        side_effect=[
+            Response(200, json={"names": ["inner-source"]}, headers={"etag": '"v1"'}),
+            Response(304),
+        ]
+    )
+
+    for _ in range(3):
+        status, topics = await GitHubRepositoryPortal.get_repository_topics(
+            "LEGO", "assume-aws-sso-role"
+        )
+        assert status == 200, f"Expected status 200, got {status}"
+        assert topics.names == ["inner-source"], "Unexpected topics."
+    assert route.call_count == 1, "Fresh entries should be served from the cache."
+
+    GitHubPortal.cache().get(
+        cache_key(f"{REPO}/topics"), GitHubPortal._principal
+    ).stored -= 120
+    status, topics = await GitHubRepositoryPortal.get_repository_topics(
+        "LEGO", "assume-aws-sso-role"
+    )
+    assert status == 200 and topics.names == ["inner-source"], "304 not replayed."
+    assert route.call_count == 2, "Stale entries should be revalidated."
+    assert route.calls.last.request.headers["if-none-match"] == '"v1"', "No ETag sent."
+
+
+@no_type_check
+@mark.asyncio
+async def test_push_delivery_invalidates_repository(
+    mock_requests: respx.MockRouter,
+) -> None:
+    GitHubPortal.use_token("mock_token")
+    cache = GitHubPortal.use_cache(ResponseCache(ttl=60))
+    route = mock_requests.get(f"{REPO}/tags").mock(return_value=Response(200, json=[]))
+    await GitHubRepositoryPortal.list_repository_tags("LEGO", "assume-aws-sso-role")
+    assert len(cache) == 1, "Expected the tags to be cached."
+
+    hooks = WebhookDispatcher(SECRET)
+    received = []
+
+    @hooks.on("push")
+    async def pushed(event: PushEvent) -> None:
+        received.append(event)
+
+    payload = read_json(JSONDIR / "webhook_push.json")
+    async with AsyncClient(
+        transport=ASGITransport(app=hooks), base_url="http://hooks.local"
+    ) as client:
+        forged = await client.post("/", **delivery("push", payload, "guess"))
+        assert forged.status_code == 401, "Bad signatures should be rejected."
+        assert len(cache) == 1 and not received, "Rejected deliveries do nothing."
+
+        res = await client.post("/", **delivery("push", payload))
+        assert res.status_code == 204, f"Expected status 204, got {res.status_code}"
+
+    assert len(received) == 1, "Expected the handler to run once."
+    event = received[0]
+    assert isinstance(event, PushEvent), "Expected a PushEvent."
+    assert event.repository.full_name == "LEGO/assume-aws-sso-role", "Bad repository."
+    assert event.commits[0].modified == ["README.md"], "Bad commits."
+    assert isinstance(event.sender, SimpleUser), "Sender should be a SimpleUser."
+    assert len(cache) == 0, "A push should drop the repository's cached responses."
+    assert not len(GitHubPortal._identity_map), "Only session interning keeps users."
+
+    await GitHubRepositoryPortal.list_repository_tags("LEGO", "assume-aws-sso-role")
+    assert route.call_count == 2, "Tags should be fetched again after a push."
+
+
+@no_type_check
+@mark.asyncio
+async def test_repository_edit_updates_topics(mock_requests: respx.MockRouter) -> None:
+    GitHubPortal.use_token("mock_token")
+    GitHubPortal.use_cache(ResponseCache(ttl=60))
+    route = mock_requests.get(f"{REPO}/topics").mock(
+        return_value=Response(200, json={"names": ["inner-source"]})
+    )
+    await GitHubRepositoryPortal.get_repository_topics("LEGO", "assume-aws-sso-role")
+
+    hooks = WebhookDispatcher(SECRET)
+    payload = read_json(JSONDIR / "webhook_repository_edited.json")
+    async with AsyncClient(
+        transport=ASGITransport(app=hooks), base_url="http://hooks.local"
+    ) as client:
+        res = await client.post("/", **delivery("repository", payload))
+        assert res.status_code == 204, f"Expected status 204, got {res.status_code}"
+
+    status, topics = await GitHubRepositoryPortal.get_repository_topics(
+        "LEGO", "assume-aws-sso-role"
+    )
+    assert isinstance(topics, Topics), "Expected a Topics instance."
+    assert topics.names == ["inner-source", "aws", "sso"], "Topics not updated."
+    assert route.call_count == 1, "Updated topics should not need a request."
+
+
+@no_type_check
+def test_refresh_caches_replaces_session_interned_users() -> None:
+    event = parse_event(
+        "push", dumps(read_json(JSONDIR / "webhook_push.json")).encode()
+    )
+    refresh_caches(event, ResponseCache())
+    assert not len(GitHubPortal._identity_map), "Users kept without session interning."
+
+    GitHubPortal.intern_nested("session")
+    refresh_caches(event, ResponseCache())
+    assert (
+        GitHubPortal._identity_map._objects[(SimpleUser, event.sender.id)]
+        is event.sender
+    ), "The sender should replace the interned copy."
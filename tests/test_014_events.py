@@ -0,0 +1,123 @@
+from typing import no_type_check
+
+import respx
+from httpx import Response
+from pytest import mark, raises
+
+from asyncPyGithub import GitHubEventsPortal, GitHubPortal, ResponseCache
+from asyncPyGithub._types import GitHubEvent
+
+
+def event(event_id: int, repo: str) -> dict[str, object]:
+    return {
+        "id": str(event_id),
+        "type": "WatchEvent",
+        "actor": {
+            "id": 583231,
+            "login": "octocat",
+            "display_login": "octocat",
+            "gravatar_id": "",
+            "url": "https://api.github.com/users/octocat",
+            "avatar_url": "https://avatars.githubusercontent.com/u/583231?v=4",
+        },
+        "repo": {"id": 1, "name": repo, "url": f"https://api.github.com/repos/{repo}"},
+        "payload": {"action": "started"},
+        "public": True,
+        "created_at": "2025-01-17T12:37:37Z",
+    }
+
+
+def feed(repo: str, *ids: int, etag: str) -> Response:
+    return Response(
+        200,
+        json=[event(n, repo) for n in ids],
+        headers={"etag": etag, "x-poll-interval": "0"},
+    )
+
+
+@no_type_check
+@mark.asyncio
+async def test_repository_events(mock_requests: respx.MockRouter) -> None:
+    GitHubPortal.use_token("mock_token")
+    route = mock_requests.get("/repos/LEGO/lego/events").mock(
+        return_value=feed("LEGO/lego", 3, 2, 1, etag='"a"')
+    )
+
+    status, events = await GitHubEventsPortal.repository_events("LEGO", "lego")
+    assert status == 200, f"Expected status 200, got {status}"
+    assert [e.id for e in events] == ["3", "2", "1"], "Expected the feed, newest first."
+    assert isinstance(events[0], GitHubEvent), "Expected GitHubEvent instances."
+    assert route.calls.last.request.url.params["per_page"] == "30", "Bad page size."
+
+
+@no_type_check
+@mark.asyncio
+async def test_watch_multiplexes_feeds(mock_requests: respx.MockRouter) -> None:
+    GitHubPortal.use_token("mock_token")
+    lego = mock_requests.get("/repos/LEGO/lego/events").mock(
+        side_effect=[
+            feed("LEGO/lego", 2, 1, etag='"l1"'),
+            # Overlaps the previous poll, the repeated events must be dropped.
+            feed("LEGO/lego", 4, 3, 2, etag='"l2"'),
+        ]
+        + [Response(304, headers={"x-poll-interval": "0"})] * 1000
+    )
+    org = mock_requests.get("/orgs/LEGO/events").mock(
+        side_effect=[
+            feed("LEGO/bricks", 10, etag='"o1"'),
+            feed("LEGO/bricks", 11, 10, etag='"o2"'),
+        ]
+        + [Response(304, headers={"x-poll-interval": "0"})] * 1000
+    )
+
+    seen = []
+    async for item in GitHubEventsPortal.watch(["repos/LEGO/lego", "orgs/LEGO"]):
+        seen.append((item.repo.name, item.id))
+        if len(seen) == 3:
+            break
+
+    assert sorted(seen) == [
+        ("LEGO/bricks", "11"),
+        ("LEGO/lego", "3"),
+        ("LEGO/lego", "4"),
+    ], f"Expected only events after the first poll, once each: {seen}"
+    assert seen.index(("LEGO/lego", "3")) < seen.index(
+        ("LEGO/lego", "4")
+    ), "Events should be yielded oldest first."
+    assert lego.calls[1].request.headers["if-none-match"] == '"l1"', "No ETag sent."
+    assert org.calls[1].request.headers["if-none-match"] == '"o1"', "No ETag sent."
+
+
+@no_type_check
+@mark.asyncio
+async def test_watch_primes_after_first_answer(mock_requests: respx.MockRouter) -> None:
+    GitHubPortal.use_token("mock_token")
+    # The feed tracks its own ETag, so a response cache must not answer for it.
+    GitHubPortal.use_cache(ResponseCache(ttl=600))
+    route = mock_requests.get("/repos/LEGO/lego/events").mock(
+        side_effect=[
+            Response(
+                502, json={"message": "Bad Gateway"}, headers={"x-poll-interval": "0"}
+            ),
+            feed("LEGO/lego", 2, 1, etag='"l1"'),
+            feed("LEGO/lego", 3, 2, 1, etag='"l2"'),
+        ]
+        + [Response(304, headers={"x-poll-interval": "0"})] * 1000
+    )
+
+    async for item in GitHubEventsPortal.watch(["repos/LEGO/lego"]):
+        assert (
+            item.id == "3"
+        ), f"The backlog should not be new after a failure: {item.id}"
+        break
+    assert route.call_count == 3, "Every poll should reach GitHub."
+
+
+@no_type_check
+@mark.asyncio
+async def test_watch_rejects_unknown_feeds(mock_requests: respx.MockRouter) -> None:
+    GitHubPortal.use_token("mock_token")
+    with raises(ValueError):
+        async for _ in GitHubEventsPortal.watch(["LEGO/lego"]):
+            pass
+    assert not mock_requests.calls, "No request should be sent."
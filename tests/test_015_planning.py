@@ -0,0 +1,94 @@
+from collections.abc import Awaitable, Callable
+from time import monotonic, time
+from typing import no_type_check
+
+import respx
+from httpx import Response
+from pytest import mark
+
+from asyncPyGithub import (
+    CostEstimate,
+    GitHubPortal,
+    QuotaPlanner,
+    ResponseCache,
+)
+from asyncPyGithub._types import RateLimitOverview
+from asyncPyGithub.scheduling import RateLimitState
+
+
+def budget(limit: int, remaining: int, reset: float) -> dict[str, object]:
+    return {
+        "limit": limit,
+        "remaining": remaining,
+        "reset": int(reset),
+        "used": limit - remaining,
+    }
+
+
+@no_type_check
+@mark.asyncio
+async def test_rate_limit_updates_scheduler(mock_requests: respx.MockRouter) -> None:
+    GitHubPortal.use_cache(ResponseCache(ttl=60))
+    reset = time() + 1800
+    core, search = budget(5000, 4200, reset), budget(30, 12, reset)
+    route = mock_requests.get("/rate_limit").mock(
+        return_value=Response(
+            200, json={"resources": {"core": core, "search": search}, "rate": core}
+        )
+    )
+
+    for _ in range(2):
+        status, overview = await GitHubPortal.rate_limit()
+        assert status == 200, f"Expected status 200, got {status}"
+        assert isinstance(overview, RateLimitOverview), "Expected the overview model."
+    assert route.call_count == 2, "/rate_limit should never be served from the cache."
+
+    assert overview.resources["search"].remaining == 12, "Bad search budget."
+    states = GitHubPortal._scheduler.rate_limits
+    assert states["core"].remaining == 4200, "Core budget not recorded."
+    assert states["search"].limit == 30, "Search budget not recorded."
+
+
+@no_type_check
+@mark.asyncio
+async def test_forecast_spans_windows(mock_requests: respx.MockRouter) -> None:
+    estimate = (
+        CostEstimate()
+        .add_each("get_organization_repos", {"LEGO": 250, "bricks": 40})
+        .add("list_contributors", calls=290)
+    )
+    assert estimate.steps == {
+        "get_organization_repos": 4,
+        "list_contributors": 290,
+    }, f"Unexpected estimate {estimate.steps}"
+
+    GitHubPortal._scheduler.rate_limits["core"] = RateLimitState(
+        limit=5000, remaining=200, reset=time() + 1000
+    )
+    forecast = await QuotaPlanner(reserve=100).forecast(estimate)
+    assert forecast.budget == 100, "The reserve should come off the budget."
+    assert not forecast.fits and forecast.windows == 2, f"Bad forecast {forecast}"
+    assert abs(forecast.interval - 10.0) < 0.1, "Budget should last until the reset."
+    assert not mock_requests.calls, "A known budget needs no /rate_limit request."
+
+
+@no_type_check
+@mark.asyncio
+async def test_schedule_paces_jobs_evenly() -> None:
+    GitHubPortal._scheduler.rate_limits["core"] = RateLimitState(
+        limit=5000, remaining=10, reset=time() + 1.0
+    )
+    planner = QuotaPlanner()
+    started: list[float] = []
+
+    def job(n: int) -> Callable[[], Awaitable[int]]:
+        async def run() -> int:
+            started.append(monotonic())
+            return n
+
+        return run
+
+    results = await planner.schedule(job(n) for n in range(4))
+    assert results == [0, 1, 2, 3], "Results should keep job order."
+    gaps = [b - a for a, b in zip(started, started[1:])]
+    assert all(0.07 < gap < 0.2 for gap in gaps), f"Jobs not spread evenly: {gaps}"
@@ -0,0 +1,170 @@
+from asyncio import sleep
+from base64 import urlsafe_b64decode
+from datetime import datetime, timedelta, timezone
+from json import loads
+from pathlib import Path
+from typing import no_type_check
+
+import respx
+from cryptography.hazmat.primitives.asymmetric.padding import PKCS1v15
+from cryptography.hazmat.primitives.asymmetric.rsa import generate_private_key
+from cryptography.hazmat.primitives.hashes import SHA256
+from cryptography.hazmat.primitives.serialization import (
+    Encoding,
+    NoEncryption,
+    PrivateFormat,
+)
+from httpx import Request, Response
+from pytest import mark
+
+from asyncPyGithub import (
+    GitHubApp,
+    GitHubPortal,
+    GitHubRepositoryPortal,
+    ImmutableStore,
+    ResponseCache,
+)
+
+KEY = generate_private_key(public_exponent=65537, key_size=2048)
+PEM = KEY.private_bytes(
+    Encoding.PEM, PrivateFormat.TraditionalOpenSSL, NoEncryption()
+).decode()
+STAND_IN = "http://127.0.0.1:8080"
+
+
+def decode(segment: str) -> bytes:
+    return urlsafe_b64decode(segment + "=" * (-len(segment) % 4))
+
+
+def minted(token: str, lifetime: float) -> Response:
+    expires = datetime.now(timezone.utc) + timedelta(seconds=lifetime)
+    return Response(
+        201,
+        json={
+            "token": token,
+            "expires_at": expires.isoformat(timespec="seconds").replace("+00:00", "Z"),
+            "permissions": {"contents": "read"},
+            "repository_selection": "all",
+        },
+    )
+
+
+def test_jwt_is_signed() -> None:
+    jwt = GitHubApp(1234, PEM).jwt()
+    header, claims, signature = jwt.split(".")
+    assert loads(decode(header)) == {"alg": "RS256", "typ": "JWT"}, "Bad JWT header."
+
+    payload = loads(decode(claims))
+    assert payload["iss"] == "1234", "The app ID should be the issuer."
+    assert 0 < payload["exp"] - payload["iat"] <= 600, "JWTs live at most ten minutes."
+
+    KEY.public_key().verify(
+        decode(signature), f"{header}.{claims}".encode(), PKCS1v15(), SHA256()
+    )
+
+
+@no_type_check
+@mark.asyncio
+async def test_installation_tokens_are_cached(mock_requests: respx.MockRouter) -> None:
+    route = mock_requests.post("/app/installations/7/access_tokens").mock(
+        return_value=minted("ghs_seven", 3600)
+    )
+    app = GitHubApp(1234, PEM)
+    try:
+        for _ in range(3):
+            status, token = await app.installation_token(7)
+            assert token.token == "ghs_seven", f"Unexpected token {token}"
+        assert route.call_count == 1, "Tokens should be minted once per installation."
+        sent = route.calls.last.request.headers["authorization"]
+        assert sent == f"Bearer {app.jwt()}", "Minting should send the app JWT."
+    finally:
+        await app.close()
+
+
+@no_type_check
+@mark.asyncio
+async def test_token_is_refreshed_before_expiry() -> None:
+    with respx.mock(base_url=STAND_IN) as stand_in:
+        route = stand_in.post("/app/installations/7/access_tokens").mock(
+            side_effect=[minted("ghs_first", 2), minted("ghs_second", 3600)]
+        )
+        app = GitHubApp(1234, PEM, refresh_margin=600, endpoint=STAND_IN)
+        try:
+            status, token = await app.authenticate(7)
+            assert status == 201, f"Expected status 201, got {status}"
+            assert GitHubPortal._authenticated, "The portal should be authenticated."
+            assert GitHubPortal._headers["Authorization"] == "Bearer ghs_first"
+
+            for _ in range(40):
+                if route.call_count == 2:
+                    break
+                await sleep(0.05)
+            assert route.call_count == 2, "The token should be replaced before expiry."
+            assert GitHubPortal._headers["Authorization"] == "Bearer ghs_second"
+
+            status, token = await app.installation_token(7)
+            assert token.token == "ghs_second", "The refreshed token should be cached."
+            assert route.call_count == 2, "A fresh token needs no exchange."
+        finally:
+            await app.close()
+
+
+@no_type_check
+@mark.asyncio
+async def test_cache_is_kept_per_installation(
+    mock_requests: respx.MockRouter, tmp_path: Path
+) -> None:
+    sha = "3a0f86fb8db8eea7ccbb9a95f325ddbedfb25e15"
+    mock_requests.post("/app/installations/7/access_tokens").mock(
+        side_effect=[minted("ghs_seven", 3600), minted("ghs_seven_again", 3600)]
+    )
+    mock_requests.post("/app/installations/8/access_tokens").mock(
+        return_value=minted("ghs_eight", 3600)
+    )
+
+    def private(request: Request) -> Response:
+        if request.headers["authorization"] == "Bearer ghs_eight":
+            return Response(404, json={"message": "Not Found"})
+        return Response(200, json={"names": ["secret"]})
+
+    topics = mock_requests.get("/repos/LEGO/vault/topics").mock(side_effect=private)
+    blob = mock_requests.get(f"/repos/LEGO/vault/git/blobs/{sha}").mock(
+        return_value=Response(
+            200,
+            json={
+                "sha": sha,
+                "node_id": "B_1",
+                "size": 5,
+                "url": f"https://api.github.com/repos/LEGO/vault/git/blobs/{sha}",
+                "content": "YnJpY2s=",
+                "encoding": "base64",
+            },
+        )
+    )
+    GitHubPortal.use_cache(ResponseCache(ttl=60, immutable=ImmutableStore(tmp_path)))
+    app = GitHubApp(1234, PEM)
+    try:
+        await app.authenticate(7)
+        assert (await GitHubRepositoryPortal.get_repository_topics("LEGO", "vault"))[
+            0
+        ] == 200
+        await GitHubRepositoryPortal.get_blob("LEGO", "vault", sha)
+
+        # A refreshed token still acts as installation 7.
+        await app._mint(7)
+        await GitHubRepositoryPortal.get_repository_topics("LEGO", "vault")
+        await GitHubRepositoryPortal.get_blob("LEGO", "vault", sha)
+        assert topics.call_count == 1 and blob.call_count == 1, "Refreshes keep hits."
+
+        await app.authenticate(8)
+        status, _ = await GitHubRepositoryPortal.get_repository_topics("LEGO", "vault")
+        assert status == 404, "Installation 8 must not see installation 7's answer."
+        await GitHubRepositoryPortal.get_blob("LEGO", "vault", sha)
+        assert blob.call_count == 2, "Stored objects must not cross installations."
+
+        await app.authenticate(7)
+        status, _ = await GitHubRepositoryPortal.get_repository_topics("LEGO", "vault")
+        assert status == 200, "Installation 8's 404 must not reach installation 7."
+        assert topics.call_count == 2, "Installation 7's entry should still be cached."
+    finally:
+        await app.close()
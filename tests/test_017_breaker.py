@@ -0,0 +1,80 @@
+from asyncio import sleep
+from typing import no_type_check
+
+import respx
+from httpx import ConnectTimeout, Response
+from pytest import mark
+
+from asyncPyGithub import (
+    CircuitBreaker,
+    ErrorMessage,
+    GitHubPortal,
+    GitHubRepositoryPortal,
+    ResponseCache,
+)
+from asyncPyGithub.breaker import endpoint_family
+from asyncPyGithub.cache import cache_key
+
+REPO = "/repos/LEGO/lego"
+
+
+def test_endpoint_families() -> None:
+    assert endpoint_family("repos/LEGO/lego/contents/a/b.md") == "/repos/*/*/contents"
+    assert endpoint_family("/orgs/LEGO/repos?page=2") == "/orgs/*/repos"
+    assert endpoint_family("users/octocat") == "/users/*"
+    assert endpoint_family("search/repositories?q=lego") == "/search/repositories"
+
+
+@no_type_check
+@mark.asyncio
+async def test_breaker_fails_fast_and_recovers(mock_requests: respx.MockRouter) -> None:
+    GitHubPortal.use_token("mock_token")
+    breaker = GitHubPortal.use_breaker(
+        CircuitBreaker(failure_threshold=2, reset_timeout=0.1)
+    )
+    tags = mock_requests.get(f"{REPO}/tags").mock(
+        side_effect=[Response(502), Response(502), Response(200, json=[])]
+    )
+    topics = mock_requests.get(f"{REPO}/topics").mock(
+        return_value=Response(200, json={"names": []})
+    )
+
+    for _ in range(4):
+        status, _ = await GitHubRepositoryPortal.list_repository_tags("LEGO", "lego")
+    assert tags.call_count == 2, "Requests to an open circuit should not be sent."
+    assert status == 503, f"Expected a fast 503, got {status}"
+    assert breaker.state("/repos/*/*/tags") == "open", "The circuit should be open."
+
+    status, _ = await GitHubRepositoryPortal.get_repository_topics("LEGO", "lego")
+    assert status == 200 and topics.call_count == 1, "Other families are unaffected."
+
+    await sleep(0.15)
+    status, _ = await GitHubRepositoryPortal.list_repository_tags("LEGO", "lego")
+    assert status == 200 and tags.call_count == 3, "A probe should be let through."
+    assert breaker.state("/repos/*/*/tags") == "closed", "A good probe closes it."
+
+
+@no_type_check
+@mark.asyncio
+async def test_open_breaker_falls_back_to_cache(
+    mock_requests: respx.MockRouter,
+) -> None:
+    GitHubPortal.use_token("mock_token")
+    cache = GitHubPortal.use_cache(ResponseCache(ttl=60))
+    GitHubPortal.use_breaker(CircuitBreaker(failure_threshold=1, fallback=True))
+    route = mock_requests.get(f"{REPO}/topics").mock(
+        side_effect=[
+            Response(200, json={"names": ["lego"]}, headers={"etag": '"v1"'}),
+            ConnectTimeout("timed out"),
+        ]
+    )
+    await GitHubRepositoryPortal.get_repository_topics("LEGO", "lego")
+    cache.get(cache_key(f"{REPO}/topics"), GitHubPortal._principal).stored -= 120
+
+    status, error = await GitHubRepositoryPortal.get_repository_topics("LEGO", "lego")
+    assert isinstance(error, ErrorMessage), "The timeout should surface as an error."
+
+    status, topics = await GitHubRepositoryPortal.get_repository_topics("LEGO", "lego")
+    assert status == 200, f"Expected the cached copy, got {status}"
+    assert topics.names == ["lego"], "Unexpected fallback topics."
+    assert route.call_count == 2, "The open circuit should not send the request."
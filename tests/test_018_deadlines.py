@@ -0,0 +1,128 @@
+from asyncio import sleep
+from time import monotonic, time
+from typing import no_type_check
+
+import respx
+from httpx import Request, Response
+from pytest import mark
+
+from asyncPyGithub import (
+    ErrorMessage,
+    GitHubPortal,
+    GitHubRepositoryPortal,
+    GitHubSearchPortal,
+)
+from asyncPyGithub.scheduling import RateLimitState
+
+TAGS = "/repos/LEGO/lego/tags"
+
+
+def tag(n: int) -> dict[str, object]:
+    return {
+        "name": f"v{n}",
+        "commit": {"sha": f"{n:040x}", "url": "https://api.github.com/c"},
+        "zipball_url": "https://api.github.com/z",
+        "tarball_url": "https://api.github.com/t",
+        "node_id": f"T{n}",
+    }
+
+
+async def slow_page(request: Request) -> Response:
+    await sleep(0.2)
+    page = int(request.url.params["page"])
+    return Response(200, json=[tag(page * 2), tag(page * 2 + 1)])
+
+
+@no_type_check
+@mark.asyncio
+async def test_deadline_bounds_a_crawl(mock_requests: respx.MockRouter) -> None:
+    GitHubPortal.use_token("mock_token")
+    mock_requests.get(TAGS).mock(side_effect=slow_page)
+
+    began = monotonic()
+    tags = []
+    with GitHubPortal.deadline(0.5):
+        async for item in GitHubRepositoryPortal.paginate(
+            GitHubRepositoryPortal.list_repository_tags, "LEGO", "lego", per_page=2
+        ):
+            tags.append(item.name)
+    elapsed = monotonic() - began
+
+    assert elapsed < 0.6, f"The crawl should stop at the deadline, took {elapsed:.2f}s"
+    assert tags == ["v2", "v3", "v4", "v5"], f"Expected two pages, got {tags}"
+
+    status, error = await GitHubRepositoryPortal.list_repository_tags("LEGO", "lego")
+    assert status == 200, "The deadline should not outlive its block."
+
+
+@no_type_check
+@mark.asyncio
+async def test_waits_past_the_deadline_fail_fast(
+    mock_requests: respx.MockRouter,
+) -> None:
+    GitHubPortal.use_token("mock_token")
+    GitHubPortal._scheduler.rate_limits["core"] = RateLimitState(
+        limit=5000, remaining=0, reset=time() + 600
+    )
+
+    began = monotonic()
+    with GitHubPortal.deadline(2.0):
+        status, error = await GitHubRepositoryPortal.list_repository_tags(
+            "LEGO", "lego"
+        )
+    assert status == 504, f"Expected status 504, got {status}"
+    assert isinstance(error, ErrorMessage), "Expected an ErrorMessage."
+    assert (
+        monotonic() - began < 0.1
+    ), "A reset after the deadline is not worth waiting for."
+    assert not mock_requests.calls, "The request should not be sent."
+
+
+@no_type_check
+@mark.asyncio
+async def test_per_method_timeout(mock_requests: respx.MockRouter) -> None:
+    GitHubPortal.use_token("mock_token")
+    mock_requests.get(TAGS).mock(side_effect=slow_page)
+    GitHubPortal.set_timeout("list_repository_tags", 0.1)
+
+    status, error = await GitHubRepositoryPortal.list_repository_tags("LEGO", "lego")
+    assert status == 504, f"Expected status 504, got {status}"
+    assert "Deadline exceeded" in error.message, f"Unexpected message {error.message}"
+
+    GitHubPortal.set_timeout("list_repository_tags", None)
+    status, tags = await GitHubRepositoryPortal.list_repository_tags("LEGO", "lego")
+    assert status == 200 and len(tags) == 2, "Removing the timeout should lift it."
+
+
+@no_type_check
+@mark.asyncio
+async def test_per_method_timeout_bounds_each_streamed_item(
+    mock_requests: respx.MockRouter,
+) -> None:
+    GitHubPortal.use_token("mock_token")
+
+    async def search_page(request: Request) -> Response:
+        page = int(request.url.params["page"])
+        await sleep(0.0 if page == 1 else 0.2)
+        return Response(
+            200,
+            json={
+                "total_count": 4,
+                "incomplete_results": False,
+                "items": [
+                    {"html_url": f"https://github.com/lego/{page}-{n}"} for n in (0, 1)
+                ],
+            },
+            headers={"x-ratelimit-resource": "search"},
+        )
+
+    mock_requests.get("/search/repositories").mock(side_effect=search_page)
+    GitHubPortal.set_timeout("search_repositories", 0.1)
+
+    seen = []
+    async for repo in GitHubSearchPortal.search_repositories(
+        "topic:lego", per_page=2, mode="dict"
+    ):
+        seen.append(repo["html_url"])
+        await sleep(0.15)
+    assert len(seen) == 2, f"The slow second page should time out: {seen}"
@@ -0,0 +1,91 @@
+from asyncio import CancelledError, create_task, sleep
+from collections.abc import Awaitable, Callable
+from time import monotonic
+from typing import no_type_check
+
+import respx
+from httpx import Request, Response
+from pytest import mark
+
+from asyncPyGithub import GitHubPortal, Hedger
+from asyncPyGithub.scheduling import RequestScheduler
+
+
+def stalling_server(
+    stall: float,
+) -> tuple[list[str], Callable[[Request], Awaitable[Response]]]:
+    """
+    Answers at once, except the 21st request, which stalls for `stall` seconds.
+    """
+    log: list[str] = []
+
+    async def server(request: Request) -> Response:
+        log.append("sent")
+        if len(log) == 21:
+            try:
+                await sleep(stall)
+            except CancelledError:
+                log.append("cancelled")
+                raise
+        return Response(200, text="Design for failure.")
+
+    return log, server
+
+
+@no_type_check
+@mark.asyncio
+async def test_slow_get_is_hedged(mock_requests: respx.MockRouter) -> None:
+    hedger = GitHubPortal.use_hedging(Hedger(budget=1.0, minimum_delay=0.05))
+    log, server = stalling_server(5.0)
+    mock_requests.get("/zen").mock(side_effect=server)
+
+    for _ in range(20):
+        await GitHubPortal.req("GET", "/zen")
+    assert hedger.hedged == 0, "Fast requests should not be hedged."
+
+    began = monotonic()
+    res = await GitHubPortal.req("GET", "/zen")
+    assert res.status_code == 200, f"Expected status 200, got {res.status_code}"
+    assert monotonic() - began < 1.0, "The hedge should answer before the stall ends."
+    assert hedger.hedged == 1 and hedger.won == 1, "Expected one winning hedge."
+    assert "cancelled" in log, "The stalled attempt should be cancelled."
+    assert GitHubPortal._scheduler.in_use == 0, "Both slots should be released."
+
+
+@no_type_check
+@mark.asyncio
+async def test_hedge_budget_is_capped(mock_requests: respx.MockRouter) -> None:
+    hedger = GitHubPortal.use_hedging(Hedger(budget=0.01, minimum_delay=0.05))
+    log, server = stalling_server(0.3)
+    mock_requests.route(path="/zen").mock(side_effect=server)
+
+    for _ in range(21):
+        await GitHubPortal.req("GET", "/zen")
+    assert hedger.hedged == 0, "21 requests do not earn a hedge at a 1% budget."
+    assert len(log) == 21, "No duplicate should be sent."
+
+    status = (await GitHubPortal.req("POST", "/zen")).status_code
+    assert status == 200 and hedger.requests == 21, "Only GETs are hedged."
+
+
+@no_type_check
+@mark.asyncio
+async def test_queued_get_is_not_hedged(mock_requests: respx.MockRouter) -> None:
+    GitHubPortal._scheduler = RequestScheduler(capacity=1, reserved=0.0)
+    hedger = GitHubPortal.use_hedging(Hedger(budget=1.0, minimum_delay=0.05))
+    log, server = stalling_server(0.0)
+    mock_requests.get("/zen").mock(side_effect=server)
+    for _ in range(20):
+        await GitHubPortal.req("GET", "/zen")
+
+    async def hold() -> None:
+        async with GitHubPortal._scheduler.slot():
+            await sleep(0.3)
+
+    holder = create_task(hold())
+    await sleep(0)
+    res = await GitHubPortal.req("GET", "/zen")
+    await holder
+    assert res.status_code == 200, f"Expected status 200, got {res.status_code}"
+    assert hedger.hedged == 0 and len(log) == 21, "Queued requests are not late."
+    assert max(hedger._latencies) < 0.2, "Time in the queue is not latency."
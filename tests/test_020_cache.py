@@ -0,0 +1,268 @@
+import sqlite3
+from asyncio import gather, sleep
+from pathlib import Path
+from time import perf_counter
+from typing import no_type_check
+
+import respx
+from httpx import Response
+from pytest import mark
+
+from asyncPyGithub import (
+    GitHubPortal,
+    GitHubRepositoryPortal,
+    GitHubUserPortal,
+    ImmutableStore,
+    ResponseCache,
+    SharedCache,
+)
+from asyncPyGithub.cache import cache_key, immutable
+
+NOT_FOUND = {"message": "Not Found", "status": "404"}
+TOPICS = "/repos/LEGO/lego/topics"
+
+
+@no_type_check
+@mark.asyncio
+async def test_not_found_is_cached(mock_requests: respx.MockRouter) -> None:
+    GitHubPortal.use_token("mock_token")
+    cache = GitHubPortal.use_cache(ResponseCache(negative_ttl=300))
+    route = mock_requests.get("/users/ghost").mock(
+        return_value=Response(404, json=NOT_FOUND)
+    )
+
+    status, error = await GitHubUserPortal.get_by_username("ghost")
+    assert status == 404 and error.message == "Not Found", "Expected the 404."
+
+    began = perf_counter()
+    for _ in range(100):
+        status, error = await GitHubUserPortal.get_by_username("Ghost")
+        assert status == 404, f"Expected status 404, got {status}"
+    per_call = (perf_counter() - began) / 100
+    assert route.call_count == 1, "Repeat misses should be answered from the cache."
+    assert per_call < 0.005, f"Cached misses should be fast, took {per_call:.6f}s"
+
+    assert cache.invalidate("users/ghost") == 1, "The miss should be invalidated."
+    await GitHubUserPortal.get_by_username("ghost")
+    assert route.call_count == 2, "An invalidated miss should be asked again."
+
+
+@no_type_check
+@mark.asyncio
+async def test_not_found_cache_is_bounded(mock_requests: respx.MockRouter) -> None:
+    GitHubPortal.use_token("mock_token")
+    cache = GitHubPortal.use_cache(ResponseCache(negative_ttl=60, negative_size=2))
+    routes = {
+        name: mock_requests.get(f"/users/{name}").mock(
+            return_value=Response(404, json=NOT_FOUND)
+        )
+        for name in ("a", "b", "c")
+    }
+
+    for name in ("a", "b", "a", "c"):
+        await GitHubUserPortal.get_by_username(name)
+    who = GitHubPortal._principal
+    assert cache.get(cache_key("users/a"), who), "Recently used misses should be kept."
+    assert not cache.get(cache_key("users/b"), who), "The oldest should go."
+
+    cache.get(cache_key("users/a"), who).stored -= 120
+    await GitHubUserPortal.get_by_username("a")
+    assert routes["a"].call_count == 2, "Expired misses should be asked again."
+    assert routes["c"].call_count == 1, "Fresh misses should not be."
+
+
+@no_type_check
+@mark.asyncio
+async def test_stale_entries_are_served_while_revalidating(
+    mock_requests: respx.MockRouter,
+) -> None:
+    GitHubPortal.use_token("mock_token")
+    cache = GitHubPortal.use_cache(ResponseCache(ttl=60, stale_while_revalidate=600))
+
+    async def slow_update(request: object) -> Response:
+        await sleep(0.05)
+        return Response(
+            200, json={"names": ["lego", "bricks"]}, headers={"etag": '"v2"'}
+        )
+
+    route = mock_requests.get(TOPICS).mock(
+        side_effect=[
+            Response(200, json={"names": ["lego"]}, headers={"etag": '"v1"'}),
+            slow_update,
+            Response(304),
+        ]
+    )
+    await GitHubRepositoryPortal.get_repository_topics("LEGO", "lego")
+    cache.get(cache_key(TOPICS), GitHubPortal._principal).stored -= 120
+
+    reads = await gather(
+        *(
+            GitHubRepositoryPortal.get_repository_topics("LEGO", "lego")
+            for _ in range(5)
+        )
+    )
+    assert all(topics.names == ["lego"] for _, topics in reads), "Serve stale at once."
+    await cache.join()
+    assert route.call_count == 2, "Concurrent stale reads should share one refresh."
+    assert route.calls[1].request.headers["if-none-match"] == '"v1"', "Not conditional."
+
+    status, topics = await GitHubRepositoryPortal.get_repository_topics("LEGO", "lego")
+    assert topics.names == ["lego", "bricks"], "The refresh should update the entry."
+    assert route.call_count == 2, "A refreshed entry is fresh."
+
+    cache.get(cache_key(TOPICS), GitHubPortal._principal).stored -= 1000
+    status, topics = await GitHubRepositoryPortal.get_repository_topics("LEGO", "lego")
+    assert route.call_count == 3, "Past the window, reads wait for revalidation."
+    assert topics.names == ["lego", "bricks"], "The 304 should replay the entry."
+
+
+@no_type_check
+def test_entries_are_bounded() -> None:
+    cache = ResponseCache(ttl=60, size=2)
+    for name in ("a", "b"):
+        cache.store(f"users/{name}", Response(200, json={"login": name}))
+    cache.get("users/a")
+    cache.store("users/c", Response(200, json={"login": "c"}))
+    assert len(cache) == 2, f"Expected 2 entries, kept {len(cache)}"
+    assert "users/a" in cache, "Recently used entries should be kept."
+    assert "users/b" not in cache, "The least recently used entry should be dropped."
+
+
+SHA = "3a0f86fb8db8eea7ccbb9a95f325ddbedfb25e15"
+
+
+@no_type_check
+@mark.asyncio
+async def test_immutable_objects_are_kept_on_disk(
+    mock_requests: respx.MockRouter, tmp_path: Path
+) -> None:
+    assert immutable(cache_key(f"repos/LEGO/lego/git/blobs/{SHA}")), "Blob by SHA."
+    assert immutable(cache_key("repos/LEGO/lego/contents/a.py", {"ref": SHA}))
+    assert not immutable(cache_key("repos/LEGO/lego/contents/a.py", {"ref": "main"}))
+    assert not immutable(cache_key("repos/LEGO/lego/git/trees/main")), "Branches move."
+
+    GitHubPortal.use_token("mock_token")
+    store = ImmutableStore(tmp_path)
+    GitHubPortal.use_cache(ResponseCache(ttl=0, immutable=store))
+    route = mock_requests.get(f"/repos/LEGO/lego/git/blobs/{SHA}").mock(
+        return_value=Response(
+            200,
+            json={
+                "sha": SHA,
+                "node_id": "B_1",
+                "size": 5,
+                "url": f"https://api.github.com/repos/LEGO/lego/git/blobs/{SHA}",
+                "content": "YnJpY2s=",
+                "encoding": "base64",
+            },
+            headers={"etag": '"blob"', "x-ratelimit-remaining": "4999"},
+        )
+    )
+
+    status, blob = await GitHubRepositoryPortal.get_blob("LEGO", "lego", SHA)
+    assert status == 200 and blob.content == "YnJpY2s=", "Expected the blob."
+    assert len(list(tmp_path.glob("??/*"))) == 1, "The blob should be on disk."
+
+    # A new cache over the same directory, as in a new process, needs no request either.
+    GitHubPortal.use_cache(ResponseCache(ttl=0, immutable=ImmutableStore(tmp_path)))
+    for _ in range(3):
+        status, blob = await GitHubRepositoryPortal.get_blob("lego", "LEGO", SHA)
+        assert status == 200 and blob.sha == SHA, "Expected the stored blob."
+    assert route.call_count == 1, "Immutable objects are never revalidated."
+
+    GitHubPortal.cache().invalidate("repos/LEGO/lego")
+    await GitHubRepositoryPortal.get_blob("LEGO", "lego", SHA)
+    assert route.call_count == 1, "Writes to the repository cannot change a blob."
+
+    # Another token may not be allowed to read the repository, so it asks GitHub itself.
+    GitHubPortal.use_token("other_token")
+    GitHubPortal.use_cache(ResponseCache(ttl=0, immutable=ImmutableStore(tmp_path)))
+    await GitHubRepositoryPortal.get_blob("LEGO", "lego", SHA)
+    assert route.call_count == 2, "Stored objects must not cross tokens."
+    assert store.clear() == 2, "Clearing should delete both copies."
+
+
+@no_type_check
+@mark.asyncio
+async def test_shared_cache_spans_workers(
+    mock_requests: respx.MockRouter, tmp_path: Path
+) -> None:
+    GitHubPortal.use_token("mock_token")
+    database = tmp_path / "responses.sqlite3"
+    route = mock_requests.get(TOPICS).mock(
+        side_effect=[
+            Response(200, json={"names": ["lego"]}, headers={"etag": '"v1"'}),
+            Response(304),
+        ]
+    )
+
+    # Two caches on one database stand in for two worker processes.
+    first, second = SharedCache(database, ttl=60), SharedCache(database, ttl=60)
+    GitHubPortal.use_cache(first)
+    await GitHubRepositoryPortal.get_repository_topics("LEGO", "lego")
+    await first.join()
+    GitHubPortal.use_cache(second)
+    status, topics = await GitHubRepositoryPortal.get_repository_topics("LEGO", "lego")
+    assert topics.names == ["lego"] and route.call_count == 1, "Hits should be shared."
+
+    with sqlite3.connect(database) as db:
+        db.execute("UPDATE responses SET stored = stored - 120")
+    await GitHubRepositoryPortal.get_repository_topics("LEGO", "lego")
+    await second.join()
+    assert route.calls[1].request.headers["if-none-match"] == '"v1"', "Not conditional."
+    assert first.get(
+        cache_key(TOPICS), GitHubPortal._principal
+    ).fresh, "The 304 should refresh every worker."
+
+    assert first.invalidate("repos/LEGO/lego") == 1, "The entry should be dropped."
+    await first.join()
+    assert not second.get(
+        cache_key(TOPICS), GitHubPortal._principal
+    ), "Invalidation should be shared."
+    first.close()
+    second.close()
+
+
+@no_type_check
+def test_shared_cache_is_bounded(tmp_path: Path) -> None:
+    cache = SharedCache(tmp_path / "responses.sqlite3", max_bytes=10_000)
+    for n in range(20):
+        cache.store(f"users/u{n}", Response(200, content=b"x" * 1000))
+    cache.flush()
+    assert 0 < len(cache) <= 9, f"Expected at most 9 entries, kept {len(cache)}"
+    assert "users/u19" in cache, "The newest entries should be kept."
+    assert "users/u0" not in cache, "The oldest entries should be dropped."
+    cache.close()
+
+
+@no_type_check
+@mark.asyncio
+async def test_shared_cache_never_blocks_the_loop(tmp_path: Path) -> None:
+    database = tmp_path / "responses.sqlite3"
+    cache = SharedCache(database, busy_timeout=5.0)
+    cache.store("users/a", Response(200, json={"login": "a"}))
+    await cache.join()
+
+    # Another process holds the write lock.
+    other = sqlite3.connect(database, isolation_level=None)
+    other.execute("BEGIN IMMEDIATE")
+    began = perf_counter()
+    cache.store("users/b", Response(200, json={"login": "b"}))
+    assert cache.invalidate("users/a") == 1, "The written entry should be dropped."
+    assert perf_counter() - began < 0.1, "Writes should wait off the event loop."
+    assert "users/b" in cache and "users/a" not in cache, "Read your own writes."
+
+    await sleep(0.2)
+    other.execute("COMMIT")
+    other.close()
+    await cache.join()
+    with sqlite3.connect(database) as db:
+        keys = [key for (key,) in db.execute("SELECT key FROM responses")]
+    assert keys == ["users/b"], f"Queued writes should land in order: {keys}"
+    cache.close()
+
+    # A database that cannot be opened is skipped, not failed on.
+    broken = SharedCache(tmp_path)
+    assert len(broken) == 0 and broken.get("users/b") is None
+    broken.clear()
+    broken.close()